@@ -2,14 +2,14 @@
 
 from abc import ABC, abstractmethod
 from campaign_app.logging import LoggingService
-from campaign_app.settings import Settings
+from campaign_app.settings import SettingsRegistry
 
 class ApplicationBase(ABC):
     """Implements ApplicationBase class."""
     
     def __init__(self, subclass_name:str, logfile_prefix_name:str)->None:
         """Instantiate instance."""
-        self._settings = Settings().read_settings_file_from_location()
+        self._settings = SettingsRegistry.get()
         self._logger = LoggingService(subclass_name, logfile_prefix_name)
         self._date_format_string = '%Y-%m-%d %H:%M:%S'
         
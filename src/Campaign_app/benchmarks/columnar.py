@@ -0,0 +1,117 @@
+"""Times campaign reporting over Campaign objects against CampaignTable
+columns: building each from its query's rows (SELECT_ALL_CAMPAIGNS for
+objects, SELECT_CAMPAIGN_COLUMNS for the table), the Budget, Revenue and
+NetProfit totals, and Revenue per company. The table is also built from
+SELECT_ALL_CAMPAIGNS rows, converting dates and Decimals in Python.
+
+Run from src/:
+    python -m campaign_app.benchmarks.columnar -n 1000000 --output columnar.json
+
+No database is needed; rows are generated in memory as in the hydration
+benchmark. The numpy variant runs only when NumPy is installed.
+"""
+
+import gc
+import json
+import sys
+import time
+from argparse import ArgumentParser
+from statistics import median
+
+from campaign_app.benchmarks.hydration import campaign_rows
+from campaign_app.infrastructure_layer import campaign_table
+from campaign_app.infrastructure_layer.campaign_table import (CampaignTable, _cents,
+    _ordinals)
+from campaign_app.persistence_layer.row_factory import hydrate_campaigns
+
+
+def object_totals(campaigns:list) -> dict:
+    """Attribute-by-attribute sums, as reports did over Campaign objects"""
+    totals = {'Budget': 0, 'Revenue': 0, 'NetProfit': 0}
+    for campaign in campaigns:
+        totals['Budget'] += campaign.Budget
+        totals['Revenue'] += campaign.Revenue
+        totals['NetProfit'] += campaign.NetProfit
+    return totals
+
+
+def object_revenue_by_company(campaigns:list) -> dict:
+    sums = {}
+    for campaign in campaigns:
+        sums[campaign.idCompany] = sums.get(campaign.idCompany, 0) + campaign.Revenue
+    return sums
+
+
+def scaled_rows(rows:list) -> list:
+    """The rows as SELECT_CAMPAIGN_COLUMNS returns them"""
+    (ids, names, starts, ends, companies, categories,
+     budgets, revenues, profits) = zip(*rows)
+    return list(zip(ids, names, _ordinals(starts), _ordinals(ends), companies,
+                    categories, _cents(budgets), _cents(revenues), _cents(profits)))
+
+
+def timed(func, arg, repeat:int) -> float:
+    """Returns the median seconds of func(arg) over repeat runs"""
+    samples = []
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        result = func(arg)
+        samples.append(time.perf_counter() - started)
+        del result
+    return round(median(samples), 4)
+
+
+def measure(build, totals, by_company, rows, repeat:int) -> dict:
+    data = build(rows)
+    return {'build_seconds': timed(build, rows, repeat),
+            'totals_seconds': timed(totals, data, repeat),
+            'by_company_seconds': timed(by_company, data, repeat)}
+
+
+def main():
+    parser = ArgumentParser(description='Columnar campaign result benchmark.')
+    parser.add_argument('-n', '--rows', type=int, default=1_000_000,
+                        help="Campaign rows per run.")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="Runs per measurement.")
+    parser.add_argument('--output',
+                        help="Report file (default: stdout).")
+    args = parser.parse_args()
+
+    rows = campaign_rows(args.rows)
+    results = {'objects': measure(hydrate_campaigns, object_totals,
+                                  object_revenue_by_company, rows, args.repeat)}
+    backends = ['array'] + (['numpy'] if campaign_table.numpy is not None else [])
+    scaled = scaled_rows(rows)
+    for backend in backends:
+        results[backend] = measure(
+            lambda rows, b=backend: CampaignTable.from_scaled_rows(rows, b),
+            CampaignTable.totals,
+            lambda table: table.sums_by('idCompany', 'Revenue_cents'),
+            scaled, args.repeat)
+        results[backend]['build_from_typed_rows_seconds'] = timed(
+            lambda rows, b=backend: CampaignTable.from_rows(rows, b), rows, args.repeat)
+
+    baseline = results['objects']
+    for stats in results.values():
+        for phase in ('totals', 'by_company'):
+            stats[f"{phase}_speedup"] = round(
+                baseline[f"{phase}_seconds"] / stats[f"{phase}_seconds"], 2)
+
+    report = {
+        'rows': args.rows,
+        'repeat': args.repeat,
+        'python': sys.version.split()[0],
+        'results': results
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
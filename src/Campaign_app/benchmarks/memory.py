@@ -0,0 +1,158 @@
+"""Measures the memory held per domain object, slotted against the
+__dict__-backed layout the classes used before, and for hydrated channel
+and campaign listings.
+
+Run from src/:
+    python -m campaign_app.benchmarks.memory -n 100000 --output memory.json
+
+No database is needed; objects are built in memory and sized with
+tracemalloc.
+"""
+
+import gc
+import json
+import sys
+import tracemalloc
+from argparse import ArgumentParser
+
+from campaign_app.infrastructure_layer.campaign import Campaign
+from campaign_app.infrastructure_layer.campaign_category import Campaign_Category
+from campaign_app.infrastructure_layer.channel import Channel
+from campaign_app.infrastructure_layer.channel_category import Channel_Category
+from campaign_app.infrastructure_layer.company import Company
+
+
+CATEGORY_COUNT = 8
+CHANNELS_PER_CAMPAIGN = 3
+
+
+def dict_backed(cls):
+    """Returns a plain class running cls.__init__, so the same attributes
+    live in a per-instance __dict__ as they did before __slots__
+    """
+    return type(f"{cls.__name__}Dict", (), {'__init__': cls.__init__})
+
+
+def bytes_per_object(build, count:int) -> float:
+    """Returns the traced bytes per object built by build(i), excluding the
+    list holding them
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        objects = [build(i) for i in range(count)]
+        held = tracemalloc.get_traced_memory()[0] - before - sys.getsizeof(objects)
+    finally:
+        tracemalloc.stop()
+    del objects
+    return round(held / count, 1)
+
+
+def compare(slotted, legacy, count:int) -> dict:
+    new = bytes_per_object(slotted, count)
+    old = bytes_per_object(legacy, count)
+    return {'dict_bytes': old, 'slotted_bytes': new,
+            'saving_bytes': round(old - new, 1),
+            'saving_pct': round(100 * (old - new) / old, 1) if old else None}
+
+
+def class_sizes(count:int) -> dict:
+    """Bare constructed objects of each domain class"""
+    results = {}
+    for cls in (Campaign, Channel, Company, Campaign_Category, Channel_Category):
+        legacy = dict_backed(cls)
+        results[cls.__name__] = compare(lambda i: cls(), lambda i: legacy(), count)
+    return results
+
+
+def channel_listing(count:int) -> dict:
+    """Channels with their category as _attach_categories_to_channels builds
+    them: before, a list per channel around a category shared within the
+    call; now, one interned (category,) tuple per category
+    """
+    ChannelDict = dict_backed(Channel)
+    CategoryDict = dict_backed(Channel_Category)
+    old_categories = []
+    for c in range(CATEGORY_COUNT):
+        category = CategoryDict()
+        category.idChannel_Category = c
+        category.Channel_CategoryName = f"Category {c}"
+        old_categories.append(category)
+    shared = [(Channel_Category.interned(c, f"Category {c}"),) for c in range(CATEGORY_COUNT)]
+
+    def legacy(i):
+        channel = ChannelDict()
+        channel.idChannel = i
+        channel.idChannel_Category = i % CATEGORY_COUNT
+        channel.CategoryName = [old_categories[i % CATEGORY_COUNT]]
+        return channel
+
+    def slotted(i):
+        channel = Channel()
+        channel.idChannel = i
+        channel.idChannel_Category = i % CATEGORY_COUNT
+        channel.CategoryName = shared[i % CATEGORY_COUNT]
+        return channel
+
+    return compare(slotted, legacy, count)
+
+
+def campaign_listing(count:int) -> dict:
+    """Campaigns each holding CHANNELS_PER_CAMPAIGN channels, as
+    get_all_campaigns returns them; bytes are per campaign
+    """
+    CampaignDict = dict_backed(Campaign)
+    ChannelDict = dict_backed(Channel)
+
+    def legacy_channel(i):
+        channel = ChannelDict()
+        channel.idChannel = i
+        channel.CategoryName = []
+        return channel
+
+    def legacy(i):
+        campaign = CampaignDict()
+        campaign.idCampaign = i
+        campaign.channel = [legacy_channel(j) for j in range(CHANNELS_PER_CAMPAIGN)]
+        return campaign
+
+    def slotted_channel(i):
+        channel = Channel()
+        channel.idChannel = i
+        return channel
+
+    def slotted(i):
+        campaign = Campaign()
+        campaign.idCampaign = i
+        campaign.channel = [slotted_channel(j) for j in range(CHANNELS_PER_CAMPAIGN)]
+        return campaign
+
+    return compare(slotted, legacy, count)
+
+
+def main():
+    parser = ArgumentParser(description='Domain object memory benchmark.')
+    parser.add_argument('-n', '--count', type=int, default=100_000,
+                        help="Objects built per measurement.")
+    parser.add_argument('--output',
+                        help="Report file (default: stdout).")
+    args = parser.parse_args()
+
+    report = {
+        'count': args.count,
+        'python': sys.version.split()[0],
+        'classes': class_sizes(args.count),
+        'channel_listing': channel_listing(args.count),
+        'campaign_listing': campaign_listing(args.count)
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
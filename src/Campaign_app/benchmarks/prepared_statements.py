@@ -0,0 +1,73 @@
+"""Benchmarks repeated point lookups and inserts with and without the
+database.prepared_statements mode.
+
+Run from src/:
+    python -m campaign_app.benchmarks.prepared_statements -c ../config/Campaign_Channel_app_config.json
+
+Inserts run inside a transaction that is rolled back, so the database is
+left unchanged.
+"""
+
+import copy
+import json
+import time
+from argparse import ArgumentParser
+
+from campaign_app.persistence_layer.mysql_persistence_wrapper import MySQLPersistenceWrapper
+from campaign_app.infrastructure_layer.campaign import Campaign
+from campaign_app.benchmarks.timing import time_calls
+
+
+def run_mode(config:dict, prepared:bool, iterations:int) -> dict:
+    """Runs the lookup and insert workloads against one wrapper."""
+    config = copy.deepcopy(config)
+    config["database"]["prepared_statements"] = prepared
+    config["database"]["pool"]["name"] += "_prepared" if prepared else "_plain"
+    db = MySQLPersistenceWrapper(config)
+
+    campaign_ids = [c.idCampaign for c in db.select_all_campaigns() or []]
+    if not campaign_ids:
+        raise SystemExit("No campaigns to look up; load data first.")
+    company_id = db.select_all_companies()[0].idCompany
+    category_id = db.select_all_campaign_categories()[0].idCampaign_Category
+
+    results = {}
+    results['select_campaign_by_id'] = time_calls(
+        lambda i: db.select_campaign_by_id(campaign_ids[i % len(campaign_ids)]), iterations)
+    results['campaign_exists'] = time_calls(
+        lambda i: db.campaign_exists(campaign_ids[i % len(campaign_ids)]), iterations)
+
+    def insert(i):
+        campaign = Campaign()
+        campaign.Campaign_Name = f"bench-{'p' if prepared else 's'}-{time.time_ns()}-{i}"
+        campaign.idCompany = company_id
+        campaign.idCampaign_Category = category_id
+        db.create_campaign(campaign)
+
+    with db.transaction() as unit:
+        results['create_campaign'] = time_calls(insert, iterations)
+        unit.set_rollback_only()
+    return results
+
+
+def main():
+    parser = ArgumentParser(description='Prepared statement latency benchmark.')
+    parser.add_argument('-c', '--configfile', required=True,
+                        help="Configuration file to load.")
+    parser.add_argument('-n', '--iterations', type=int, default=1000,
+                        help="Calls per operation and mode.")
+    args = parser.parse_args()
+
+    with open(args.configfile, 'r') as f:
+        config = json.loads(f.read())
+
+    report = {'plain': run_mode(config, False, args.iterations),
+              'prepared': run_mode(config, True, args.iterations)}
+    report['speedup_p50'] = {
+        op: round(report['plain'][op]['p50_us'] / report['prepared'][op]['p50_us'], 2)
+        for op in report['plain']}
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
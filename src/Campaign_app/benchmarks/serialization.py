@@ -0,0 +1,80 @@
+"""Times DataExporter's NDJSON export of every campaign with each JSON
+backend: json.dumps (the default) and orjson (opt-in, compact output).
+
+Run from src/:
+    python -m campaign_app.benchmarks.serialization -c ../config/Campaign_Channel_app_benchmark_config.json \
+        --scale 100k --output serialization.json
+
+The data set is loaded into an empty database (the benchmark config uses
+an in-memory SQLite database). The orjson variant runs only when orjson
+is installed.
+"""
+
+import json
+import os
+import sys
+import tempfile
+from argparse import ArgumentParser
+from statistics import median
+
+from campaign_app.service_layer.app_services import AppServices
+from campaign_app.service_layer.data_exporter import DataExporter, orjson
+from campaign_app.benchmarks.synthetic_data import (SCALES, SyntheticDataGenerator,
+    SyntheticDataLoader)
+
+
+def time_export(exporter:DataExporter, backend:str, directory:str, repeat:int) -> dict:
+    """Exports the campaigns repeat times and returns the median and best run"""
+    filename = os.path.join(directory, f"campaigns-{backend}.ndjson")
+    runs = [exporter.export('campaigns', filename, 'ndjson', backend) for _ in range(repeat)]
+    seconds = [run['seconds'] for run in runs]
+    return {'rows': runs[0]['rows'],
+            'bytes': os.path.getsize(filename),
+            'median_seconds': round(median(seconds), 4),
+            'best_seconds': round(min(seconds), 4),
+            'rows_per_second': round(runs[0]['rows'] / median(seconds)) if median(seconds) else None}
+
+
+def main():
+    parser = ArgumentParser(description='NDJSON export benchmark.')
+    parser.add_argument('-c', '--configfile', required=True,
+                        help="Configuration file; use an empty database.")
+    parser.add_argument('--scale', choices=list(SCALES), default='100k',
+                        help="Synthetic data set size.")
+    parser.add_argument('--seed', type=int, default=566,
+                        help="Random seed for the data set.")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="Exports per backend.")
+    parser.add_argument('--output',
+                        help="Report file (default: stdout).")
+    args = parser.parse_args()
+
+    with open(args.configfile, 'r') as f:
+        config = json.load(f)
+    app_services = AppServices(config)
+    load = SyntheticDataLoader(app_services, SyntheticDataGenerator(args.scale, args.seed)).load()
+    exporter = DataExporter(config, app_services)
+
+    backends = [b for b in DataExporter.JSON_BACKENDS if b != 'orjson' or orjson is not None]
+    with tempfile.TemporaryDirectory() as directory:
+        results = {backend: time_export(exporter, backend, directory, args.repeat)
+                   for backend in backends}
+    for stats in results.values():
+        stats['speedup'] = round(results['json']['median_seconds'] / stats['median_seconds'], 2)
+
+    report = {'scale': args.scale,
+              'seed': args.seed,
+              'repeat': args.repeat,
+              'python': sys.version.split()[0],
+              'load': load,
+              'export_campaigns': results}
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,334 @@
+"""Times every AppServices operation and the console rendering path on a
+synthetic data set and writes a JSON report that can be diffed between
+releases.
+
+Run from src/:
+    python -m campaign_app.benchmarks.suite -c ../config/Campaign_Channel_app_benchmark_config.json \
+        --scale 100k --output bench_100k.json
+    python -m campaign_app.benchmarks.suite -c ... --scale 100k --baseline bench_100k.json
+
+The data set is loaded into an empty database (the benchmark config uses
+an in-memory SQLite database). Write operations run inside a transaction
+that is rolled back, so repeated runs see the same data. With --baseline
+the run exits with status 1 if any p50 latency regressed by more than
+--threshold.
+"""
+
+import json
+import platform
+import sys
+import time
+from argparse import ArgumentParser
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from campaign_app.service_layer.app_services import AppServices
+from campaign_app.presentation_layer.console_ui import ConsoleUI
+from campaign_app.infrastructure_layer.campaign import Campaign
+from campaign_app.infrastructure_layer.campaign_category import Campaign_Category
+from campaign_app.infrastructure_layer.channel import Channel
+from campaign_app.infrastructure_layer.channel_category import Channel_Category
+from campaign_app.infrastructure_layer.company import Company
+from campaign_app.benchmarks.synthetic_data import (SCALES, SyntheticDataGenerator,
+    SyntheticDataLoader)
+from campaign_app.benchmarks.timing import summarize, time_calls
+
+
+REPORT_VERSION = 1
+
+
+class BenchmarkSuite():
+    """Runs the point, scan, write and render workloads against AppServices."""
+
+    def __init__(self, config:dict, iterations:int=200, scan_repeat:int=3,
+                 walk_pages:int=20, batch_size:int=1000) -> None:
+        """Initializes object. """
+        self.config = config
+        self.iterations = iterations
+        self.scan_repeat = scan_repeat
+        self.walk_pages = walk_pages
+        self.batch_size = batch_size
+        self.app_services = AppServices(config)
+        self.ui = ConsoleUI(config, self.app_services)
+
+    def run(self, scale:str, seed:int) -> dict:
+        """Loads the data set and returns the full report"""
+        generator = SyntheticDataGenerator(scale, seed)
+        load = SyntheticDataLoader(self.app_services, generator).load()
+
+        campaign_ids = [c.idCampaign for c in
+                        self.app_services.get_campaigns_page(page_size=self.iterations).items]
+        self._sample = {
+            'campaign_ids': campaign_ids,
+            'campaign_names': [self.app_services.get_campaign(i).Campaign_Name
+                               for i in campaign_ids[:10]],
+            'channel_ids': [c.idChannel for c in
+                            self.app_services.get_channels_page(page_size=10).items],
+            'company_id': self.app_services.get_all_companies()[0].idCompany,
+            'category_id': self.app_services.get_all_campaign_category()[0].idCampaign_Category,
+            'channel_category_id': \
+                self.app_services.get_all_channel_category()[0].idChannel_Category
+        }
+
+        operations = {}
+        operations.update(self._point_operations())
+        operations.update(self._scan_operations())
+        operations.update(self._analytics_operations())
+        operations.update(self._write_operations())
+        operations.update(self._render_operations())
+
+        return {
+            'report_version': REPORT_VERSION,
+            'meta': {
+                'scale': scale,
+                'seed': seed,
+                'counts': generator.counts(),
+                'backend': self.config["database"].get("backend", "mysql"),
+                'iterations': self.iterations,
+                'scan_repeat': self.scan_repeat,
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'created': datetime.now(timezone.utc).isoformat(timespec='seconds')
+            },
+            'load': load,
+            'operations': operations
+        }
+
+    # Workloads
+    def _point_operations(self) -> dict:
+        s = self._sample
+        ids = s['campaign_ids']
+        names = s['campaign_names']
+        services = self.app_services
+        n = self.iterations
+        return {
+            'get_campaign': time_calls(lambda i: services.get_campaign(ids[i % len(ids)]), n),
+            'campaign_exists': time_calls(
+                lambda i: services.campaign_exists(ids[i % len(ids)]), n),
+            'campaign_name_exists': time_calls(
+                lambda i: services.campaign_name_exists(names[i % len(names)]), n),
+            'get_campaigns_page': time_calls(lambda i: services.get_campaigns_page(), n),
+            'get_channels_page': time_calls(lambda i: services.get_channels_page(), n),
+            'get_companies_page': time_calls(lambda i: services.get_companies_page(), n),
+            'get_all_channel_category': time_calls(
+                lambda i: services.get_all_channel_category(), n),
+            'get_all_campaign_category': time_calls(
+                lambda i: services.get_all_campaign_category(), n),
+            'get_all_companies': time_calls(lambda i: services.get_all_companies(), n),
+            'get_cache_stats': time_calls(lambda i: services.get_cache_stats(), n)
+        }
+
+    def _scan_operations(self) -> dict:
+        services = self.app_services
+        return {
+            'get_all_campaigns': self._time_scan(services.get_all_campaigns),
+            'get_all_channels': self._time_scan(services.get_all_channels),
+            'stream_campaigns_with_channels': self._time_scan(
+                services.stream_campaigns_with_channels),
+            'stream_channels': self._time_scan(services.stream_channels),
+            'stream_companies': self._time_scan(services.stream_companies)
+        }
+
+    def _analytics_operations(self) -> dict:
+        """Times the console analytics reports, loading the campaign
+        columns each run as the menu actions do
+        """
+        analytics = self.ui.analytics
+        operations = {'analytics_summary': self._time_rows(
+            lambda r: analytics.summary()['campaigns'])}
+        for dimension in analytics.DIMENSIONS:
+            operations[f"analytics_rollup_{dimension}"] = self._time_rows(
+                lambda r, d=dimension: len(analytics.rollup(d)))
+        return operations
+
+    def _write_operations(self) -> dict:
+        s = self._sample
+        services = self.app_services
+        n = self.iterations
+        channel_ids = s['channel_ids']
+        results = {}
+        with services.transaction() as unit:
+            campaigns = [self._new_campaign(f"bench-{i}") for i in range(n)]
+            results['create_campaign'] = time_calls(
+                lambda i: services.create_campaign(campaigns[i]), n)
+
+            def update(i):
+                campaigns[i].Revenue += 1
+                services.update_campaign(campaigns[i])
+            results['update_campaign'] = time_calls(update, n)
+            results['link_channels'] = time_calls(
+                lambda i: services.link_channels(campaigns[i].idCampaign, channel_ids[:3]), n)
+            results['replace_channels'] = time_calls(
+                lambda i: services.replace_channels(campaigns[i].idCampaign,
+                                                    channel_ids[2:5]), n)
+            results['unlink_channels'] = time_calls(
+                lambda i: services.unlink_channels(campaigns[i].idCampaign,
+                                                   channel_ids[2:5]), n)
+            results['delete_campaign'] = time_calls(
+                lambda i: services.delete_campaign(campaigns[i].idCampaign), n)
+
+            batches = []
+            def create_batch(r):
+                batches.append(services.create_campaigns(
+                    [self._new_campaign(f"bench-batch-{r}-{i}")
+                     for i in range(self.batch_size)]).inserted)
+                return len(batches[-1])
+            results['create_campaigns'] = self._time_rows(create_batch)
+            results['create_campaign_channel_links'] = self._time_rows(lambda r:
+                services.create_campaign_channel_links(
+                    [(c.idCampaign, channel_ids[0]) for c in batches[r]]))
+
+            results['create_channel'] = time_calls(lambda i: services.create_channel(
+                self._new_channel(f"bench-{i}")), n)
+            results['create_company'] = time_calls(lambda i: services.create_company(
+                self._new_company(f"bench-{i}")), n)
+            results['create_campaign_category'] = time_calls(
+                lambda i: services.create_campaign_category(
+                    self._new_campaign_category(f"bench-{i}")), n)
+            results['create_channel_category'] = time_calls(
+                lambda i: services.create_channel_category(
+                    self._new_channel_category(f"bench-{i}")), n)
+            unit.set_rollback_only()
+        return results
+
+    def _render_operations(self) -> dict:
+        """Times building and formatting the console tables"""
+        services = self.app_services
+        ui = self.ui
+        n = max(1, self.iterations // 10)
+        campaigns = services.get_campaigns_page().items
+        channels = services.get_channels_page().items
+        companies = services.get_companies_page().items
+        return {
+            'render_campaign_table': time_calls(
+                lambda i: ui._build_campaign_table(campaigns).get_string(), n),
+            'render_channel_table': time_calls(
+                lambda i: ui._build_channel_table(channels).get_string(), n),
+            'render_company_table': time_calls(
+                lambda i: ui._build_company_table(companies).get_string(), n),
+            'list_campaigns_walk': self._time_rows(self._walk_campaign_pages)
+        }
+
+    # Helpers
+    def _walk_campaign_pages(self, repeat:int) -> int:
+        """Fetches and renders walk_pages pages the way list_campaigns does"""
+        cursor = None
+        rows = 0
+        for _ in range(self.walk_pages):
+            page = self.app_services.get_campaigns_page(cursor)
+            self.ui._build_campaign_table(page.items).get_string()
+            rows += len(page.items)
+            if not page.has_next():
+                break
+            cursor = page.next_cursor
+        return rows
+
+    def _time_scan(self, func) -> dict:
+        """Times a full read, consuming generators, and records its rows"""
+        return self._time_rows(lambda r: sum(1 for _ in func()))
+
+    def _time_rows(self, func) -> dict:
+        """Times func(repeat) scan_repeat times; func returns rows handled"""
+        samples = []
+        rows = 0
+        for r in range(self.scan_repeat):
+            started = time.perf_counter()
+            rows = func(r)
+            samples.append((time.perf_counter() - started) * 1_000_000)
+        result = summarize(samples)
+        result['rows'] = rows
+        result['rows_per_second'] = round(rows / (result['p50_us'] / 1_000_000), 1) \
+            if rows and result['p50_us'] else None
+        return result
+
+    def _new_campaign(self, name:str) -> Campaign:
+        campaign = Campaign()
+        campaign.Campaign_Name = name
+        campaign.idCompany = self._sample['company_id']
+        campaign.idCampaign_Category = self._sample['category_id']
+        campaign.Budget = Decimal('1000.00')
+        campaign.Revenue = Decimal('2500.00')
+        return campaign
+
+    def _new_channel(self, name:str) -> Channel:
+        channel = Channel()
+        channel.ChannelName = name
+        channel.idChannel_Category = self._sample['channel_category_id']
+        return channel
+
+    def _new_company(self, name:str) -> Company:
+        company = Company()
+        company.CompanyName = name
+        return company
+
+    def _new_campaign_category(self, name:str) -> Campaign_Category:
+        category = Campaign_Category()
+        category.Campaign_CategoryName = name
+        return category
+
+    def _new_channel_category(self, name:str) -> Channel_Category:
+        category = Channel_Category()
+        category.Channel_CategoryName = name
+        return category
+
+
+def compare_reports(baseline:dict, current:dict, threshold:float=0.2) -> list:
+    """Returns (operation, baseline p50, current p50, ratio) for every
+    operation whose p50 grew by more than threshold
+    """
+    regressions = []
+    for name, stats in current['operations'].items():
+        before = baseline.get('operations', {}).get(name)
+        if not before or not before.get('p50_us') or not stats.get('p50_us'):
+            continue
+        ratio = stats['p50_us'] / before['p50_us']
+        if ratio > 1 + threshold:
+            regressions.append((name, before['p50_us'], stats['p50_us'], round(ratio, 2)))
+    return regressions
+
+
+def main():
+    parser = ArgumentParser(description='AppServices and rendering benchmark suite.')
+    parser.add_argument('-c', '--configfile', required=True,
+                        help="Configuration file of an empty database.")
+    parser.add_argument('--scale', choices=list(SCALES), default='1k',
+                        help="Synthetic data set size (campaign count).")
+    parser.add_argument('--seed', type=int, default=566,
+                        help="Random seed of the synthetic data.")
+    parser.add_argument('-n', '--iterations', type=int, default=200,
+                        help="Calls per point and write operation.")
+    parser.add_argument('--scan-repeat', type=int, default=3,
+                        help="Runs per full-table operation.")
+    parser.add_argument('--walk-pages', type=int, default=20,
+                        help="Pages rendered by list_campaigns_walk.")
+    parser.add_argument('--output',
+                        help="Report file (default: stdout).")
+    parser.add_argument('--baseline',
+                        help="Earlier report to compare p50 latencies against.")
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help="Allowed p50 growth before a regression is reported.")
+    args = parser.parse_args()
+
+    with open(args.configfile, 'r') as f:
+        config = json.loads(f.read())
+
+    suite = BenchmarkSuite(config, args.iterations, args.scan_repeat, args.walk_pages)
+    report = suite.run(args.scale, args.seed)
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            regressions = compare_reports(json.loads(f.read()), report, args.threshold)
+        for name, before, after, ratio in regressions:
+            print(f"REGRESSION {name}: p50 {before}us -> {after}us ({ratio}x)", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""Generates reproducible synthetic Campaign Channel data and loads it
+through AppServices.
+
+The same scale and seed always produce the same rows, so benchmark runs on
+different releases measure the same data set.
+"""
+
+import random
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from itertools import islice
+from typing import Iterator, List
+
+from campaign_app.service_layer.app_services import AppServices
+from campaign_app.infrastructure_layer.campaign import Campaign
+from campaign_app.infrastructure_layer.campaign_category import Campaign_Category
+from campaign_app.infrastructure_layer.channel import Channel
+from campaign_app.infrastructure_layer.channel_category import Channel_Category
+from campaign_app.infrastructure_layer.company import Company
+
+
+# Campaign counts per named scale
+SCALES = {'1k': 1_000, '100k': 100_000, '1m': 1_000_000}
+
+CHANNEL_CATEGORIES = ['Digital', 'Social Media', 'Television', 'Print', 'Radio',
+                      'Outdoor', 'Event', 'Word of Mouth']
+
+CAMPAIGN_CATEGORIES = ['Brand Awareness', 'Sales Promotion', 'Social Movement',
+                       'Super Bowl', 'Product Launch', 'Seasonal', 'Loyalty',
+                       'Sponsorship', 'Retargeting', 'Holiday', 'Charity', 'Rebrand']
+
+
+class SyntheticDataGenerator():
+    """Builds companies, categories, channels, campaigns and channel links
+    for one scale. Row counts other than campaigns are derived from it.
+    """
+
+    FIRST_START_DATE = date(2010, 1, 1)
+    START_DATE_DAYS = 16 * 365
+    OPEN_ENDED_RATE = 0.1
+    MIN_CHANNELS, MAX_CHANNELS = 1, 5
+
+    def __init__(self, scale:str='1k', seed:int=566) -> None:
+        """Initializes object. """
+        if scale not in SCALES:
+            raise ValueError(f"Unknown scale {scale}; expected one of {list(SCALES)}")
+        self.scale = scale
+        self.seed = seed
+        self.campaign_count = SCALES[scale]
+        self.company_count = max(10, self.campaign_count // 100)
+        self.channel_count = max(20, self.campaign_count // 1000)
+
+    def counts(self) -> dict:
+        """Returns the number of rows generated per table"""
+        return {'campaigns': self.campaign_count,
+                'companies': self.company_count,
+                'channels': self.channel_count,
+                'channel_categories': len(CHANNEL_CATEGORIES),
+                'campaign_categories': len(CAMPAIGN_CATEGORIES)}
+
+    def channel_categories(self) -> List[Channel_Category]:
+        categories = []
+        for name in CHANNEL_CATEGORIES:
+            category = Channel_Category()
+            category.Channel_CategoryName = name
+            categories.append(category)
+        return categories
+
+    def campaign_categories(self) -> List[Campaign_Category]:
+        categories = []
+        for name in CAMPAIGN_CATEGORIES:
+            category = Campaign_Category()
+            category.Campaign_CategoryName = name
+            categories.append(category)
+        return categories
+
+    def companies(self) -> List[Company]:
+        companies = []
+        for i in range(self.company_count):
+            company = Company()
+            company.CompanyName = f"Company {i + 1:07d}"
+            companies.append(company)
+        return companies
+
+    def channels(self, channel_category_ids:List[int]) -> List[Channel]:
+        rng = random.Random(f"{self.seed}:channels")
+        channels = []
+        for i in range(self.channel_count):
+            channel = Channel()
+            channel.ChannelName = f"Channel {i + 1:07d}"
+            channel.idChannel_Category = rng.choice(channel_category_ids)
+            channels.append(channel)
+        return channels
+
+    def campaigns(self, company_ids:List[int],
+                  campaign_category_ids:List[int]) -> Iterator[Campaign]:
+        """Yields campaigns one at a time so callers can insert in chunks"""
+        rng = random.Random(f"{self.seed}:campaigns")
+        for i in range(self.campaign_count):
+            campaign = Campaign()
+            campaign.Campaign_Name = f"Campaign {i + 1:07d}"
+            campaign.StartDate = self.FIRST_START_DATE + \
+                timedelta(days=rng.randrange(self.START_DATE_DAYS))
+            campaign.EndDate = None if rng.random() < self.OPEN_ENDED_RATE else \
+                campaign.StartDate + timedelta(days=rng.randrange(1, 366))
+            campaign.idCompany = rng.choice(company_ids)
+            campaign.idCampaign_Category = rng.choice(campaign_category_ids)
+            budget_cents = rng.randrange(100_000, 5_000_000_000)
+            campaign.Budget = Decimal(budget_cents).scaleb(-2)
+            campaign.Revenue = Decimal(
+                budget_cents * rng.randrange(20, 500) // 100).scaleb(-2)
+            yield campaign
+
+    def channel_sampler(self, channel_ids:List[int]):
+        """Returns a function giving the next campaign's channel ids, in
+        campaign order
+        """
+        rng = random.Random(f"{self.seed}:links")
+        most = min(self.MAX_CHANNELS, len(channel_ids))
+        return lambda: rng.sample(channel_ids, rng.randint(self.MIN_CHANNELS, most))
+
+
+class SyntheticDataLoader():
+    """Loads a SyntheticDataGenerator data set into an empty database."""
+
+    def __init__(self, app_services:AppServices, generator:SyntheticDataGenerator,
+                 chunk_size:int=None) -> None:
+        """Initializes object. """
+        self.app_services = app_services
+        self.generator = generator
+        self.chunk_size = chunk_size or app_services.DB.BULK_CHUNK_SIZE
+
+    def load(self) -> dict:
+        """Inserts every table and returns seconds and rows/s per table"""
+        if self.app_services.get_campaigns_page(page_size=1).items:
+            raise RuntimeError("Synthetic data must be loaded into an empty database.")
+
+        summary = {}
+        channel_category_ids = self._timed(summary, 'channel_categories', lambda: [
+            self.app_services.create_channel_category(c).idChannel_Category
+            for c in self.generator.channel_categories()])
+        campaign_category_ids = self._timed(summary, 'campaign_categories', lambda: [
+            self.app_services.create_campaign_category(c).idCampaign_Category
+            for c in self.generator.campaign_categories()])
+        company_ids = self._timed(summary, 'companies', lambda: [
+            self.app_services.create_company(c).idCompany
+            for c in self.generator.companies()])
+        channel_ids = self._timed(summary, 'channels', lambda: [
+            self.app_services.create_channel(c).idChannel
+            for c in self.generator.channels(channel_category_ids)])
+
+        campaign_seconds = 0.0
+        link_seconds = 0.0
+        link_count = 0
+        campaigns = self.generator.campaigns(company_ids, campaign_category_ids)
+        sample_channels = self.generator.channel_sampler(channel_ids)
+        index = 0
+        while True:
+            chunk = list(islice(campaigns, self.chunk_size))
+            if not chunk:
+                break
+            started = time.perf_counter()
+            result = self.app_services.create_campaigns(chunk, self.chunk_size,
+                                                        stop_on_error=True)
+            campaign_seconds += time.perf_counter() - started
+            if result is None or result.rolled_back:
+                raise RuntimeError(f"Campaign insert failed at row {index}.")
+
+            links = []
+            for campaign in chunk:
+                for idChannel in sample_channels():
+                    links.append((campaign.idCampaign, idChannel))
+                index += 1
+            started = time.perf_counter()
+            if self.app_services.create_campaign_channel_links(links, self.chunk_size) is None:
+                raise RuntimeError(f"Channel link insert failed near row {index}.")
+            link_seconds += time.perf_counter() - started
+            link_count += len(links)
+
+        summary['campaigns'] = self._rate(index, campaign_seconds)
+        summary['campaign_channel_links'] = self._rate(link_count, link_seconds)
+        return summary
+
+    def _timed(self, summary:dict, name:str, load) -> list:
+        """Runs load() in one transaction and records its rate under name"""
+        started = time.perf_counter()
+        with self.app_services.transaction():
+            ids = load()
+        summary[name] = self._rate(len(ids), time.perf_counter() - started)
+        return ids
+
+    def _rate(self, rows:int, seconds:float) -> dict:
+        return {'rows': rows, 'seconds': round(seconds, 3),
+                'rows_per_second': round(rows / seconds, 1) if seconds > 0 else None}
@@ -0,0 +1,26 @@
+"""Latency helpers shared by the benchmarks."""
+
+import time
+from statistics import mean, median, quantiles
+
+
+def time_calls(func, iterations:int) -> dict:
+    """Times func(i) for each iteration and returns latency stats in microseconds."""
+    samples = []
+    for i in range(iterations):
+        started = time.perf_counter()
+        func(i)
+        samples.append((time.perf_counter() - started) * 1_000_000)
+    return summarize(samples)
+
+
+def summarize(samples:list) -> dict:
+    """Returns count, mean, p50, p95, min and max of microsecond samples."""
+    return {
+        'iterations': len(samples),
+        'mean_us': round(mean(samples), 1),
+        'p50_us': round(median(samples), 1),
+        'p95_us': round(quantiles(samples, n=20)[-1], 1) if len(samples) > 1 else None,
+        'min_us': round(min(samples), 1),
+        'max_us': round(max(samples), 1)
+    }
@@ -4,10 +4,15 @@ from decimal import Decimal
 from campaign_app.infrastructure_layer.channel import Channel
 from typing import List
 
+# Immutable, so every new campaign can share it
+ZERO = Decimal("0.0")
 
 
 class Campaign():
     """Implements a Campaign."""
+    __slots__ = ('idCampaign', 'Campaign_Name', 'StartDate', 'EndDate', 'idCompany',
+                 'idCampaign_Category', 'Budget', 'Revenue', 'NetProfit', 'channel')
+
     def __init__(self)->None:
         self.idCampaign:int = 0
         self.Campaign_Name:str = ""
@@ -15,9 +20,9 @@ class Campaign():
         self.EndDate:date = date.today()
         self.idCompany:int = 0
         self.idCampaign_Category:int = 0
-        self.Budget:Decimal = Decimal("0.0")
-        self.Revenue:Decimal = Decimal("0.0")
-        self.NetProfit:Decimal = Decimal("0.0")
+        self.Budget:Decimal = ZERO
+        self.Revenue:Decimal = ZERO
+        self.NetProfit:Decimal = ZERO
         self.channel:List[Channel] = []
 
 
@@ -28,20 +33,18 @@ class Campaign():
         return self.to_json()
 
 
+    def to_dict(self)->dict:
+        return {'idCampaign': self.idCampaign,
+                'Campaign_Name': self.Campaign_Name,
+                'StartDate': self.StartDate.isoformat() if self.StartDate else None,
+                'EndDate': self.EndDate.isoformat() if self.EndDate else None,
+                'idCompany': self.idCompany,
+                'idCampaign_Category': self.idCampaign_Category,
+                'Budget': float(self.Budget),
+                'Revenue': float(self.Revenue),
+                'NetProfit': float(self.NetProfit),
+                'channel': [item.to_dict() for item in self.channel]}
+
+
     def to_json(self)->str:
-        campaign_dict = {}
-        campaign_dict['idCampaign'] = self.idCampaign
-        campaign_dict['Campaign_Name'] = self.Campaign_Name
-        campaign_dict['StartDate'] = self.StartDate.isoformat() if self.StartDate else None
-        campaign_dict['EndDate'] = self.EndDate.isoformat() if self.EndDate else None
-        campaign_dict['idCompany'] = self.idCompany
-        campaign_dict['idCampaign_Category'] = self.idCampaign_Category
-        campaign_dict['Budget'] = float(self.Budget)
-        campaign_dict['Revenue'] = float(self.Revenue)
-        campaign_dict['NetProfit'] = float(self.NetProfit)
-        campaign_dict['channel'] = []
-
-        for item in self.channel:
-            campaign_dict['channel'].append(item.__dict__)
-
-        return json.dumps(campaign_dict)
\ No newline at end of file
+        return json.dumps(self.to_dict())
\ No newline at end of file
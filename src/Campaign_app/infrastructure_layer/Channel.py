@@ -1,14 +1,16 @@
 import json
 from campaign_app.infrastructure_layer.channel_category import Channel_Category
-from typing import List
+from typing import Sequence
 
 class Channel():
+    __slots__ = ('idChannel', 'ChannelName', 'idChannel_Category', 'CategoryName')
 
     def __init__(self) ->None:
         self.idChannel:int = 0
         self.ChannelName:str = ""
         self.idChannel_Category:int = 0
-        self.CategoryName: List[Channel_Category] = []
+        # Hydrated channels share one (category,) tuple per category
+        self.CategoryName: Sequence[Channel_Category] = ()
     
     def __str__(self) ->str:
         return self.to_json()
@@ -16,6 +18,12 @@ class Channel():
     def __repr__(self)->str:
         return self.to_json()
     
+    def to_dict(self)->dict:
+        return {'idChannel': self.idChannel,
+                'ChannelName': self.ChannelName,
+                'idChannel_Category': self.idChannel_Category,
+                'CategoryName': [item.to_dict() for item in self.CategoryName]}
+    
     def to_json(self)->str:
         channel_dict = {}
         channel_dict['idChannel'] = self.idChannel
@@ -25,6 +33,6 @@ class Channel():
         
 
         for item in self.CategoryName:
-            channel_dict['Category Name'].append(item.__dict__)
+            channel_dict['Category Name'].append(item.to_dict())
 
         return json.dumps(channel_dict)
@@ -0,0 +1,33 @@
+import json
+from typing import List
+
+
+class BulkInsertResult():
+    """Implements the outcome of a bulk insert."""
+    def __init__(self) ->None:
+        self.inserted:List = []
+        self.failures:List[dict] = []
+        self.rolled_back:bool = False
+
+    def __str__(self) ->str:
+        return self.to_json()
+
+    def __repr__(self)->str:
+        return self.to_json()
+
+    def add_failure(self, index:int, item, error:Exception) ->None:
+        """Records the position in the input list, the item and the error."""
+        self.failures.append({'index': index, 'item': item, 'error': str(error)})
+
+    def to_json(self)->str:
+        result_dict = {}
+        result_dict['inserted'] = len(self.inserted)
+        result_dict['failed'] = len(self.failures)
+        result_dict['rolled_back'] = self.rolled_back
+        result_dict['failures'] = []
+
+        for failure in self.failures:
+            result_dict['failures'].append(
+                {'index': failure['index'], 'error': failure['error']})
+
+        return json.dumps(result_dict)
@@ -1,6 +1,8 @@
 import json
 
 class Campaign_Category():
+    __slots__ = ('idCampaign_Category', 'Campaign_CategoryName')
+
     def __init__(self) ->None:
         self.idCampaign_Category:int = 0
         self.Campaign_CategoryName:str = ""
@@ -0,0 +1,256 @@
+"""Defines the CampaignTable class."""
+
+from array import array
+from collections import Counter
+from datetime import date
+from decimal import Decimal
+from itertools import chain, repeat
+from operator import itemgetter
+from typing import Dict, List
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+BACKEND = 'numpy' if numpy is not None else 'array'
+
+
+def _ints(values) -> list:
+    if None in values:
+        return [0 if value is None else value for value in values]
+    return values
+
+
+def _ordinals(values) -> list:
+    """Dates as date.toordinal() days, 0 for no date"""
+    if None in values:
+        return [0 if value is None else value.toordinal() for value in values]
+    return list(map(date.toordinal, values))
+
+
+def _to_cents(value) -> int:
+    if value is None:
+        return 0
+    if not isinstance(value, Decimal):
+        value = Decimal(str(value))
+    return round(value.scaleb(2))
+
+
+def _cents(values) -> list:
+    """Amounts as integer cents, rounded half to even, 0 for no amount"""
+    if set(map(type, values)) == {Decimal}:
+        return list(map(round, map(Decimal.scaleb, values, repeat(2))))
+    return list(map(_to_cents, values))
+
+
+class CampaignTable():
+    """Implements a campaign listing as parallel columns for analytics.
+
+    Row i of every column is one campaign. IDs are 64-bit integers, dates
+    are proleptic Gregorian ordinals (date.toordinal(), 0 for no date) and
+    money is integer cents, so sums are exact. Columns are NumPy int64
+    arrays when NumPy is installed, array.array('q') otherwise.
+    """
+    ID_COLUMNS = ('idCampaign', 'idCompany', 'idCampaign_Category')
+    DATE_COLUMNS = ('StartDate_ordinal', 'EndDate_ordinal')
+    MONEY_COLUMNS = ('Budget_cents', 'Revenue_cents', 'NetProfit_cents')
+    COLUMNS = ID_COLUMNS + DATE_COLUMNS + MONEY_COLUMNS
+    # Position of each column in a SELECT_ALL_CAMPAIGNS row
+    POSITIONS = (0, 4, 5, 2, 3, 6, 7, 8)
+
+    def __init__(self, backend:str=None) ->None:
+        self.backend = backend or BACKEND
+        if self.backend not in ('numpy', 'array'):
+            raise ValueError(f"Unknown column backend {self.backend}")
+        if self.backend == 'numpy' and numpy is None:
+            raise ValueError("NumPy is not installed")
+        self.Campaign_Name:List[str] = []
+        for column in self.COLUMNS:
+            setattr(self, column, self._column([]))
+
+    def __len__(self) ->int:
+        return len(self.Campaign_Name)
+
+    def __str__(self) ->str:
+        return f"<CampaignTable {len(self)} campaigns ({self.backend})>"
+
+    def __repr__(self) ->str:
+        return self.__str__()
+
+    @classmethod
+    def from_rows(cls, rows, backend:str=None) ->'CampaignTable':
+        """Builds the table from SELECT_ALL_CAMPAIGNS shaped rows, with
+        date and Decimal values
+        """
+        table = cls(backend)
+        if not rows:
+            return table
+        table.Campaign_Name = list(map(itemgetter(1), rows))
+        for column, position in zip(cls.COLUMNS, cls.POSITIONS):
+            values = list(map(itemgetter(position), rows))
+            if column in cls.DATE_COLUMNS:
+                values = _ordinals(values)
+            elif column in cls.MONEY_COLUMNS:
+                values = _cents(values)
+            else:
+                values = _ints(values)
+            setattr(table, column, table._column(values))
+        return table
+
+    @classmethod
+    def from_scaled_rows(cls, rows, backend:str=None) ->'CampaignTable':
+        """Builds the table from rows in SELECT_ALL_CAMPAIGNS column order
+        whose dates are already ordinals and money already cents, with no
+        NULLs (SELECT_CAMPAIGN_COLUMNS)
+        """
+        table = cls(backend)
+        if not rows:
+            return table
+        table.Campaign_Name = list(map(itemgetter(1), rows))
+        for column, position in zip(cls.COLUMNS, cls.POSITIONS):
+            setattr(table, column, table._column(list(map(itemgetter(position), rows))))
+        return table
+
+    @staticmethod
+    def to_decimal(cents:int) ->Decimal:
+        """Converts a cents total back to a Decimal amount"""
+        return Decimal(int(cents)).scaleb(-2)
+
+    @staticmethod
+    def to_date(ordinal:int) ->date:
+        """Converts an ordinal back to a date, None for 0"""
+        return date.fromordinal(int(ordinal)) if ordinal else None
+
+    def totals(self) ->Dict[str, Decimal]:
+        """Returns the Budget, Revenue and NetProfit totals"""
+        return {column[:-len('_cents')]: self.to_decimal(self._sum(getattr(self, column)))
+                for column in self.MONEY_COLUMNS}
+
+    def column_sum(self, column):
+        """Returns the sum of column, a column name or a column like
+        active_on() or daily_burn() returns
+        """
+        return self._sum(self._values(column))
+
+    def sums_by(self, key:str, column) ->Dict[int, int]:
+        """Returns the sum of column (a column name, in its own units, e.g.
+        cents, or a column like daily_burn() returns) per distinct value of
+        the key column, e.g. sums_by('idCompany', 'Revenue_cents')
+        """
+        return self._group_sums(getattr(self, key), self._values(column))
+
+    def counts_by(self, key:str) ->Dict[int, int]:
+        """Returns the number of campaigns per distinct value of key"""
+        return self._counts(getattr(self, key))
+
+    def link_index(self, links):
+        """Resolves (idCampaign, key) link rows such as Campaign_channel_xref
+        to table rows, dropping links to unknown campaigns. Pass the result
+        to sums_by_link and counts_by_link, so the links are resolved once
+        per report. With NumPy it is a (row positions, keys) pair of
+        columns ordered by key, otherwise a dict of row positions per key.
+        """
+        if self.backend == 'numpy':
+            if not len(links) or not len(self):
+                return (numpy.zeros(0, numpy.int64), numpy.zeros(0, numpy.int64))
+            # fromiter over the flattened pairs skips numpy.array's per-tuple
+            # shape discovery
+            linked = numpy.fromiter(chain.from_iterable(links), numpy.int64,
+                                    2 * len(links)).reshape(-1, 2)
+            order = numpy.argsort(self.idCampaign, kind='stable')
+            found = numpy.searchsorted(self.idCampaign, linked[:, 0], sorter=order)
+            rows = order[numpy.minimum(found, len(order) - 1)]
+            known = self.idCampaign[rows] == linked[:, 0]
+            rows, keys = rows[known], linked[known, 1]
+            by_key = numpy.argsort(keys, kind='stable')
+            return rows[by_key], keys[by_key]
+        positions = dict(zip(self.idCampaign, range(len(self))))
+        index = {}
+        for idCampaign, key in links:
+            row = positions.get(idCampaign)
+            if row is not None:
+                index.setdefault(key, array('q')).append(row)
+        return index
+
+    def sums_by_link(self, index, column) ->Dict[int, int]:
+        """Returns the sum of column per key of a link_index(); a campaign
+        counts once for every key it is linked to
+        """
+        values = self._values(column)
+        if self.backend == 'numpy':
+            rows, keys = index
+            return self._group_sums(keys, values[rows])
+        return {key: sum(map(values.__getitem__, rows)) for key, rows in index.items()}
+
+    def counts_by_link(self, index) ->Dict[int, int]:
+        """Returns the number of linked campaigns per key of a link_index()"""
+        if self.backend == 'numpy':
+            return self._counts(index[1])
+        return {key: len(rows) for key, rows in index.items()}
+
+    def active_on(self, day:date):
+        """Returns a 0/1 column marking campaigns running on day: started
+        on or before it and ending on or after it, or open-ended
+        """
+        today = day.toordinal()
+        if self.backend == 'numpy':
+            start, end = self.StartDate_ordinal, self.EndDate_ordinal
+            return ((start > 0) & (start <= today) &
+                    ((end == 0) | (end >= today))).astype(numpy.int64)
+        return array('q', [1 if 0 < start <= today and (end == 0 or end >= today) else 0
+                           for start, end in zip(self.StartDate_ordinal, self.EndDate_ordinal)])
+
+    def daily_burn(self, day:date):
+        """Returns each campaign's budget per scheduled day, in cents (as
+        floats), for campaigns active on day and 0.0 for the rest. Open-ended
+        campaigns spread their budget over the days run so far.
+        """
+        today = day.toordinal()
+        active = self.active_on(day)
+        if self.backend == 'numpy':
+            end = numpy.where(self.EndDate_ordinal > 0, self.EndDate_ordinal, today)
+            days = end - self.StartDate_ordinal + 1
+            burn = numpy.zeros(len(self), dtype=numpy.float64)
+            numpy.divide(self.Budget_cents, days, out=burn, where=active.astype(bool))
+            return burn
+        return array('d', [budget / ((end or today) - start + 1) if running else 0.0
+                           for budget, start, end, running in zip(
+                               self.Budget_cents, self.StartDate_ordinal,
+                               self.EndDate_ordinal, active)])
+
+    def _column(self, values):
+        if self.backend == 'numpy':
+            return numpy.array(values, dtype=numpy.int64)
+        return array('q', values)
+
+    def _values(self, column):
+        return getattr(self, column) if isinstance(column, str) else column
+
+    def _group_sums(self, keys, values) ->dict:
+        """Sums values per distinct key; numpy sorts once and reduces each
+        run of equal keys
+        """
+        if self.backend == 'numpy':
+            if not len(keys):
+                return {}
+            order = numpy.argsort(keys, kind='stable')
+            sorted_keys = keys[order]
+            starts = numpy.flatnonzero(numpy.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+            sums = numpy.add.reduceat(values[order], starts)
+            return dict(zip(sorted_keys[starts].tolist(), sums.tolist()))
+        sums = {}
+        get = sums.get
+        for k, v in zip(keys, values):
+            sums[k] = get(k, 0) + v
+        return sums
+
+    def _counts(self, keys) ->dict:
+        if self.backend == 'numpy':
+            values, counts = numpy.unique(keys, return_counts=True)
+            return dict(zip(values.tolist(), counts.tolist()))
+        return dict(Counter(keys))
+
+    def _sum(self, column):
+        return column.sum().item() if self.backend == 'numpy' else sum(column)
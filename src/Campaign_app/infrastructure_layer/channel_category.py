@@ -1,6 +1,12 @@
 import json
+from weakref import WeakValueDictionary
 
 class Channel_Category():
+    __slots__ = ('idChannel_Category', 'Channel_CategoryName', '__weakref__')
+
+    # Shared instances handed out by interned(), dropped once unreferenced
+    _interned = WeakValueDictionary()
+
     def __init__(self) ->None:
         self.idChannel_Category:int = 0
         self.Channel_CategoryName:str = ""
@@ -12,8 +18,23 @@ class Channel_Category():
     def __repr__(self)->str:
         return self.to_json()
     
+    @classmethod
+    def interned(cls, idChannel_Category:int, Channel_CategoryName:str) ->'Channel_Category':
+        """Returns the shared instance for this category row. Hydrated
+        channels reference it instead of holding a copy each, so treat it
+        as read-only.
+        """
+        category = cls._interned.get(idChannel_Category)
+        if category is None or category.Channel_CategoryName != Channel_CategoryName:
+            category = cls()
+            category.idChannel_Category = idChannel_Category
+            category.Channel_CategoryName = Channel_CategoryName
+            cls._interned[idChannel_Category] = category
+        return category
+
+    def to_dict(self)->dict:
+        return {'idChannel_Category': self.idChannel_Category,
+                'Channel_CategoryName': self.Channel_CategoryName}
+    
     def to_json(self)->str:
-        channel_category_dict = {}
-        channel_category_dict['idChannel_Category'] = self.idChannel_Category
-        channel_category_dict['Channel_CategoryName'] = self.Channel_CategoryName
-        return json.dumps(channel_category_dict)
\ No newline at end of file
+        return json.dumps(self.to_dict())
\ No newline at end of file
@@ -1,6 +1,8 @@
 import json
 
 class Company():
+    __slots__ = ('idCompany', 'CompanyName')
+
     def __init__(self) -> None:
         self.idCompany:int = 0
         self.CompanyName:str = ""
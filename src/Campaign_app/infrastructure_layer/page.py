@@ -0,0 +1,47 @@
+import json
+import base64
+from typing import List, Tuple
+
+
+class Page():
+    """Implements one page of a keyset-paginated listing."""
+    def __init__(self) ->None:
+        self.items:List = []
+        self.page_size:int = 0
+        self.next_cursor:str = None
+        self.prev_cursor:str = None
+
+    def __str__(self) ->str:
+        return self.to_json()
+
+    def __repr__(self)->str:
+        return self.to_json()
+
+    def has_next(self) ->bool:
+        return self.next_cursor is not None
+
+    def has_prev(self) ->bool:
+        return self.prev_cursor is not None
+
+    def to_json(self)->str:
+        page_dict = {}
+        page_dict['count'] = len(self.items)
+        page_dict['page_size'] = self.page_size
+        page_dict['next_cursor'] = self.next_cursor
+        page_dict['prev_cursor'] = self.prev_cursor
+        return json.dumps(page_dict)
+
+    @staticmethod
+    def encode_cursor(direction:str, key:int) ->str:
+        """Encodes a seek direction ('n' after key, 'p' before key) and key."""
+        return base64.urlsafe_b64encode(f"{direction}:{key}".encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor:str) ->Tuple[str, int]:
+        """Decodes a cursor token. No token means the first page."""
+        if not cursor:
+            return 'n', 0
+        direction, key = base64.urlsafe_b64decode(cursor.encode()).decode().split(':')
+        if direction not in ('n', 'p'):
+            raise ValueError(f"Invalid page cursor: {cursor}")
+        return direction, int(key)
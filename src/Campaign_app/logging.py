@@ -1,83 +1,214 @@
 """Provides LoggingService convenience class for application logging."""
 
+import atexit
 import logging
 import logging.handlers
-from campaign_app.settings import Settings
+import queue
+import threading
+from campaign_app.settings import SettingsRegistry
 import os
 
+LOG_LEVELS = {
+    'notset': logging.NOTSET,
+    'debug': logging.DEBUG,
+    'info': logging.INFO,
+    'warning': logging.WARNING,
+    'error': logging.ERROR,
+    'critical': logging.CRITICAL
+}
+
+# Names of the loggers configured by LoggingService, re-leveled on reload
+_managed_loggers = set()
+_managed_lock = threading.Lock()
+
+
+def log_level_from_settings(settings:dict) -> int:
+    """Returns the logging level named by settings['log_level']"""
+    return LOG_LEVELS.get(settings.get('log_level'), logging.ERROR)
+
+
+def _apply_log_level(filename:str, settings:dict) -> None:
+    """Settings reload listener: applies the new log level to every logger."""
+    level = log_level_from_settings(settings)
+    with _managed_lock:
+        names = list(_managed_loggers)
+    for name in names:
+        logging.getLogger(name).setLevel(level)
+
+
+SettingsRegistry.add_listener(_apply_log_level)
+
+
+LOG_FORMAT = '%(levelname)s:%(name)s:%(asctime)s:%(message)s'
+
+# Output handlers shared by every logger writing to the same target, so one
+# file handle owns each log file and its midnight rollover
+_shared_handlers = {}
+_queue_handlers = {}
+_handlers_lock = threading.Lock()
+_log_queue = None
+_queue_listener = None
+
+
+class _TargetDispatcher(logging.Handler):
+    """Runs on the queue listener thread and hands each record to the
+    output handlers of the target it was queued for.
+    """
+
+    def handle(self, record):
+        for handler in _shared_handlers.get(record.log_target, ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+
+
+class _TargetFilter(logging.Filter):
+    """Tags records with their output target before they are queued."""
+
+    def __init__(self, target:tuple) -> None:
+        super().__init__()
+        self.target = target
+
+    def filter(self, record):
+        record.log_target = self.target
+        return True
+
+
+def _output_handlers(settings:dict, logfile_prefix_name:str) -> tuple:
+    """Returns (target, handlers) for the console/file outputs in settings,
+    creating the handlers on first use. Call with _handlers_lock held.
+    """
+    log_file = None
+    if settings['log_to_file']:
+        log_file = os.path.join(settings['logs_dir'], 
+                    f"{logfile_prefix_name}_{settings['log_filename']}")
+    target = (bool(settings['log_to_console']), log_file)
+    if target not in _shared_handlers:
+        formatter = logging.Formatter(LOG_FORMAT)
+        handlers = []
+        if settings['log_to_console']:
+            handlers.append(logging.StreamHandler())
+        if log_file:
+            os.makedirs(settings['logs_dir'], exist_ok=True)
+            handlers.append(logging.handlers.TimedRotatingFileHandler(log_file, 
+                            when='midnight', backupCount=20))
+        for handler in handlers:
+            handler.setLevel(logging.DEBUG)
+            handler.setFormatter(formatter)
+        _shared_handlers[target] = handlers
+    return target, _shared_handlers[target]
+
+
+def _queue_handler(target:tuple) -> logging.Handler:
+    """Returns the QueueHandler feeding target's records to the single
+    listener thread, starting the listener on first use. Call with
+    _handlers_lock held.
+    """
+    global _log_queue, _queue_listener
+    if _queue_listener is None:
+        _log_queue = queue.SimpleQueue()
+        _queue_listener = logging.handlers.QueueListener(_log_queue, _TargetDispatcher())
+        _queue_listener.start()
+        atexit.register(stop_log_queue)
+    if target not in _queue_handlers:
+        handler = logging.handlers.QueueHandler(_log_queue)
+        handler.addFilter(_TargetFilter(target))
+        _queue_handlers[target] = handler
+    return _queue_handlers[target]
+
+
+def stop_log_queue() -> None:
+    """Writes out every queued record and stops the listener thread. Runs
+    at exit; loggers keep queueing but nothing is written afterwards.
+    """
+    global _queue_listener
+    with _handlers_lock:
+        listener, _queue_listener = _queue_listener, None
+    if listener is not None:
+        listener.stop()
+    for handlers in list(_shared_handlers.values()):
+        for handler in handlers:
+            handler.flush()
+
+
+def summarize(value):
+    """Returns a short description of a collection instead of its contents"""
+    if isinstance(value, (list, tuple, set, frozenset, dict)):
+        kind = type(value).__name__
+        if not value:
+            return f"<empty {kind}>"
+        return f"<{kind} of {len(value)} {type(next(iter(value))).__name__}>"
+    return value
+
+
+def summarize_args(args:tuple) -> tuple:
+    """Applies summarize() to each logging argument"""
+    return tuple(summarize(arg) for arg in args)
+
+
 class LoggingService():
     """Provides logging services."""
 
-    def __init__(self, class_name:str, logfile_prefix_name:str=None)->None:
-        """Initialize instance."""
+    def __init__(self, class_name:str, logfile_prefix_name:str=None,
+                 log_filename:str=None, log_level:str=None)->None:
+        """Initialize instance. log_filename sends the output to its own
+        file instead of the application log; log_level pins the level so
+        it ignores the log_level setting.
+        """
         
         self._logger = logging.getLogger(class_name)
         self._logger.propagate = False
-        self._settings_dict = Settings().read_settings_file_from_location()
+        self._settings_dict = SettingsRegistry.get()
+        if log_filename:
+            self._settings_dict = dict(self._settings_dict, log_filename=log_filename,
+                                       log_to_file=True, log_to_console=False)
         self._logfile_prefix_name = logfile_prefix_name
-        self.log_level = logging.ERROR
-        
-        if self._settings_dict['log_level'] == 'notset':
-            self._logger.setLevel(logging.NOTSET)
-            self.log_level = logging.NOTSET
-        elif self._settings_dict['log_level'] == 'debug':
-            self._logger.setLevel(logging.DEBUG)
-            self.log_level = logging.debug
-        elif self._settings_dict['log_level'] == 'info':
-            self._logger.setLevel(logging.INFO)
-            self.log_level = logging.INFO
-        elif self._settings_dict['log_level'] == 'warning':
-            self._logger.setLevel(logging.WARNING)
-            self.log_level = logging.WARNING
-        elif self._settings_dict['log_level'] == 'error':
-            self._logger.setLevel(logging.ERROR)
-            self.log_level = logging.ERROR
-        elif self._settings_dict['log_level'] == 'critical':
-            self._logger.setLevel(logging.CRITICAL)
-            self.log_level = logging.CRITICAL
+        if log_level:
+            self.log_level = LOG_LEVELS[log_level]
         else:
-            self._logger.setLevel(logging.ERROR)
-            self.log_level = logging.ERROR
-
-        self._formatter = \
-                logging.Formatter('%(levelname)s:%(name)s:%(asctime)s:%(message)s')
+            self.log_level = log_level_from_settings(self._settings_dict)
+            with _managed_lock:
+                _managed_loggers.add(class_name)
+        self._logger.setLevel(self.log_level)
 
         if not self._logger.handlers:
-            if self._settings_dict['log_to_console']:
-                self._ch = logging.StreamHandler()
-                self._ch.setLevel(logging.DEBUG)
-                self._ch.setFormatter(self._formatter)
-                self._logger.addHandler(self._ch)
-
-            if self._settings_dict['log_to_file']:
-                log_file = os.path.join(self._settings_dict['logs_dir'], 
-                            f"{self._logfile_prefix_name}_" \
-                            f"{self._settings_dict['log_filename']}")
-                self._fh = logging.handlers.TimedRotatingFileHandler(log_file, 
-                            when='midnight', backupCount=20)
-                self._fh.setLevel(logging.DEBUG)
-                self._fh.setFormatter(self._formatter)
-                self._logger.addHandler(self._fh)
-        
+            with _handlers_lock:
+                target, handlers = _output_handlers(self._settings_dict, 
+                                                    self._logfile_prefix_name)
+                if self._settings_dict.get('log_async') and handlers:
+                    self._logger.addHandler(_queue_handler(target))
+                else:
+                    for handler in handlers:
+                        self._logger.addHandler(handler)
+
 
-    
-    def log_debug(self, message):
-        """Log to debug."""
-        self._logger.debug(message)
+    def is_debug_enabled(self) -> bool:
+        """True if debug messages would be emitted; guards costly payloads."""
+        return self._logger.isEnabledFor(logging.DEBUG)
 
-    def log_error(self, message):
+    def log_debug(self, message, *args):
+        """Log to debug. args are %-formatted into message only when
+        debug is enabled, with collections logged as counts.
+        """
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(message, *summarize_args(args))
+
+    def log_error(self, message, *args):
         """Log to error."""
-        self._logger.error(message)
+        if self._logger.isEnabledFor(logging.ERROR):
+            self._logger.error(message, *summarize_args(args))
 
-    def log_info(self, message):
+    def log_info(self, message, *args):
         """Log to info."""
-        self._logger.info(message)
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(message, *summarize_args(args))
 
-    def log_warning(self, message):
+    def log_warning(self, message, *args):
         """Log to warning."""
-        self._logger.warning(message)
+        if self._logger.isEnabledFor(logging.WARNING):
+            self._logger.warning(message, *summarize_args(args))
 
-    def log_critical(self, message):
+    def log_critical(self, message, *args):
         """Log to critical."""
-        self._logger.critical(message)
-
+        if self._logger.isEnabledFor(logging.CRITICAL):
+            self._logger.critical(message, *summarize_args(args))
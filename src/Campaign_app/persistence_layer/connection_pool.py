@@ -0,0 +1,218 @@
+"""Defines the ConnectionPool class."""
+
+import threading
+import time
+from collections import deque
+
+
+class PoolTimeoutError(Exception):
+    """Raised when no connection is released within the acquire timeout."""
+
+
+class PooledConnection():
+    """Checked-out connection handle. Attribute access goes to the driver
+    connection; closing the handle returns it to the pool.
+    """
+
+    def __init__(self, pool, cnx) -> None:
+        """Initializes object. """
+        self._pool = pool
+        self._cnx = cnx
+
+    def __getattr__(self, name):
+        return getattr(self._cnx, name)
+
+    def close(self) -> None:
+        if self._cnx is None:
+            return
+        cnx, self._cnx = self._cnx, None
+        self._pool._release(cnx)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class ConnectionPool():
+    """Bounded connection pool that queues callers instead of failing when
+    every connection is busy. A caller waits up to acquire_timeout seconds
+    for a release before PoolTimeoutError is raised.
+
+    connect() opens a driver connection. validate(cnx) is run on checkout
+    for connections idle longer than validate_idle_seconds; a connection
+    failing it is replaced. reset(cnx) is run on release; a connection
+    raising from it is discarded.
+    """
+
+    def __init__(self, connect, size:int=10, min_size:int=0, acquire_timeout:float=10.0,
+                 validate=None, validate_idle_seconds:float=30.0, reset=None,
+                 name:str='pool') -> None:
+        """Initializes object. """
+        self.name = name
+        self.size = size
+        self.min_size = min(min_size, size)
+        self.acquire_timeout = acquire_timeout
+        self.validate_idle_seconds = validate_idle_seconds
+        self._connect = connect
+        self._validate = validate
+        self._reset = reset
+        self._cond = threading.Condition()
+        self._idle = deque()
+        self._open = 0
+        self._in_use = 0
+        self._waiting = 0
+        self._closed = False
+        self._reset_counters()
+
+    def prewarm(self) -> int:
+        """Opens connections until min_size are open; returns the number opened"""
+        opened = []
+        with self._cond:
+            missing = max(0, self.min_size - self._open)
+            self._open += missing
+        try:
+            for _ in range(missing):
+                opened.append(self._connect())
+        finally:
+            with self._cond:
+                self._open -= missing - len(opened)
+                now = time.monotonic()
+                self._idle.extend((cnx, now) for cnx in opened)
+                self._cond.notify(len(opened))
+        return len(opened)
+
+    def get_connection(self) -> PooledConnection:
+        """Checks out an idle connection, opens one if the pool has room,
+        or waits for a release
+        """
+        started = None
+        with self._cond:
+            while True:
+                if self._idle:
+                    cnx, released = self._idle.pop()
+                    break
+                if self._open < self.size:
+                    self._open += 1
+                    cnx, released = None, None
+                    break
+                now = time.monotonic()
+                if started is None:
+                    started = now
+                    self.exhausted += 1
+                remaining = self.acquire_timeout - (now - started)
+                if remaining <= 0:
+                    self.timeouts += 1
+                    raise PoolTimeoutError(
+                        f"No connection in pool {self.name} within "
+                        f"{self.acquire_timeout}s ({self._in_use} of {self.size} in use)")
+                self._waiting += 1
+                try:
+                    self._cond.wait(remaining)
+                finally:
+                    self._waiting -= 1
+            if started is not None:
+                waited = time.monotonic() - started
+                self.wait_seconds += waited
+                self.max_wait_seconds = max(self.max_wait_seconds, waited)
+            self._in_use += 1
+            self.checkouts += 1
+
+        try:
+            if cnx is None:
+                cnx = self._connect()
+            elif not self._is_valid(cnx, released):
+                self._close_quietly(cnx)
+                with self._cond:
+                    self.validation_failures += 1
+                cnx = self._connect()
+        except Exception:
+            with self._cond:
+                self._open -= 1
+                self._in_use -= 1
+                self._cond.notify()
+            raise
+        return PooledConnection(self, cnx)
+
+    def stats(self) -> dict:
+        """Returns occupancy and wait counters"""
+        with self._cond:
+            return {
+                'name': self.name,
+                'size': self.size,
+                'min_size': self.min_size,
+                'open': self._open,
+                'in_use': self._in_use,
+                'idle': len(self._idle),
+                'waiting': self._waiting,
+                'checkouts': self.checkouts,
+                'exhausted': self.exhausted,
+                'timeouts': self.timeouts,
+                'wait_ms_total': round(self.wait_seconds * 1000, 3),
+                'wait_ms_max': round(self.max_wait_seconds * 1000, 3),
+                'validation_failures': self.validation_failures,
+                'discarded': self.discarded
+            }
+
+    def reset_stats(self) -> None:
+        with self._cond:
+            self._reset_counters()
+
+    def close(self) -> None:
+        """Closes the idle connections; checked-out ones close on release"""
+        with self._cond:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._open -= len(idle)
+        for cnx, _ in idle:
+            self._close_quietly(cnx)
+
+    def _reset_counters(self) -> None:
+        self.checkouts = 0
+        self.exhausted = 0
+        self.timeouts = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.validation_failures = 0
+        self.discarded = 0
+
+    def _is_valid(self, cnx, released:float) -> bool:
+        if self._validate is None or \
+            time.monotonic() - released < self.validate_idle_seconds:
+            return True
+        try:
+            return bool(self._validate(cnx))
+        except Exception:
+            return False
+
+    def _release(self, cnx) -> None:
+        try:
+            if self._reset is not None:
+                self._reset(cnx)
+        except Exception:
+            self._close_quietly(cnx)
+            with self._cond:
+                self._open -= 1
+                self._in_use -= 1
+                self.discarded += 1
+                self._cond.notify()
+            return
+        with self._cond:
+            self._in_use -= 1
+            if self._closed:
+                self._open -= 1
+                discard = True
+            else:
+                self._idle.append((cnx, time.monotonic()))
+                discard = False
+            self._cond.notify()
+        if discard:
+            self._close_quietly(cnx)
+
+    def _close_quietly(self, cnx) -> None:
+        try:
+            cnx.close()
+        except Exception:
+            pass
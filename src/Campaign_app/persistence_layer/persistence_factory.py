@@ -0,0 +1,20 @@
+"""Selects the persistence backend named in the configuration."""
+
+from campaign_app.persistence_layer.persistence_wrapper import PersistenceWrapper
+
+
+BACKENDS = ('mysql', 'sqlite')
+
+
+def create_persistence_wrapper(config:dict) -> PersistenceWrapper:
+	"""Returns the wrapper for config["database"]["backend"] (default mysql).
+	Backends are imported on demand so SQLite runs without the MySQL driver.
+	"""
+	backend = config["database"].get("backend", "mysql").lower()
+	if backend == 'mysql':
+		from campaign_app.persistence_layer.mysql_persistence_wrapper import MySQLPersistenceWrapper
+		return MySQLPersistenceWrapper(config)
+	if backend == 'sqlite':
+		from campaign_app.persistence_layer.sqlite_persistence_wrapper import SQLitePersistenceWrapper
+		return SQLitePersistenceWrapper(config)
+	raise ValueError(f"Unknown database backend {backend}; expected one of {BACKENDS}")
@@ -0,0 +1,1302 @@
+"""Defines the PersistenceWrapper base class."""
+
+import threading
+import time
+from abc import abstractmethod
+from contextlib import contextmanager
+from itertools import groupby
+from typing import Iterator, List, Tuple
+
+from campaign_app.application_base import ApplicationBase
+from campaign_app.infrastructure_layer.campaign_category import Campaign_Category
+from campaign_app.infrastructure_layer.campaign import Campaign
+from campaign_app.infrastructure_layer.channel_category import Channel_Category
+from campaign_app.infrastructure_layer.channel import Channel
+from campaign_app.infrastructure_layer.company import Company
+from campaign_app.infrastructure_layer.page import Page
+from campaign_app.infrastructure_layer.bulk_insert_result import BulkInsertResult
+from campaign_app.infrastructure_layer.campaign_table import CampaignTable
+from campaign_app.persistence_layer.unit_of_work import UnitOfWork, TransactionRolledBack
+from campaign_app.persistence_layer.query_metrics import (QueryMetrics, timed_operation,
+	timed_phase)
+from campaign_app.persistence_layer.slow_query_log import SlowQueryLog, logged_statement
+from campaign_app.persistence_layer.row_factory import (CampaignColumns, ChannelColumns,
+	CompanyColumns, CampaignCategoryColumns, ChannelCategoryColumns, CampaignRow, ChannelRow,
+	hydrate_campaigns, hydrate_channels, hydrate_companies, hydrate_campaign_categories,
+	hydrate_channel_categories, named_rows)
+
+
+class PersistenceWrapper(ApplicationBase):
+	"""Persistence interface shared by every database backend.
+	Implements the queries and object population against a DB-API style
+	connection pool; backends supply the pool and the bulk insert id logic.
+	"""
+
+	# Exception type raised by the backend driver
+	DATABASE_ERROR = Exception
+
+	# Prefix turning a statement into a plan request
+	EXPLAIN_PREFIX = "EXPLAIN "
+
+	# Column expressions for SELECT_CAMPAIGN_COLUMNS: a DATE as its
+	# date.toordinal() day number (0 for NULL), a DECIMAL as integer cents
+	DATE_ORDINAL_SQL = "COALESCE(TO_DAYS({0}) - 365, 0)"
+	CENTS_SQL = "COALESCE(CAST(ROUND({0} * 100) AS SIGNED), 0)"
+
+	# Result column positions, shared by every instance
+	CampaignColumns = CampaignColumns
+	ChannelColumns = ChannelColumns
+	CompanyColumns = CompanyColumns
+	CampaignCategoryColumns = CampaignCategoryColumns
+	ChannelCategoryColumns = ChannelCategoryColumns
+
+	def __init__(self, config:dict) -> None:
+		"""Initializes object. """
+		self._config_dict = config
+		self.META = config["meta"]
+		self.DATABASE = config["database"]
+		super().__init__(
+			subclass_name=self.__class__.__name__, 
+			logfile_prefix_name=self.META["log_prefix"]
+		)
+		
+
+		# Rows per multi-row INSERT for bulk loads
+		self.BULK_CHUNK_SIZE = self.DATABASE.get("bulk", {}).get("chunk_size", 1000)
+
+		# Rows per fetchmany() round for streaming reads
+		self.STREAM_FETCH_SIZE = self.DATABASE.get("stream", {}).get("fetch_size", 1000)
+
+		# Set by the backend's _initialize_database_connection_pool()
+		self._connection_pool = None
+
+		# Per-thread UnitOfWork pinned by transaction()
+		self._local = threading.local()
+
+		# Per-method call, row and latency instrumentation
+		self.metrics = QueryMetrics() \
+			if self.DATABASE.get("metrics", {}).get("enabled", True) else None
+
+		# Statements over database.slow_query.threshold_ms, in their own log
+		slow_query = self.DATABASE.get("slow_query", {})
+		self.slow_query_log = SlowQueryLog(slow_query, self.META["log_prefix"]) \
+			if slow_query.get("enabled", False) else None
+		
+		# SQL Query Constants Lists Campaigns
+		self.SELECT_ALL_CAMPAIGNS = \
+			f"SELECT idCampaign, Campaign_Name, StartDate, EndDate, idCompany, " \
+			f"idCampaign_Category, Budget, Revenue, NetProfit " \
+			f"FROM Campaign"
+		
+		# Campaigns already converted to CampaignTable units by the database
+		self.SELECT_CAMPAIGN_COLUMNS = \
+			f"SELECT idCampaign, Campaign_Name, " \
+			f"{self.DATE_ORDINAL_SQL.format('StartDate')}, " \
+			f"{self.DATE_ORDINAL_SQL.format('EndDate')}, idCompany, idCampaign_Category, " \
+			f"{self.CENTS_SQL.format('Budget')}, {self.CENTS_SQL.format('Revenue')}, " \
+			f"{self.CENTS_SQL.format('NetProfit')} " \
+			f"FROM Campaign"
+		
+		# Campaign to channel links, for rollups over CampaignTable columns
+		self.SELECT_ALL_CAMPAIGN_CHANNEL_LINKS = \
+			f"SELECT idCampaign, idChannel " \
+			f"FROM Campaign_channel_xref"
+
+		self.SELECT_CHANNELS_FOR_CAMPAIGN_ID = \
+			f"SELECT c.idChannel, c.ChannelName, c.idChannel_Category " \
+			f"FROM Channel c, Campaign_channel_xref cx " \
+			f"WHERE (cx.idCampaign = %s) AND (c.idChannel = cx.idChannel)"
+
+		# Point lookups by primary key / unique index
+		self.SELECT_CAMPAIGN_BY_ID = \
+			f"SELECT idCampaign, Campaign_Name, StartDate, EndDate, idCompany, " \
+			f"idCampaign_Category, Budget, Revenue, NetProfit " \
+			f"FROM Campaign " \
+			f"WHERE idCampaign = %s"
+
+		self.SELECT_CAMPAIGN_EXISTS = \
+			f"SELECT 1 FROM Campaign " \
+			f"WHERE idCampaign = %s LIMIT 1"
+
+		# Case-insensitive on every backend, as the console check always was
+		self.SELECT_CAMPAIGN_NAME_EXISTS = \
+			f"SELECT 1 FROM Campaign " \
+			f"WHERE LOWER(Campaign_Name) = LOWER(%s) LIMIT 1"
+
+		# Channels for every campaign in one round trip, grouped in Python
+		self.SELECT_CHANNELS_FOR_ALL_CAMPAIGNS = \
+			f"SELECT cx.idCampaign, c.idChannel, c.ChannelName, c.idChannel_Category " \
+			f"FROM Campaign_channel_xref cx " \
+			f"JOIN Channel c ON c.idChannel = cx.idChannel"
+		
+		# List all channels SQL
+		self.SELECT_ALL_CHANNELS = \
+			f"SELECT idChannel, ChannelName, idChannel_Category " \
+			f"FROM Channel"
+
+		# List all channels with their category name in one query
+		self.SELECT_ALL_CHANNELS_WITH_CATEGORY = \
+			f"SELECT c.idChannel, c.ChannelName, c.idChannel_Category, cc.Channel_CategoryName " \
+			f"FROM Channel c " \
+			f"JOIN Channel_Category cc ON c.idChannel_Category = cc.idChannel_Category"
+		
+		self.SELECT_CAMPAIGN_CATEGORY_FOR_CHANNEL_ID = \
+			f"SELECT c.idChannel, c.ChannelName, c.idChannel_Category, cc.Channel_CategoryName " \
+			f"FROM Channel c  " \
+			f"JOIN Channel_Category cc on c.idChannel_Category = cc.idChannel_Category " \
+			f"WHERE c.idChannel = %s"
+		
+		# List all Channel Category SQL
+		self.SELECT_ALL_CHANNEL_CATEGORY = \
+			f"SELECT idChannel_Category, Channel_CategoryName " \
+			f"FROM channel_category " \
+			f"ORDER by idChannel_Category" 
+
+		# List all Campaign Category SQL
+		self.SELECT_ALL_CAMPAIGN_CATEGORY = \
+			f"SELECT idCampaign_Category, Campaign_CategoryName " \
+			f"FROM campaign_category " \
+			f"ORDER BY idCampaign_Category"
+
+		# List all Companies
+		self.SELECT_ALL_COMPANY = \
+			f"SELECT idCompany, CompanyName " \
+			f"FROM company " \
+			f"ORDER BY idCompany"
+		
+		# Keyset pagination SQL: seek past the cursor key, fetch one extra row
+		# to know whether another page exists
+		self.SELECT_CAMPAIGNS_PAGE_AFTER = \
+			f"SELECT idCampaign, Campaign_Name, StartDate, EndDate, idCompany, " \
+			f"idCampaign_Category, Budget, Revenue, NetProfit " \
+			f"FROM Campaign " \
+			f"WHERE idCampaign > %s " \
+			f"ORDER BY idCampaign LIMIT %s"
+
+		self.SELECT_CAMPAIGNS_PAGE_BEFORE = \
+			f"SELECT idCampaign, Campaign_Name, StartDate, EndDate, idCompany, " \
+			f"idCampaign_Category, Budget, Revenue, NetProfit " \
+			f"FROM Campaign " \
+			f"WHERE idCampaign < %s " \
+			f"ORDER BY idCampaign DESC LIMIT %s"
+
+		self.SELECT_CHANNELS_FOR_CAMPAIGN_RANGE = \
+			f"SELECT cx.idCampaign, c.idChannel, c.ChannelName, c.idChannel_Category " \
+			f"FROM Campaign_channel_xref cx " \
+			f"JOIN Channel c ON c.idChannel = cx.idChannel " \
+			f"WHERE cx.idCampaign BETWEEN %s AND %s"
+
+		self.SELECT_CHANNELS_PAGE_AFTER = \
+			f"SELECT c.idChannel, c.ChannelName, c.idChannel_Category, cc.Channel_CategoryName " \
+			f"FROM Channel c " \
+			f"JOIN Channel_Category cc ON c.idChannel_Category = cc.idChannel_Category " \
+			f"WHERE c.idChannel > %s " \
+			f"ORDER BY c.idChannel LIMIT %s"
+
+		self.SELECT_CHANNELS_PAGE_BEFORE = \
+			f"SELECT c.idChannel, c.ChannelName, c.idChannel_Category, cc.Channel_CategoryName " \
+			f"FROM Channel c " \
+			f"JOIN Channel_Category cc ON c.idChannel_Category = cc.idChannel_Category " \
+			f"WHERE c.idChannel < %s " \
+			f"ORDER BY c.idChannel DESC LIMIT %s"
+
+		self.SELECT_COMPANIES_PAGE_AFTER = \
+			f"SELECT idCompany, CompanyName " \
+			f"FROM company " \
+			f"WHERE idCompany > %s " \
+			f"ORDER BY idCompany LIMIT %s"
+
+		self.SELECT_COMPANIES_PAGE_BEFORE = \
+			f"SELECT idCompany, CompanyName " \
+			f"FROM company " \
+			f"WHERE idCompany < %s " \
+			f"ORDER BY idCompany DESC LIMIT %s"
+
+		# Streaming export SQL, ordered so related rows arrive together
+		self.STREAM_CAMPAIGNS_WITH_CHANNELS = \
+			f"SELECT c.idCampaign, c.Campaign_Name, c.StartDate, c.EndDate, c.idCompany, " \
+			f"c.idCampaign_Category, c.Budget, c.Revenue, c.NetProfit, " \
+			f"ch.idChannel, ch.ChannelName, ch.idChannel_Category " \
+			f"FROM Campaign c " \
+			f"LEFT JOIN Campaign_channel_xref cx ON cx.idCampaign = c.idCampaign " \
+			f"LEFT JOIN Channel ch ON ch.idChannel = cx.idChannel " \
+			f"ORDER BY c.idCampaign"
+
+		self.STREAM_CHANNELS = \
+			f"SELECT c.idChannel, c.ChannelName, c.idChannel_Category, cc.Channel_CategoryName " \
+			f"FROM Channel c " \
+			f"JOIN Channel_Category cc ON c.idChannel_Category = cc.idChannel_Category " \
+			f"ORDER BY c.idChannel"
+
+		self.STREAM_COMPANIES = \
+			f"SELECT idCompany, CompanyName " \
+			f"FROM company " \
+			f"ORDER BY idCompany"
+
+		# Insert Campaign
+		self.INSERT_CAMPAIGN = \
+			f"INSERT INTO Campaign " \
+			f"(Campaign_Name, StartDate, EndDate, idCompany, idCampaign_Category, Budget, Revenue) " \
+			f"VALUES(%s, %s, %s, %s, %s, %s, %s)"
+
+		# Bulk insert savepoints
+		self.SAVEPOINT_BULK_BATCH = f"SAVEPOINT bulk_batch"
+		self.ROLLBACK_TO_BULK_BATCH = f"ROLLBACK TO SAVEPOINT bulk_batch"
+		self.SAVEPOINT_BULK_CHUNK = f"SAVEPOINT bulk_chunk"
+		self.ROLLBACK_TO_BULK_CHUNK = f"ROLLBACK TO SAVEPOINT bulk_chunk"
+		self.SAVEPOINT_BULK_ROW = f"SAVEPOINT bulk_row"
+		self.ROLLBACK_TO_BULK_ROW = f"ROLLBACK TO SAVEPOINT bulk_row"
+
+		# Update campaign SQL
+		self.UPDATE_CAMPAIGN = \
+			f"UPDATE Campaign " \
+			f"SET Campaign_Name = %s, StartDate = %s, EndDate = %s, idCompany = %s, " \
+			f"idCampaign_Category = %s, Budget = %s, Revenue = %s " \
+			f"WHERE idCampaign = %s"
+
+		# Campaign_channel_xref link maintenance; the multi-row VALUES and IN
+		# lists are expanded per call
+		self.SELECT_CHANNEL_IDS_FOR_CAMPAIGN_ID = \
+			f"SELECT idChannel FROM Campaign_channel_xref " \
+			f"WHERE idCampaign = %s"
+
+		self.INSERT_CAMPAIGN_CHANNEL_XREF = \
+			"INSERT INTO Campaign_channel_xref (idChannel, idCampaign) " \
+			"VALUES {values}"
+
+		self.DELETE_CAMPAIGN_CHANNEL_XREF_CHANNELS = \
+			"DELETE FROM Campaign_channel_xref " \
+			"WHERE idCampaign = %s AND idChannel IN ({placeholders})"
+
+		# Delete campaign SQL
+		self.DELETE_CAMPAIGN_CHANNEL_XREF = \
+			f"DELETE FROM campaign_channel_xref " \
+			f"WHERE idCampaign = %s"
+		
+		self.DELETE_CAMPAIGN = \
+			f"DELETE FROM Campaign " \
+			f"WHERE idCampaign = %s"
+
+		# Insert Channel
+		self.INSERT_CHANNEL = \
+			f"INSERT INTO Channel (ChannelName, idChannel_Category) " \
+			f"VALUES (%s, %s)"
+		
+		# Insert Campaign Category
+		self.INSERT_CAMPAIGN_CATEGORY = \
+			f"INSERT INTO Campaign_Category (Campaign_CategoryName) " \
+			f"VALUES (%s)"
+		
+		# Insert Channel Category
+		self.INSERT_CHANNEL_CATEGORY = \
+			f"INSERT INTO Channel_Category (Channel_CategoryName) " \
+			f"VALUES (%s)"
+
+		# Insert Companies
+		self.INSERT_COMPANY = \
+			f"INSERT INTO Company (CompanyName) " \
+			f"VALUES (%s)"
+
+
+	@contextmanager
+	def transaction(self) -> Iterator[UnitOfWork]:
+		"""Routes every wrapper call made by this thread inside the block
+		through one pooled connection and commits once at the end. Any error
+		rolls the whole unit back. Nested blocks join the outer transaction,
+		and streaming reads run on the pinned connection too.
+
+		Wrapper methods log their errors and return None, so a failed call
+		does not end the block. The unit is still rolled back, and
+		TransactionRolledBack is raised when the outermost block exits.
+		set_rollback_only() rolls back without raising.
+		"""
+		unit = getattr(self._local, 'unit_of_work', None)
+		if unit is not None:
+			unit.depth += 1
+			try:
+				yield unit
+			except Exception:
+				unit.set_rollback_only()
+				raise
+			finally:
+				unit.depth -= 1
+			return
+
+		connection = self._get_connection()
+		unit = UnitOfWork(connection)
+		self._local.unit_of_work = unit
+		try:
+			connection.start_transaction()
+			yield unit
+		except Exception:
+			unit.set_rollback_only()
+			raise
+		finally:
+			self._local.unit_of_work = None
+			try:
+				if unit.rollback_only:
+					connection.rollback()
+					self._logger.log_error('transaction: rolled back')
+				else:
+					connection.commit()
+					unit.committed = True
+			finally:
+				connection.close()
+
+		if unit.failed:
+			raise TransactionRolledBack(
+				"A call inside the transaction failed; every change in it was rolled back.")
+		for callback in unit.commit_callbacks:
+			try:
+				callback()
+			except Exception as e:
+				self._logger.log_error('transaction: on_commit callback failed: %s', e)
+
+
+	def current_unit(self) -> UnitOfWork:
+		"""Returns the UnitOfWork this thread is running in, or None."""
+		return getattr(self._local, 'unit_of_work', None)
+
+
+	def pool_stats(self) -> dict:
+		"""Returns the connection pool's occupancy and wait counters."""
+		return self._connection_pool.stats()
+
+
+	def reset_pool_stats(self) -> None:
+		self._connection_pool.reset_stats()
+
+
+	# Lists all campaigns 
+	@timed_operation
+	def select_all_campaigns(self)->List[Campaign]:
+		"""Returns a list of all campaigns with their channels.
+		Campaigns and their Campaign_channel_xref/Channel rows are loaded with
+		two queries on one connection and grouped in memory.
+		"""
+		cursor = None
+		results = None
+		channel_rows = None
+		campaign_list = []
+		try:
+			self._logger.log_debug("Entering campaigns")
+			with self._connection() as connection:
+				cursor = connection.cursor()
+				with cursor:
+					results = self._execute_statement(connection, cursor,
+						self.SELECT_ALL_CAMPAIGNS).fetchall()
+					channel_rows = self._execute_statement(connection, cursor,
+						self.SELECT_CHANNELS_FOR_ALL_CAMPAIGNS).fetchall()
+
+			campaign_list = self._populate_campaign_objects(results)
+			self._attach_channels_to_campaigns(campaign_list, channel_rows)
+			
+			self._logger.log_debug('select_all_campaigns: %s campaigns, %s channel links',
+						len(campaign_list), len(channel_rows))
+			return campaign_list
+		
+		except Exception as e:
+			self._logger.log_error('Problem with select_all_campaigns(): %s', e)
+
+	@timed_operation
+	def select_campaign_by_id(self, idCampaign:int) -> Campaign:
+		"""Returns the campaign with its channels, or None if it does not exist."""
+		cursor = None
+		results = None
+		channel_rows = None
+		try:
+			with self._connection() as connection:
+				cursor = connection.cursor()
+				with cursor:
+					results = self._execute_statement(connection, cursor,
+						self.SELECT_CAMPAIGN_BY_ID, ([idCampaign])).fetchall()
+					if results:
+						channel_rows = self._execute_statement(connection, cursor,
+							self.SELECT_CHANNELS_FOR_CAMPAIGN_ID, ([idCampaign])).fetchall()
+
+			if not results:
+				return None
+			campaign = self._populate_campaign_objects(results)[0]
+			campaign.channel = self._populate_channel_objects(channel_rows)
+			return campaign
+		
+		except Exception as e:
+			self._logger.log_error('select_campaign_by_id: %s', e)
+
+
+	@timed_operation
+	def campaign_exists(self, idCampaign:int) -> bool:
+		"""Returns True if a campaign with the given id exists."""
+		return self._exists(self.SELECT_CAMPAIGN_EXISTS, idCampaign)
+
+
+	@timed_operation
+	def campaign_name_exists(self, campaign_name:str) -> bool:
+		"""Returns True if a campaign with the given name exists."""
+		return self._exists(self.SELECT_CAMPAIGN_NAME_EXISTS, campaign_name)
+
+
+	@timed_operation
+	def select_all_channels_for_campaign_id(self, idCampaign:int) \
+		->List[Channel]:
+		"""Returns a list of all chanels for campaingn id."""
+		cursor = None
+		results = None
+		try:
+			with self._connection() as connection:
+				cursor = connection.cursor()
+				with cursor:
+					results = self._execute_statement(connection, cursor,
+						self.SELECT_CHANNELS_FOR_CAMPAIGN_ID, ([idCampaign])).fetchall()
+			
+			return results
+		
+		except Exception as e:
+			self._logger.log_error('select_all_channels_for_campaign_id: %s', e)
+	
+
+	@timed_operation
+	def select_all_channels(self)->List[Channel]:
+		"""Returns a list of all channels with their category.
+		Categories come from the same joined query, so the cost does not grow
+		with one extra lookup per channel.
+		"""
+		cursor = None
+		results = None
+		channel_list = []
+		try:
+			self._logger.log_debug("Entering channels")
+			with self._connection() as connection:
+				cursor = connection.cursor()
+				with cursor:
+					results = self._execute_statement(connection, cursor,
+						self.SELECT_ALL_CHANNELS_WITH_CATEGORY).fetchall()
+
+			channel_list = self._populate_channel_objects(results)
+			self._attach_categories_to_channels(channel_list, results)
+			
+			self._logger.log_debug('select_all_channels: %s channels', len(channel_list))
+			return channel_list
+		
+		except Exception as e:
+			self._logger.log_error('Problem with select_all_channels(): %s', e)
+		
+	
+	@timed_operation
+	def select_all_categories_for_channel_id(self, idChannel_Category:int) \
+		->List[Campaign_Category]:
+		"""Returns a list of all chanels for campaingn id."""
+		cursor = None
+		results = None
+		try:
+			with self._connection() as connection:
+				cursor = connection.cursor(dictionary = True)
+				with cursor:
+					results = self._execute_statement(connection, cursor,
+						self.SELECT_CAMPAIGN_CATEGORY_FOR_CHANNEL_ID, 
+						([idChannel_Category])).fetchall()
+			
+			return results
+		
+		except Exception as e:
+			self._logger.log_error('select_all_categories_for_channel_id: %s', e)
+
+
+	@timed_operation
+	def select_all_channel_categories(self)->List[Channel_Category]:
+		"""Returns a list of all channels"""
+		cursor = None
+		results = None
+		channel_category_list = []
+		try:
+			self._logger.log_debug("Entering channel categories")
+			with self._connection() as connection:
+				cursor = connection.cursor()
+				with cursor:
+					results = self._execute_statement(connection, cursor,
+						self.SELECT_ALL_CHANNEL_CATEGORY).fetchall()
+					self._logger.log_debug("Channel %s", results)
+					channel_category_list = self._populate_channel_category_objects(results)
+			return channel_category_list
+		except Exception as e:
+			self._logger.log_error('select_all_channel_categories: %s', e)
+
+
+	@timed_operation
+	def select_all_campaign_categories(self)->List[Campaign_Category]:
+		"""Returns a list of all channels"""
+		cursor = None
+		results = None
+		campaign_category_list = []
+		try:
+			self._logger.log_debug("Entering channel categories")
+			with self._connection() as connection:
+				cursor = connection.cursor()
+				with cursor:
+					results = self._execute_statement(connection, cursor,
+						self.SELECT_ALL_CAMPAIGN_CATEGORY).fetchall()
+					self._logger.log_debug("Campaign %s", results)
+					campaign_category_list = self._populate_campaign_category_objects(results)
+			return campaign_category_list
+		except Exception as e:
+			self._logger.log_error('select_all_campaign_categories: %s', e)
+		
+
+	@timed_operation
+	def select_all_companies(self)->List[Company]:
+		"""Returns a list of all channels"""
+		cursor = None
+		results = None
+		company_list = []
+		try:
+			self._logger.log_debug("Entering channel categories")
+			with self._connection() as connection:
+				cursor = connection.cursor()
+				with cursor:
+					results = self._execute_statement(connection, cursor,
+						self.SELECT_ALL_COMPANY).fetchall()
+					self._logger.log_debug("Company %s", results)
+					company_list = self._populate_company_objects(results)
+			return company_list
+		except Exception as e:
+			self._logger.log_error('select_all_companies: %s', e)
+	
+
+	@timed_operation
+	def select_campaigns_page(self, cursor_token:str=None, page_size:int=25) -> Page:
+		"""Returns one page of campaigns, with channels, ordered by idCampaign."""
+		try:
+			with self._connection() as connection:
+				cursor = connection.cursor()
+				with cursor:
+					page, rows = self._select_page(connection, cursor, cursor_token, page_size,
+								self.SELECT_CAMPAIGNS_PAGE_AFTER, 
+								self.SELECT_CAMPAIGNS_PAGE_BEFORE)
+					channel_rows = []
+					if rows:
+						channel_rows = self._execute_statement(connection, cursor,
+							self.SELECT_CHANNELS_FOR_CAMPAIGN_RANGE,
+							(rows[0][0], rows[-1][0])).fetchall()
+
+			page.items = self._populate_campaign_objects(rows)
+			self._attach_channels_to_campaigns(page.items, channel_rows)
+			return page
+		except Exception as e:
+			self._logger.log_error('select_campaigns_page: %s', e)
+
+
+	@timed_operation
+	def select_channels_page(self, cursor_token:str=None, page_size:int=25) -> Page:
+		"""Returns one page of channels, with category, ordered by idChannel."""
+		try:
+			with self._connection() as connection:
+				cursor = connection.cursor()
+				with cursor:
+					page, rows = self._select_page(connection, cursor, cursor_token, page_size,
+								self.SELECT_CHANNELS_PAGE_AFTER, 
+								self.SELECT_CHANNELS_PAGE_BEFORE)
+
+			page.items = self._populate_channel_objects(rows)
+			self._attach_categories_to_channels(page.items, rows)
+			return page
+		except Exception as e:
+			self._logger.log_error('select_channels_page: %s', e)
+
+
+	@timed_operation
+	def select_companies_page(self, cursor_token:str=None, page_size:int=25) -> Page:
+		"""Returns one page of companies ordered by idCompany."""
+		try:
+			with self._connection() as connection:
+				cursor = connection.cursor()
+				with cursor:
+					page, rows = self._select_page(connection, cursor, cursor_token, page_size,
+								self.SELECT_COMPANIES_PAGE_AFTER, 
+								self.SELECT_COMPANIES_PAGE_BEFORE)
+
+			page.items = self._populate_company_objects(rows)
+			return page
+		except Exception as e:
+			self._logger.log_error('select_companies_page: %s', e)
+
+
+	@timed_operation
+	def select_campaign_rows(self, named:bool=False) ->List[tuple]:
+		"""Returns every campaign as a SELECT_ALL_CAMPAIGNS row tuple, or as a
+		CampaignRow namedtuple with named=True. No channels and no Campaign
+		objects are built, for callers that only read the columns.
+		"""
+		try:
+			with self._connection() as connection:
+				cursor = connection.cursor()
+				with cursor:
+					rows = self._execute_statement(connection, cursor,
+						self.SELECT_ALL_CAMPAIGNS).fetchall()
+			return named_rows(CampaignRow, rows) if named else rows
+		except Exception as e:
+			self._logger.log_error('select_campaign_rows: %s', e)
+
+
+	@timed_operation
+	def select_campaign_columns(self, backend:str=None) ->CampaignTable:
+		"""Returns every campaign as a CampaignTable: IDs, date ordinals and
+		money in cents as contiguous columns, for vectorized aggregation.
+		The database does the unit conversion, so no date, Decimal, Campaign
+		or channel objects are built.
+		"""
+		try:
+			with self._connection() as connection:
+				cursor = connection.cursor()
+				with cursor:
+					rows = self._execute_statement(connection, cursor,
+						self.SELECT_CAMPAIGN_COLUMNS).fetchall()
+			return self._populate_campaign_table(rows, backend)
+		except Exception as e:
+			self._logger.log_error('select_campaign_columns: %s', e)
+
+
+	@timed_operation
+	def select_campaign_channel_links(self) ->List[tuple]:
+		"""Returns every Campaign_channel_xref row as an (idCampaign,
+		idChannel) tuple
+		"""
+		try:
+			with self._connection() as connection:
+				cursor = connection.cursor()
+				with cursor:
+					return self._execute_statement(connection, cursor,
+						self.SELECT_ALL_CAMPAIGN_CHANNEL_LINKS).fetchall()
+		except Exception as e:
+			self._logger.log_error('select_campaign_channel_links: %s', e)
+
+
+	@timed_operation
+	def select_channel_rows(self, named:bool=False) ->List[tuple]:
+		"""Returns every channel as an (idChannel, ChannelName, 
+		idChannel_Category, Channel_CategoryName) tuple, or as a ChannelRow
+		namedtuple with named=True.
+		"""
+		try:
+			with self._connection() as connection:
+				cursor = connection.cursor()
+				with cursor:
+					rows = self._execute_statement(connection, cursor,
+						self.SELECT_ALL_CHANNELS_WITH_CATEGORY).fetchall()
+			return named_rows(ChannelRow, rows) if named else rows
+		except Exception as e:
+			self._logger.log_error('select_channel_rows: %s', e)
+
+
+	@timed_operation
+	def stream_campaigns_with_channels(self, fetch_size:int=None) \
+		->Iterator[Tuple[tuple, List[tuple]]]:
+		"""Yields (campaign row, [channel rows]) one campaign at a time.
+		Campaign rows follow SELECT_ALL_CAMPAIGNS column order and channel rows
+		(idChannel, ChannelName, idChannel_Category).
+		"""
+		rows = self._stream_query(self.STREAM_CAMPAIGNS_WITH_CHANNELS, fetch_size)
+		for campaign_row, group in groupby(rows, key=lambda row: row[:9]):
+			yield campaign_row, [row[9:] for row in group if row[9] is not None]
+
+
+	@timed_operation
+	def stream_channels(self, fetch_size:int=None) ->Iterator[tuple]:
+		"""Yields (idChannel, ChannelName, idChannel_Category, 
+		Channel_CategoryName) rows as they arrive.
+		"""
+		return self._stream_query(self.STREAM_CHANNELS, fetch_size)
+
+
+	@timed_operation
+	def stream_companies(self, fetch_size:int=None) ->Iterator[tuple]:
+		"""Yields (idCompany, CompanyName) rows as they arrive."""
+		return self._stream_query(self.STREAM_COMPANIES, fetch_size)
+
+
+	@timed_operation
+	def create_campaign(self, campaign:Campaign)->Campaign:
+		"""Create a new record in the campaign table"""
+		cursor = None
+		try:
+			with self._connection() as connection:
+				cursor = connection.cursor()
+				with cursor:
+					statement = self._execute_statement(connection, cursor,
+						self.INSERT_CAMPAIGN, 
+						(
+							[
+								campaign.Campaign_Name, 
+								campaign.StartDate,
+								campaign.EndDate, 
+								campaign.idCompany,
+								campaign.idCampaign_Category,
+								campaign.Budget,
+								campaign.Revenue
+							]
+						)
+					)
+					self._commit(connection)
+					self._logger.log_debug('Updated %s row.', statement.rowcount)
+					self._logger.log_debug('Last Row ID: %s.', statement.lastrowid)
+					campaign.idCampaign = statement.lastrowid
+
+			return campaign
+
+		except Exception as e:
+			self._logger.log_error('create_campaign: %s', e)
+
+
+	@timed_operation
+	def create_campaigns(self, campaigns:List[Campaign], chunk_size:int=None,
+					  stop_on_error:bool=False) -> BulkInsertResult:
+		"""Inserts campaigns with batched multi-row INSERTs in one transaction.
+		Generated ids are set on the campaign objects. A failing chunk is rolled
+		back to its savepoint and retried row by row so only the bad rows are
+		reported; with stop_on_error the whole batch is rolled back instead.
+		"""
+		result = BulkInsertResult()
+		chunk_size = chunk_size or self.BULK_CHUNK_SIZE
+		try:
+			with self._connection() as connection:
+				cursor = connection.cursor()
+				with cursor:
+					self._begin(connection)
+					self._execute_statement(connection, cursor, self.SAVEPOINT_BULK_BATCH)
+
+					for start in range(0, len(campaigns), chunk_size):
+						chunk = campaigns[start:start + chunk_size]
+						self._execute_statement(connection, cursor, self.SAVEPOINT_BULK_CHUNK)
+						try:
+							self._insert_campaign_chunk(connection, cursor, chunk)
+							result.inserted.extend(chunk)
+						except self.DATABASE_ERROR as err:
+							self._logger.log_debug('create_campaigns: chunk at %s ' \
+								'failed, retrying row by row: %s', start, err)
+							self._execute_statement(connection, cursor, 
+								self.ROLLBACK_TO_BULK_CHUNK)
+							if not self._insert_campaigns_row_by_row(connection, cursor, chunk, 
+										start, result, stop_on_error):
+								self._execute_statement(connection, cursor, 
+									self.ROLLBACK_TO_BULK_BATCH)
+								for campaign in result.inserted:
+									campaign.idCampaign = 0
+								result.inserted = []
+								result.rolled_back = True
+								break
+
+				self._commit(connection)
+			self._logger.log_debug('create_campaigns: %s', result)
+			return result
+
+		except Exception as e:
+			self._logger.log_error('create_campaigns: %s', e)
+
+
+	@timed_operation
+	def update_campaign(self, campaign: Campaign) -> Campaign:
+		"""Update an existing campaign in the database."""
+		try:
+			with self._connection() as connection:
+				cursor = connection.cursor()
+				with cursor:
+					statement = self._execute_statement(connection, cursor,
+						self.UPDATE_CAMPAIGN, 
+						(
+							campaign.Campaign_Name,
+							campaign.StartDate,
+							campaign.EndDate,
+							campaign.idCompany,
+							campaign.idCampaign_Category,
+							campaign.Budget,
+							campaign.Revenue,
+							campaign.idCampaign
+						)
+					)
+				self._commit(connection)
+				self._logger.log_debug("Updated %s campaign(s) with id %s", statement.rowcount, campaign.idCampaign)
+			return campaign
+		except Exception as e:
+			self._logger.log_error("update_campaign: %s", e)
+	
+	
+	@timed_operation
+	def delete_campaign(self, idcampaign: int):
+		"""Delete campaign"""
+		try:
+			with self._connection() as connection:
+				cursor = connection.cursor()
+				with cursor:
+					self._execute_statement(connection, cursor,
+						self.DELETE_CAMPAIGN_CHANNEL_XREF,
+						(
+							idcampaign,
+	   					)
+					)
+					statement = self._execute_statement(connection, cursor,
+						self.DELETE_CAMPAIGN,
+						(
+							idcampaign,
+						)
+					)
+				self._commit(connection)
+			return statement.rowcount > 0
+		except Exception as e:
+			self._logger.log_error("delete_campaign: %s", e)
+		
+
+	@timed_operation
+	def link_channels(self, idCampaign:int, channel_ids:List[int]) -> dict:
+		"""Adds the channels to the campaign, skipping existing links."""
+		return self._update_channel_links(idCampaign, channel_ids, 'link')
+
+
+	@timed_operation
+	def unlink_channels(self, idCampaign:int, channel_ids:List[int]) -> dict:
+		"""Removes the channels from the campaign."""
+		return self._update_channel_links(idCampaign, channel_ids, 'unlink')
+
+
+	@timed_operation
+	def replace_channels(self, idCampaign:int, channel_ids:List[int]) -> dict:
+		"""Makes channel_ids the campaign's exact channel set."""
+		return self._update_channel_links(idCampaign, channel_ids, 'replace')
+
+
+	@timed_operation
+	def create_campaign_channel_links(self, links:List[Tuple[int, int]], 
+									chunk_size:int=None) -> int:
+		"""Inserts (idCampaign, idChannel) pairs with multi-row INSERTs in one
+		transaction. Returns the number of links written.
+		"""
+		chunk_size = chunk_size or self.BULK_CHUNK_SIZE
+		try:
+			with self._connection() as connection:
+				cursor = connection.cursor()
+				with cursor:
+					self._begin(connection)
+					for start in range(0, len(links), chunk_size):
+						chunk = links[start:start + chunk_size]
+						params = []
+						for idCampaign, idChannel in chunk:
+							params.extend((idChannel, idCampaign))
+						self._execute_statement(connection, cursor,
+							self.INSERT_CAMPAIGN_CHANNEL_XREF.format(
+								values=', '.join(['(%s, %s)'] * len(chunk))),
+							params)
+				self._commit(connection)
+			return len(links)
+		except Exception as e:
+			self._logger.log_error('create_campaign_channel_links: %s', e)
+
+
+	@timed_operation
+	def create_channel(self, channel: Channel) -> Channel:
+		"""Add a new channel if it doesn't already exist"""
+		try:
+			with self._connection() as connection:
+				cursor = connection.cursor()
+				with cursor:
+					statement = self._execute_statement(connection, cursor,
+						self.INSERT_CHANNEL, 
+						(
+							[
+								channel.ChannelName,
+								channel.idChannel_Category
+							]
+						)
+					)
+				self._commit(connection)
+				channel.idChannel = statement.lastrowid
+				self._logger.log_debug('Updated %s row.', statement.rowcount)
+				self._logger.log_debug('Last Row ID: %s.', statement.lastrowid)
+			return channel
+		except Exception as e:
+			self._logger.log_error("create_channel: %s", e)
+	
+
+	@timed_operation
+	def create_campaign_category(self, category: Campaign_Category) -> Campaign_Category:
+		"""Create a new campaign category record"""
+		try:
+			with self._connection() as connection:
+				cursor = connection.cursor()
+				with cursor:
+					statement = self._execute_statement(connection, cursor,
+						self.INSERT_CAMPAIGN_CATEGORY, 
+						(
+							category.Campaign_CategoryName,
+						)
+					)
+					self._commit(connection)
+					category.idCampaign_Category = statement.lastrowid
+			return category
+		except Exception as e:
+			self._logger.log_error("create_campaign_category: %s", e)
+
+	
+	@timed_operation
+	def create_channel_category(self, category: Channel_Category) -> Channel_Category:
+		"""Create a new channel category record"""
+		try:
+			with self._connection() as connection:
+				cursor = connection.cursor()
+				with cursor:
+					statement = self._execute_statement(connection, cursor,
+						self.INSERT_CHANNEL_CATEGORY, 
+						(
+							category.Channel_CategoryName,
+						)
+					)
+					self._commit(connection)
+					category.idChannel_Category = statement.lastrowid
+			return category
+		except Exception as e:
+			self._logger.log_error("create_channel_category: %s", e)
+		
+
+	@timed_operation
+	def create_company(self, company: Company) -> Company:
+		"""Create a new company record"""
+		try:
+			with self._connection() as connection:
+				cursor = connection.cursor()
+				with cursor:
+					statement = self._execute_statement(connection, cursor,
+						self.INSERT_COMPANY, 
+						(
+							company.CompanyName,
+						)
+					)
+					self._commit(connection)
+					company.idCompany = statement.lastrowid
+			return company
+		except Exception as e:
+			self._logger.log_error("create_company: %s", e)
+	
+
+			
+		##### Private Utility Methods #####
+
+	@abstractmethod
+	def _initialize_database_connection_pool(self, config:dict):
+		"""Creates the backend's pool. Its get_connection() must return a
+		DB-API style connection usable as a context manager that releases it;
+		stats() and reset_stats() report checkouts and waits.
+		"""
+
+
+	@abstractmethod
+	def _insert_campaign_chunk(self, connection, cursor, chunk:List[Campaign]) -> None:
+		"""Inserts the chunk with one batched statement and sets each 
+		campaign's generated idCampaign. Raises DATABASE_ERROR on failure.
+		"""
+
+
+	@timed_phase('hydrate')
+	def _populate_campaign_objects(self, results:List) -> List[Campaign]:
+		""" Populates and returns a list of Campaign Objects. """
+		try:
+			return hydrate_campaigns(results)
+		except Exception as e:
+			self._logger.log_error('_populate_campaign_objects: %s', e)
+	
+
+	@timed_phase('hydrate')
+	def _populate_campaign_table(self, results:List, backend:str=None) -> CampaignTable:
+		""" Loads SELECT_CAMPAIGN_COLUMNS rows into a CampaignTable. """
+		try:
+			return CampaignTable.from_scaled_rows(results, backend)
+		except Exception as e:
+			self._logger.log_error('_populate_campaign_table: %s', e)
+
+
+	@logged_statement
+	@timed_phase('execute')
+	def _execute_statement(self, connection, cursor, query:str, params=None):
+		"""Executes query and returns the cursor holding its result."""
+		cursor.execute(query, params)
+		return cursor
+
+
+	def _get_connection(self):
+		"""Checks a connection out of the pool, recording the wait."""
+		if self.metrics is None:
+			return self._connection_pool.get_connection()
+		started = time.perf_counter()
+		connection = self._connection_pool.get_connection()
+		self.metrics.observe_phase('pool_wait', time.perf_counter() - started)
+		return connection
+
+
+	@timed_phase('execute')
+	def _executemany(self, cursor, query:str, seq_of_params) -> None:
+		"""Runs cursor.executemany(), recorded as execute time."""
+		if self.slow_query_log is None:
+			cursor.executemany(query, seq_of_params)
+			return
+		started = time.perf_counter()
+		cursor.executemany(query, seq_of_params)
+		self.slow_query_log.record(self, None, query, seq_of_params, 
+			time.perf_counter() - started, len(seq_of_params), many=True)
+
+
+	def _explain(self, connection, query:str, params=None) -> str:
+		"""Returns the backend's plan for query as indented text lines."""
+		cursor = connection.cursor()
+		with cursor:
+			cursor.execute(self.EXPLAIN_PREFIX + query, params)
+			columns = [d[0] for d in cursor.description]
+			rows = cursor.fetchall()
+		lines = ['    ' + ' | '.join(columns)]
+		lines += ['    ' + ' | '.join(str(value) for value in row) for row in rows]
+		return '\n'.join(lines)
+
+
+	@contextmanager
+	def _connection(self):
+		"""Yields the connection pinned by transaction(), or checks one out of
+		the pool and returns it when the block exits. An error escaping the
+		block, or a failed checkout, marks the running method's call as an
+		error in the query metrics.
+		"""
+		unit = getattr(self._local, 'unit_of_work', None)
+		if unit is not None:
+			try:
+				yield unit.connection
+			except Exception:
+				unit.mark_failed()
+				self._mark_error()
+				raise
+			return
+
+		try:
+			connection = self._get_connection()
+			with connection:
+				yield connection
+		except Exception:
+			self._mark_error()
+			raise
+
+
+	def _mark_error(self) -> None:
+		if self.metrics is not None:
+			self.metrics.mark_error()
+
+
+	def _begin(self, connection) -> None:
+		"""Starts a transaction unless one is already pinned."""
+		if getattr(self._local, 'unit_of_work', None) is None:
+			connection.start_transaction()
+
+
+	def _commit(self, connection) -> None:
+		"""Commits unless the connection belongs to a transaction() block."""
+		if getattr(self._local, 'unit_of_work', None) is None:
+			connection.commit()
+
+
+	def _stream_query(self, query:str, fetch_size:int=None) ->Iterator[tuple]:
+		"""Runs query on an unbuffered cursor and yields rows fetched in 
+		fetch_size batches, so only one batch is held in memory. The pooled
+		connection is held until the generator is exhausted or closed.
+		Inside transaction() the pinned connection is used, with a buffered
+		cursor so the unit's other statements can run while it is read, and
+		the rows include the unit's uncommitted writes.
+		"""
+		fetch_size = fetch_size or self.STREAM_FETCH_SIZE
+		pinned = getattr(self._local, 'unit_of_work', None) is not None
+		with self._connection() as connection:
+			cursor = connection.cursor(buffered=pinned)
+			with cursor:
+				result = self._execute_statement(connection, cursor, query)
+				while True:
+					rows = result.fetchmany(fetch_size)
+					if not rows:
+						break
+					yield from rows
+
+
+	def _update_channel_links(self, idCampaign:int, channel_ids:List[int], 
+						   mode:str) -> dict:
+		"""Diffs channel_ids against the current links and applies the change
+		with at most one multi-row DELETE and one multi-row INSERT, committed 
+		together. Returns the channel ids that were linked and unlinked.
+		"""
+		requested = list(dict.fromkeys(int(i) for i in channel_ids))
+		changes = {'linked': [], 'unlinked': []}
+		try:
+			with self._connection() as connection:
+				cursor = connection.cursor()
+				with cursor:
+					existing = {row[0] for row in self._execute_statement(connection, cursor,
+						self.SELECT_CHANNEL_IDS_FOR_CAMPAIGN_ID, ([idCampaign])).fetchall()}
+
+					if mode == 'unlink':
+						changes['unlinked'] = [i for i in requested if i in existing]
+					else:
+						changes['linked'] = [i for i in requested if i not in existing]
+					if mode == 'replace':
+						wanted = set(requested)
+						changes['unlinked'] = sorted(i for i in existing if i not in wanted)
+
+					if changes['unlinked']:
+						placeholders = ', '.join(['%s'] * len(changes['unlinked']))
+						self._execute_statement(connection, cursor,
+							self.DELETE_CAMPAIGN_CHANNEL_XREF_CHANNELS.format(
+								placeholders=placeholders),
+							[idCampaign] + changes['unlinked'])
+					if changes['linked']:
+						values = ', '.join(['(%s, %s)'] * len(changes['linked']))
+						params = []
+						for idChannel in changes['linked']:
+							params.extend((idChannel, idCampaign))
+						self._execute_statement(connection, cursor,
+							self.INSERT_CAMPAIGN_CHANNEL_XREF.format(values=values),
+							params)
+				self._commit(connection)
+			self._logger.log_debug('%s_channels(%s): %s', mode, idCampaign, changes)
+			return changes
+		except Exception as e:
+			self._logger.log_error('%s_channels: %s', mode, e)
+
+
+	def _campaign_insert_params(self, campaign:Campaign) -> tuple:
+		"""Returns the INSERT_CAMPAIGN parameters for a campaign."""
+		return (campaign.Campaign_Name, campaign.StartDate, campaign.EndDate, 
+				campaign.idCompany, campaign.idCampaign_Category, 
+				campaign.Budget, campaign.Revenue)
+
+
+	def _insert_campaigns_row_by_row(self, connection, cursor, chunk:List[Campaign], 
+								  start:int, result:BulkInsertResult,
+								  stop_on_error:bool) -> bool:
+		"""Inserts a chunk one row at a time behind per-row savepoints.
+		Returns False if a row failed and stop_on_error is set.
+		"""
+		for offset, campaign in enumerate(chunk):
+			self._execute_statement(connection, cursor, self.SAVEPOINT_BULK_ROW)
+			try:
+				statement = self._execute_statement(connection, cursor, 
+					self.INSERT_CAMPAIGN, self._campaign_insert_params(campaign))
+				campaign.idCampaign = statement.lastrowid
+				result.inserted.append(campaign)
+			except self.DATABASE_ERROR as err:
+				self._execute_statement(connection, cursor, self.ROLLBACK_TO_BULK_ROW)
+				result.add_failure(start + offset, campaign, err)
+				if stop_on_error:
+					return False
+		return True
+
+
+	def _select_page(self, connection, cursor, cursor_token:str, page_size:int, 
+				  after_query:str, before_query:str, key=0):
+		"""Runs a keyset page query and returns (Page, rows in key order).
+		`key` is the row index (or dictionary key) of the seek column.
+		"""
+		direction, seek_key = Page.decode_cursor(cursor_token)
+		page = Page()
+		page.page_size = page_size
+
+		query = after_query if direction == 'n' else before_query
+		rows = self._execute_statement(connection, cursor, query, 
+			(seek_key, page_size + 1)).fetchall()
+		has_more = len(rows) > page_size
+		rows = rows[:page_size]
+
+		if direction == 'n':
+			if has_more:
+				page.next_cursor = Page.encode_cursor('n', rows[-1][key])
+			if cursor_token:
+				page.prev_cursor = Page.encode_cursor('p', rows[0][key] if rows else seek_key + 1)
+		else:
+			rows.reverse()
+			if has_more:
+				page.prev_cursor = Page.encode_cursor('p', rows[0][key])
+			page.next_cursor = Page.encode_cursor('n', rows[-1][key] if rows else seek_key - 1)
+
+		return page, rows
+
+
+	def _exists(self, query:str, value) -> bool:
+		"""Runs a single-parameter SELECT 1 ... LIMIT 1 existence query."""
+		cursor = None
+		try:
+			with self._connection() as connection:
+				cursor = connection.cursor()
+				with cursor:
+					return len(self._execute_statement(connection, cursor, 
+						query, ([value])).fetchall()) > 0
+		except Exception as e:
+			self._logger.log_error('_exists: %s', e)
+			return False
+
+
+	@timed_phase('hydrate')
+	def _attach_channels_to_campaigns(self, campaign_list:List[Campaign], 
+								   channel_rows:List) -> None:
+		"""Groups (idCampaign, idChannel, ChannelName, idChannel_Category) rows
+		into the channel list of the matching campaign.
+		"""
+		channels_by_campaign = {campaign.idCampaign: campaign.channel 
+						  for campaign in campaign_list}
+		for row, channel in zip(channel_rows, hydrate_channels(channel_rows, skip=1)):
+			channels = channels_by_campaign.get(row[0])
+			if channels is not None:
+				channels.append(channel)
+	
+
+	@timed_phase('hydrate')
+	def _attach_categories_to_channels(self, channel_list:List[Channel], 
+									results:List) -> None:
+		"""Fills Channel.CategoryName from (idChannel, ChannelName, 
+		idChannel_Category, Channel_CategoryName) rows. Every channel in a
+		category shares one (category,) tuple holding the interned
+		Channel_Category instance.
+		"""
+		category_map = {}
+		for channel, row in zip(channel_list, results):
+			categories = category_map.get(row[2])
+			if categories is None:
+				categories = (Channel_Category.interned(row[2], row[3]),)
+				category_map[row[2]] = categories
+			channel.CategoryName = categories
+	
+
+	@timed_phase('hydrate')
+	def _populate_company_objects(self, results:List) ->List[Company]:
+		"""Populate and returns a list of company objects"""
+		try:
+			return hydrate_companies(results)
+		
+		except Exception as e:
+			self._logger.log_error('_populate_company_objects: %s', e)
+	
+
+	@timed_phase('hydrate')
+	def _populate_channel_objects(self, results:List) ->List[Channel]:
+		"""Populate and returns a list of channel objects"""
+		try:
+			return hydrate_channels(results)
+		
+		except Exception as e:
+			self._logger.log_error('_populate_channel_objects: %s', e)
+
+
+	@timed_phase('hydrate')
+	def _populate_channel_category_objects(self, results:List) ->List[Channel_Category]:
+		"""Populate and returns a list of channel category objects"""
+		try:
+			return hydrate_channel_categories(results)
+		
+		except Exception as e:
+			self._logger.log_error('_populate_channel_category_objects: %s', e)
+	
+	
+	@timed_phase('hydrate')
+	def _populate_campaign_category_objects(self, results:List) ->List[Campaign_Category]:
+		"""Populate and returns a list of campaign category objects"""
+		try:
+			return hydrate_campaign_categories(results)
+		
+		except Exception as e:
+			self._logger.log_error('_populate_campaign_category_objects: %s', e)
\ No newline at end of file
@@ -0,0 +1,266 @@
+"""Defines the QueryMetrics class and the wrapper instrumentation decorators."""
+
+import threading
+import time
+from bisect import bisect_left
+from functools import wraps
+from inspect import isgenerator
+
+from campaign_app.infrastructure_layer.page import Page
+from campaign_app.infrastructure_layer.bulk_insert_result import BulkInsertResult
+from campaign_app.infrastructure_layer.campaign_table import CampaignTable
+
+
+# Upper bounds in seconds, Prometheus style; the last bucket is +Inf
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+                   0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+PHASES = ('total', 'pool_wait', 'execute', 'hydrate')
+
+
+class LatencyHistogram():
+    """Fixed-bucket latency histogram."""
+
+    def __init__(self) -> None:
+        """Initializes object. """
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds:float) -> None:
+        self.counts[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def quantile(self, q:float):
+        """Returns the upper bound of the bucket holding quantile q"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float('inf')
+
+    def to_json(self) -> dict:
+        def ms(seconds):
+            return None if seconds is None else round(seconds * 1000, 3)
+        cumulative = []
+        seen = 0
+        for count in self.counts:
+            seen += count
+            cumulative.append(seen)
+        return {
+            'count': self.count,
+            'sum_ms': ms(self.sum),
+            'mean_ms': ms(self.sum / self.count) if self.count else None,
+            'p50_le_ms': ms(self.quantile(0.5)),
+            'p95_le_ms': ms(self.quantile(0.95)),
+            'p99_le_ms': ms(self.quantile(0.99)),
+            'buckets': {**{str(b): c for b, c in zip(LATENCY_BUCKETS, cumulative)},
+                        '+Inf': cumulative[-1]}
+        }
+
+
+class MethodMetrics():
+    """Counters and phase histograms for one wrapper method."""
+
+    def __init__(self) -> None:
+        """Initializes object. """
+        self.calls = 0
+        self.errors = 0
+        self.rows = 0
+        self.histograms = {phase: LatencyHistogram() for phase in PHASES}
+
+    def to_json(self) -> dict:
+        return {'calls': self.calls, 'errors': self.errors, 'rows': self.rows,
+                **{phase: h.to_json() for phase, h in self.histograms.items()}}
+
+
+class QueryMetrics():
+    """Per-method call counts, row counts and latency histograms for the
+    total call, pool wait, SQL execution and object hydration. Phases are
+    attributed to the outermost instrumented method running on the thread;
+    total minus the phases is fetch and other overhead.
+    """
+
+    PROMETHEUS_PREFIX = 'campaign_db'
+
+    def __init__(self) -> None:
+        """Initializes object. """
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._methods = {}
+        self.started = time.time()
+
+    def current_method(self):
+        return getattr(self._local, 'method', None)
+
+    def mark_error(self) -> None:
+        """Flags the running method's call as failed. Wrapper methods catch
+        and log their exceptions, so the decorator cannot see them raise.
+        """
+        if getattr(self._local, 'method', None) is not None:
+            self._local.error = True
+
+    def _take_error(self) -> bool:
+        error = getattr(self._local, 'error', False)
+        self._local.error = False
+        return error
+
+    def observe_phase(self, phase:str, seconds:float) -> None:
+        """Records a pool_wait/execute/hydrate duration for the running method"""
+        method = getattr(self._local, 'method', None) or 'other'
+        with self._lock:
+            self._method(method).histograms[phase].observe(seconds)
+
+    def record_call(self, method:str, seconds:float, rows:int, error:bool=False) -> None:
+        with self._lock:
+            metrics = self._method(method)
+            metrics.calls += 1
+            metrics.rows += rows
+            if error:
+                metrics.errors += 1
+            metrics.histograms['total'].observe(seconds)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._methods = {}
+            self.started = time.time()
+
+    def to_json(self) -> dict:
+        with self._lock:
+            return {'uptime_seconds': round(time.time() - self.started, 1),
+                    'methods': {name: m.to_json() for name, m in sorted(self._methods.items())}}
+
+    def to_prometheus(self) -> str:
+        """Returns the metrics in the Prometheus text exposition format"""
+        p = self.PROMETHEUS_PREFIX
+        lines = [f'# HELP {p}_calls_total Persistence wrapper method calls.',
+                 f'# TYPE {p}_calls_total counter']
+        with self._lock:
+            methods = sorted(self._methods.items())
+            for name, m in methods:
+                lines.append(f'{p}_calls_total{{method="{name}"}} {m.calls}')
+            lines += [f'# HELP {p}_errors_total Calls that raised.',
+                      f'# TYPE {p}_errors_total counter']
+            for name, m in methods:
+                lines.append(f'{p}_errors_total{{method="{name}"}} {m.errors}')
+            lines += [f'# HELP {p}_rows_total Rows or objects returned.',
+                      f'# TYPE {p}_rows_total counter']
+            for name, m in methods:
+                lines.append(f'{p}_rows_total{{method="{name}"}} {m.rows}')
+            lines += [f'# HELP {p}_phase_seconds Latency by method and phase.',
+                      f'# TYPE {p}_phase_seconds histogram']
+            for name, m in methods:
+                for phase, h in m.histograms.items():
+                    if not h.count:
+                        continue
+                    labels = f'method="{name}",phase="{phase}"'
+                    seen = 0
+                    for bound, count in zip(LATENCY_BUCKETS, h.counts):
+                        seen += count
+                        lines.append(f'{p}_phase_seconds_bucket{{{labels},le="{bound}"}} {seen}')
+                    lines.append(f'{p}_phase_seconds_bucket{{{labels},le="+Inf"}} {h.count}')
+                    lines.append(f'{p}_phase_seconds_sum{{{labels}}} {h.sum:.6f}')
+                    lines.append(f'{p}_phase_seconds_count{{{labels}}} {h.count}')
+        return '\n'.join(lines) + '\n'
+
+    def _method(self, name:str) -> MethodMetrics:
+        metrics = self._methods.get(name)
+        if metrics is None:
+            metrics = MethodMetrics()
+            self._methods[name] = metrics
+        return metrics
+
+    def _track_stream(self, name:str, rows, started:float):
+        """Wraps a streaming result so its rows and run time are recorded
+        when the consumer finishes or closes it
+        """
+        count = 0
+        error = False
+        self._local.error = False
+        try:
+            while True:
+                self._local.method = name
+                try:
+                    row = next(rows)
+                except StopIteration:
+                    break
+                finally:
+                    self._local.method = None
+                count += 1
+                yield row
+        except Exception:
+            error = True
+            raise
+        finally:
+            error = self._take_error() or error
+            self.record_call(name, time.perf_counter() - started, count, error)
+
+
+def count_rows(result) -> int:
+    """Number of rows or objects a wrapper method returned"""
+    if result is None or isinstance(result, bool):
+        return 0
+    if isinstance(result, int):
+        return result
+    if isinstance(result, (list, tuple, CampaignTable)):
+        return len(result)
+    if isinstance(result, Page):
+        return len(result.items)
+    if isinstance(result, BulkInsertResult):
+        return len(result.inserted)
+    if isinstance(result, dict):
+        return sum(len(v) for v in result.values() if isinstance(v, list))
+    return 1
+
+
+def timed_operation(func):
+    """Records calls, rows and total latency of a public wrapper method.
+    Calls made from inside another instrumented method count toward it.
+    A call is an error if it raised or mark_error() was called during it.
+    """
+    name = func.__name__
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        metrics = self.metrics
+        if metrics is None or metrics.current_method() is not None:
+            return func(self, *args, **kwargs)
+        metrics._local.method = name
+        metrics._local.error = False
+        started = time.perf_counter()
+        try:
+            result = func(self, *args, **kwargs)
+        except Exception:
+            metrics._local.method = None
+            metrics._take_error()
+            metrics.record_call(name, time.perf_counter() - started, 0, True)
+            raise
+        metrics._local.method = None
+        error = metrics._take_error()
+        if isgenerator(result):
+            return metrics._track_stream(name, result, started)
+        metrics.record_call(name, time.perf_counter() - started, count_rows(result), error)
+        return result
+    return wrapper
+
+
+def timed_phase(phase:str):
+    """Records the decorated helper's run time as phase of the running method"""
+    def decorate(func):
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            metrics = self.metrics
+            if metrics is None:
+                return func(self, *args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                metrics.observe_phase(phase, time.perf_counter() - started)
+        return wrapper
+    return decorate
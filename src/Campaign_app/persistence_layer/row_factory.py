@@ -0,0 +1,164 @@
+"""Defines the result column Enums, the row namedtuples and the cached
+row-to-object factories used to hydrate query results.
+"""
+
+import threading
+from collections import deque, namedtuple
+from enum import Enum
+from itertools import repeat, starmap
+from operator import itemgetter
+
+from campaign_app.infrastructure_layer.campaign_category import Campaign_Category
+from campaign_app.infrastructure_layer.campaign import Campaign
+from campaign_app.infrastructure_layer.channel_category import Channel_Category
+from campaign_app.infrastructure_layer.channel import Channel
+from campaign_app.infrastructure_layer.company import Company
+
+
+# Column positions of the SELECT lists the wrapper hydrates from
+CampaignColumns = Enum('CampaignColumns', [
+    ('idCampaign', 0),
+    ('Campaign_Name', 1),
+    ('StartDate', 2),
+    ('EndDate', 3),
+    ('idCompany', 4),
+    ('idCampaign_Category', 5),
+    ('Budget', 6),
+    ('Revenue', 7),
+    ('NetProfit', 8)
+])
+
+ChannelColumns = Enum('ChannelColumns', [
+    ('idChannel', 0),
+    ('ChannelName', 1),
+    ('idChannel_Category', 2)
+])
+
+CompanyColumns = Enum('CompanyColumns', [
+    ('idCompany', 0),
+    ('CompanyName', 1)
+])
+
+CampaignCategoryColumns = Enum('CampaignCategoryColumns', [
+    ('idCampaign_Category', 0),
+    ('Campaign_CategoryName', 1)
+])
+
+ChannelCategoryColumns = Enum('ChannelCategoryColumns', [
+    ('idChannel_Category', 0),
+    ('Channel_CategoryName', 1)
+])
+
+
+def column_names(columns) -> tuple:
+    """Returns the attribute names of a column Enum in position order"""
+    return tuple(c.name for c in sorted(columns, key=lambda c: c.value))
+
+
+CAMPAIGN_FIELDS = column_names(CampaignColumns)
+CHANNEL_FIELDS = column_names(ChannelColumns)
+COMPANY_FIELDS = column_names(CompanyColumns)
+CAMPAIGN_CATEGORY_FIELDS = column_names(CampaignCategoryColumns)
+CHANNEL_CATEGORY_FIELDS = column_names(ChannelCategoryColumns)
+
+# Lightweight rows for callers that do not need domain objects
+CampaignRow = namedtuple('CampaignRow', CAMPAIGN_FIELDS)
+ChannelRow = namedtuple('ChannelRow', CHANNEL_FIELDS + ('Channel_CategoryName',))
+
+
+_factories = {}
+_factories_lock = threading.Lock()
+
+
+def row_factory(cls, fields:tuple, width:int=None, defaults:dict=None):
+    """Returns the function turning a list of rows into cls instances for
+    one query shape: fields[i] is the attribute set from column i (None
+    skips it), width the row length. Factories are built on first use and
+    cached per shape.
+
+    Instances are created without calling __init__, so every slot that no
+    column fills needs an entry in defaults. A default is used as is, or
+    called for a fresh value if it is callable (e.g. list).
+    """
+    width = width or len(fields)
+    defaults = defaults or {}
+    key = (cls, fields, width, tuple(defaults.items()))
+    factory = _factories.get(key)
+    if factory is None:
+        factory = _build(cls, fields, defaults)
+        with _factories_lock:
+            _factories[key] = factory
+    return factory
+
+
+def _build(cls, fields:tuple, defaults:dict):
+    """Builds the hydration function for one query shape. Instances are
+    created with __new__, then filled a column at a time: each column is
+    assigned to every instance with one map() over the attribute's slot
+    descriptor, so the per-row work stays in C.
+    """
+    names = [field for field in fields if field is not None] + list(defaults)
+    slots = [s for s in getattr(cls, '__slots__', ()) if s != '__weakref__']
+    missing = [s for s in slots if s not in names]
+    if missing:
+        raise ValueError(f"{cls.__name__} factory leaves {missing} unset; add defaults.")
+    columns = [(itemgetter(i), _setter(cls, field))
+               for i, field in enumerate(fields) if field is not None]
+    values = [(_setter(cls, field), default) for field, default in defaults.items()]
+    new = cls.__new__
+
+    def hydrate(rows):
+        rows = rows if isinstance(rows, list) else list(rows)
+        count = len(rows)
+        result = list(map(new, repeat(cls, count)))
+        for get, set_value in columns:
+            deque(map(set_value, result, map(get, rows)), 0)
+        for set_value, default in values:
+            fill = starmap(default, repeat((), count)) if callable(default) \
+                else repeat(default, count)
+            deque(map(set_value, result, fill), 0)
+        return result
+
+    return hydrate
+
+
+def _setter(cls, field:str):
+    """Returns set(obj, value) for one attribute: the slot descriptor's
+    __set__ when field is a slot, else setattr
+    """
+    descriptor = getattr(cls, field, None)
+    if hasattr(descriptor, '__set__'):
+        return descriptor.__set__
+    return lambda obj, value: setattr(obj, field, value)
+
+
+def named_rows(row_type, rows) -> list:
+    """Returns rows as row_type namedtuples"""
+    return list(map(row_type._make, rows))
+
+
+def hydrate_campaigns(rows) -> list:
+    """Campaigns from SELECT_ALL_CAMPAIGNS shaped rows, with empty channel lists"""
+    return row_factory(Campaign, CAMPAIGN_FIELDS, defaults={'channel': list})(rows)
+
+
+def hydrate_channels(rows, skip:int=0) -> list:
+    """Channels from (idChannel, ChannelName, idChannel_Category[, ...])
+    rows, after `skip` leading columns; CategoryName is left empty
+    """
+    if not rows:
+        return []
+    return row_factory(Channel, (None,) * skip + CHANNEL_FIELDS, len(rows[0]),
+                       {'CategoryName': ()})(rows)
+
+
+def hydrate_companies(rows) -> list:
+    return row_factory(Company, COMPANY_FIELDS)(rows)
+
+
+def hydrate_campaign_categories(rows) -> list:
+    return row_factory(Campaign_Category, CAMPAIGN_CATEGORY_FIELDS)(rows)
+
+
+def hydrate_channel_categories(rows) -> list:
+    return row_factory(Channel_Category, CHANNEL_CATEGORY_FIELDS)(rows)
@@ -0,0 +1,153 @@
+"""Defines the SlowQueryLog class and the statement logging decorator."""
+
+import threading
+import time
+from functools import wraps
+
+from campaign_app.logging import LoggingService
+
+
+# Statements both backends can EXPLAIN without running them
+EXPLAINABLE = ('SELECT', 'UPDATE', 'DELETE')
+
+
+def redact(params) -> str:
+    """Returns params with each value replaced by its type (and length for
+    strings), e.g. (<int>, <str:12>, None)
+    """
+    if params is None:
+        return 'None'
+    if not isinstance(params, (list, tuple)):
+        params = (params,)
+    return '(' + ', '.join('None' if p is None else
+                           f"<str:{len(p)}>" if isinstance(p, str) else
+                           f"<{type(p).__name__}>" for p in params) + ')'
+
+
+class SlowQueryLog():
+    """Writes statements slower than a threshold to a dedicated log file
+    with their SQL, parameters, row count and time. The time covers the
+    execute and every fetch of the result, so unbuffered reads are charged
+    for the rows they pull. With explain enabled the plan of each distinct
+    SQL text is captured the first time it is slow.
+    """
+
+    def __init__(self, config:dict, logfile_prefix_name:str) -> None:
+        """Initializes object. """
+        self.threshold = config.get("threshold_ms", 200) / 1000
+        self.explain = config.get("explain", True)
+        self.redact_params = config.get("redact_params", True)
+        self._logger = LoggingService('SlowQueryLog', logfile_prefix_name,
+                                      log_filename=config.get("log_filename", "slow_query.log"),
+                                      log_level='warning')
+        self._explained = set()
+        self._lock = threading.Lock()
+
+    def track(self, wrapper, connection, cursor, query:str, params, seconds:float):
+        """Returns the executed cursor; result sets come back wrapped so the
+        statement is timed until its last row is fetched
+        """
+        if cursor.description is None:
+            self.record(wrapper, connection, query, params, seconds, cursor.rowcount)
+            return cursor
+        return SlowQueryCursor(self, wrapper, connection, cursor, query, params, seconds)
+
+    def record(self, wrapper, connection, query:str, params, seconds:float, rows:int,
+               many:bool=False) -> None:
+        """Logs the statement if it took longer than the threshold"""
+        if seconds < self.threshold:
+            return
+        metrics = wrapper.metrics
+        method = metrics.current_method() if metrics is not None else None
+        if many:
+            shown = f"{len(params)} sets, first {self._params(params[0] if params else None)}"
+        else:
+            shown = self._params(params)
+        plan = self._plan(wrapper, connection, query, params) if not many else None
+        self._logger.log_warning('%.1f ms, %s rows, method=%s\n  SQL: %s\n  params: %s%s',
+                                 seconds * 1000, rows, method or 'other', query, shown,
+                                 f"\n  EXPLAIN:\n{plan}" if plan else '')
+
+    def _params(self, params) -> str:
+        return redact(params) if self.redact_params else repr(params)
+
+    def _plan(self, wrapper, connection, query:str, params):
+        """Returns the plan text the first time query is slow, else None"""
+        if not self.explain or connection is None or \
+            not query.lstrip().upper().startswith(EXPLAINABLE):
+            return None
+        with self._lock:
+            if query in self._explained:
+                return None
+            self._explained.add(query)
+        try:
+            return wrapper._explain(connection, query, params)
+        except Exception as e:
+            return f"    EXPLAIN failed: {e}"
+
+
+class SlowQueryCursor():
+    """Cursor proxy timing the fetches of a result set; the statement is
+    recorded once the result is exhausted.
+    """
+
+    def __init__(self, log:SlowQueryLog, wrapper, connection, cursor, query:str,
+                 params, seconds:float) -> None:
+        """Initializes object. """
+        self._log = log
+        self._wrapper = wrapper
+        self._connection = connection
+        self._cursor = cursor
+        self._query = query
+        self._params = params
+        self._seconds = seconds
+        self._rows = 0
+        self._done = False
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        return iter(self.fetchall())
+
+    def fetchall(self):
+        started = time.perf_counter()
+        rows = self._cursor.fetchall()
+        self._fetched(started, len(rows), True)
+        return rows
+
+    def fetchmany(self, size:int):
+        started = time.perf_counter()
+        rows = self._cursor.fetchmany(size)
+        self._fetched(started, len(rows), len(rows) < size)
+        return rows
+
+    def fetchone(self):
+        started = time.perf_counter()
+        row = self._cursor.fetchone()
+        self._fetched(started, 0 if row is None else 1, row is None)
+        return row
+
+    def _fetched(self, started:float, rows:int, done:bool) -> None:
+        self._seconds += time.perf_counter() - started
+        self._rows += rows
+        if done and not self._done:
+            self._done = True
+            self._log.record(self._wrapper, self._connection, self._query,
+                             self._params, self._seconds, self._rows)
+
+
+def logged_statement(func):
+    """Times _execute_statement() through the fetch of its result and hands
+    the statement to the wrapper's slow query log
+    """
+    @wraps(func)
+    def wrapper(self, connection, cursor, query:str, params=None):
+        log = self.slow_query_log
+        if log is None:
+            return func(self, connection, cursor, query, params)
+        started = time.perf_counter()
+        result = func(self, connection, cursor, query, params)
+        return log.track(self, connection, result, query, params,
+                         time.perf_counter() - started)
+    return wrapper
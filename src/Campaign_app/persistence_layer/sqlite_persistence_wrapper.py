@@ -0,0 +1,356 @@
+"""Defines the SQLitePersistenceWrapper class."""
+
+import re
+import sqlite3
+import threading
+import time
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+from typing import List
+
+from campaign_app.persistence_layer.persistence_wrapper import PersistenceWrapper
+from campaign_app.persistence_layer.connection_pool import PoolTimeoutError
+from campaign_app.infrastructure_layer.campaign import Campaign
+
+
+# Relative database and seed file paths in the config are resolved here,
+# the repository root, whatever the working directory
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+# DATE and DECIMAL columns round-trip as date and Decimal, like MySQL
+sqlite3.register_adapter(Decimal, str)
+sqlite3.register_adapter(date, date.isoformat)
+sqlite3.register_converter("DATE", lambda value: date.fromisoformat(value.decode()))
+sqlite3.register_converter("DECIMAL",
+	lambda value: Decimal(value.decode()).quantize(Decimal('0.01')))
+
+
+class SQLiteCursor():
+	"""Cursor adapter accepting the wrapper's %s placeholders."""
+
+	_translated = {}
+
+	def __init__(self, cursor:sqlite3.Cursor) -> None:
+		"""Initializes object. """
+		self._cursor = cursor
+
+	@property
+	def lastrowid(self):
+		return self._cursor.lastrowid
+
+	@property
+	def rowcount(self):
+		return self._cursor.rowcount
+
+	@property
+	def description(self):
+		return self._cursor.description
+
+	def execute(self, query:str, params=None):
+		self._cursor.execute(self._translate(query), params or ())
+		return self
+
+	def executemany(self, query:str, seq_of_params):
+		self._cursor.executemany(self._translate(query), seq_of_params)
+		return self
+
+	def fetchone(self):
+		return self._cursor.fetchone()
+
+	def fetchmany(self, size:int):
+		return self._cursor.fetchmany(size)
+
+	def fetchall(self):
+		return self._cursor.fetchall()
+
+	def close(self) -> None:
+		self._cursor.close()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback) -> None:
+		self.close()
+
+	def _translate(self, query:str) -> str:
+		"""Returns query with %s placeholders rewritten to ?."""
+		translated = self._translated.get(query)
+		if translated is None:
+			translated = query.replace('%s', '?')
+			self._translated[query] = translated
+		return translated
+
+
+class SQLiteConnection():
+	"""Checked-out connection handle. Closing the outermost checkout ends
+	any open transaction with a rollback; closing a nested checkout by the
+	same thread leaves the outer transaction alone. Either way the checkout
+	is handed back to the pool.
+	"""
+
+	def __init__(self, pool, connection:sqlite3.Connection) -> None:
+		"""Initializes object. """
+		self._pool = pool
+		self._connection = connection
+		self._closed = False
+
+	@property
+	def in_transaction(self) -> bool:
+		return self._connection.in_transaction
+
+	def cursor(self, dictionary:bool=False, buffered:bool=None,
+			prepared:bool=False) -> SQLiteCursor:
+		"""Returns a cursor; dictionary=True rows are indexable by column name.
+		buffered and prepared are accepted for interface compatibility.
+		"""
+		cursor = self._connection.cursor()
+		if dictionary:
+			cursor.row_factory = sqlite3.Row
+		return SQLiteCursor(cursor)
+
+	def start_transaction(self) -> None:
+		if not self._connection.in_transaction:
+			self._connection.execute("BEGIN")
+
+	def commit(self) -> None:
+		self._connection.commit()
+
+	def rollback(self) -> None:
+		self._connection.rollback()
+
+	def close(self) -> None:
+		if self._closed:
+			return
+		self._closed = True
+		try:
+			if self._pool._depth == 1 and self._connection.in_transaction:
+				self._connection.rollback()
+		finally:
+			self._pool._release()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback) -> None:
+		self.close()
+
+
+class SQLiteConnectionPool():
+	"""Single shared SQLite connection handed out one thread at a time.
+	SQLite allows one writer, so checkouts are serialized rather than
+	pooled; a checkout is reentrant for the thread that holds it.
+	"""
+
+	def __init__(self, path:str, acquire_timeout:float=10.0) -> None:
+		"""Initializes object. """
+		self.path = path
+		self.acquire_timeout = acquire_timeout
+		self._lock = threading.RLock()
+		self._depth = 0
+		self._stats_lock = threading.Lock()
+		self.checkouts = 0
+		self.exhausted = 0
+		self.timeouts = 0
+		self.wait_seconds = 0.0
+		self.max_wait_seconds = 0.0
+		self._connection = sqlite3.connect(path, isolation_level=None,
+			check_same_thread=False, detect_types=sqlite3.PARSE_DECLTYPES)
+		self._connection.execute("PRAGMA foreign_keys = ON")
+
+	def get_connection(self) -> SQLiteConnection:
+		"""Checks out the connection, waiting up to acquire_timeout seconds
+		for another thread to release it
+		"""
+		if not self._lock.acquire(blocking=False):
+			started = time.monotonic()
+			acquired = self._lock.acquire(timeout=self.acquire_timeout)
+			waited = time.monotonic() - started
+			with self._stats_lock:
+				self.exhausted += 1
+				self.wait_seconds += waited
+				self.max_wait_seconds = max(self.max_wait_seconds, waited)
+				if not acquired:
+					self.timeouts += 1
+			if not acquired:
+				raise PoolTimeoutError(f"SQLite database {self.path} busy for "
+					f"{self.acquire_timeout}s")
+		self._depth += 1
+		with self._stats_lock:
+			self.checkouts += 1
+		return SQLiteConnection(self, self._connection)
+
+	def stats(self) -> dict:
+		"""Returns checkout and wait counters, keyed like ConnectionPool.stats()"""
+		with self._stats_lock:
+			in_use = 1 if self._depth else 0
+			return {
+				'name': self.path,
+				'size': 1,
+				'min_size': 1,
+				'open': 1,
+				'in_use': in_use,
+				'idle': 1 - in_use,
+				'checkouts': self.checkouts,
+				'exhausted': self.exhausted,
+				'timeouts': self.timeouts,
+				'wait_ms_total': round(self.wait_seconds * 1000, 3),
+				'wait_ms_max': round(self.max_wait_seconds * 1000, 3)
+			}
+
+	def reset_stats(self) -> None:
+		with self._stats_lock:
+			self.checkouts = 0
+			self.exhausted = 0
+			self.timeouts = 0
+			self.wait_seconds = 0.0
+			self.max_wait_seconds = 0.0
+
+	def _release(self) -> None:
+		self._depth -= 1
+		self._lock.release()
+
+
+class SQLitePersistenceWrapper(PersistenceWrapper):
+	"""Embedded SQLite backend, on disk or in memory, for running the app,
+	benchmarks and load tests without a MySQL server.
+	"""
+
+	DATABASE_ERROR = sqlite3.Error
+
+	EXPLAIN_PREFIX = "EXPLAIN QUERY PLAN "
+
+	# julianday('0001-01-01') is 1721425.5, date(1, 1, 1).toordinal() is 1
+	DATE_ORDINAL_SQL = "COALESCE(CAST(julianday({0}) - 1721424.5 AS INTEGER), 0)"
+	CENTS_SQL = "COALESCE(CAST(ROUND({0} * 100) AS INTEGER), 0)"
+
+	# Schema from Database/DB_Create_V3/Create_Insert.sql in SQLite syntax
+	CREATE_TABLES = [
+		"CREATE TABLE IF NOT EXISTS Channel_Category (" \
+		"idChannel_Category INTEGER PRIMARY KEY AUTOINCREMENT, " \
+		"Channel_CategoryName VARCHAR(45) NOT NULL UNIQUE)",
+
+		"CREATE TABLE IF NOT EXISTS Channel (" \
+		"idChannel INTEGER PRIMARY KEY AUTOINCREMENT, " \
+		"ChannelName VARCHAR(45) NOT NULL UNIQUE, " \
+		"idChannel_Category INT NOT NULL " \
+		"REFERENCES Channel_Category (idChannel_Category))",
+
+		"CREATE INDEX IF NOT EXISTS fk_Channel_Channel_Category1_idx " \
+		"ON Channel (idChannel_Category)",
+
+		"CREATE TABLE IF NOT EXISTS Campaign_Category (" \
+		"idCampaign_Category INTEGER PRIMARY KEY AUTOINCREMENT, " \
+		"Campaign_CategoryName VARCHAR(45) NOT NULL UNIQUE)",
+
+		"CREATE TABLE IF NOT EXISTS Company (" \
+		"idCompany INTEGER PRIMARY KEY AUTOINCREMENT, " \
+		"CompanyName VARCHAR(45) NOT NULL UNIQUE)",
+
+		"CREATE TABLE IF NOT EXISTS Campaign (" \
+		"idCampaign INTEGER PRIMARY KEY AUTOINCREMENT, " \
+		"Campaign_Name VARCHAR(100) NOT NULL UNIQUE, " \
+		"StartDate DATE NULL, " \
+		"EndDate DATE NULL, " \
+		"idCompany INT NOT NULL REFERENCES Company (idCompany), " \
+		"idCampaign_Category INT NOT NULL " \
+		"REFERENCES Campaign_Category (idCampaign_Category), " \
+		"Budget DECIMAL(15,2) NOT NULL DEFAULT 0.00, " \
+		"Revenue DECIMAL(15,2) NOT NULL DEFAULT 0.00, " \
+		"NetProfit DECIMAL(15,2) GENERATED ALWAYS AS (Revenue - Budget) STORED)",
+
+		"CREATE INDEX IF NOT EXISTS fk_Campaign_Company1_idx " \
+		"ON Campaign (idCompany)",
+
+		"CREATE INDEX IF NOT EXISTS fk_Campaign_Campaign_Category1_idx " \
+		"ON Campaign (idCampaign_Category)",
+
+		"CREATE TABLE IF NOT EXISTS Campaign_channel_xref (" \
+		"idChannel INT NOT NULL REFERENCES Channel (idChannel), " \
+		"idCampaign INT NOT NULL REFERENCES Campaign (idCampaign), " \
+		"PRIMARY KEY (idChannel, idCampaign))",
+
+		"CREATE INDEX IF NOT EXISTS fk_Channel_has_Campaign_Campaign1_idx " \
+		"ON Campaign_channel_xref (idCampaign)"
+	]
+
+	SELECT_CAMPAIGN_COUNT = "SELECT COUNT(*) FROM Campaign"
+
+	SELECT_LAST_INSERT_ROWID = "SELECT last_insert_rowid()"
+
+	def __init__(self, config:dict) -> None:
+		"""Initializes object. """
+		super().__init__(config)
+
+		# Database Configuration Constants
+		self.SQLITE = self.DATABASE.get("sqlite", {})
+		self.DB_PATH = self._resolve_path(self.SQLITE.get("path", ":memory:"))
+		self.SEED_FILE = self.SQLITE.get("seed_file")
+		if self.SEED_FILE:
+			self.SEED_FILE = self._resolve_path(self.SEED_FILE)
+
+		self._logger.log_debug('__init__: SQLite database: %s', self.DB_PATH)
+
+		# Database Connection
+		self._connection_pool = self._initialize_database_connection_pool(self.SQLITE)
+
+
+		##### Private Utility Methods #####
+
+	def _initialize_database_connection_pool(self, config:dict)->SQLiteConnectionPool:
+		"""Opens the database, creates the schema and seeds an empty database.
+		Raises if the database cannot be opened or seeded; there is no
+		server to come back later, so the wrapper is unusable without it.
+		"""
+		try:
+			self._logger.log_debug('Opening SQLite database...')
+			cnx_pool = SQLiteConnectionPool(self.DB_PATH, self.DATABASE.get("pool", {})
+				.get("acquire_timeout_seconds", 10.0))
+			with cnx_pool.get_connection() as connection:
+				cursor = connection.cursor()
+				with cursor:
+					connection.start_transaction()
+					for statement in self.CREATE_TABLES:
+						cursor.execute(statement)
+					if self.SEED_FILE and \
+						cursor.execute(self.SELECT_CAMPAIGN_COUNT).fetchall()[0][0] == 0:
+						self._seed(cursor, self.SEED_FILE)
+					connection.commit()
+			self._logger.log_debug('_initialize_database_connection_pool: SQLite database ready!')
+			return cnx_pool
+		except Exception as e:
+			self._logger.log_error('_initialize_database_connection_pool: Problem opening SQLite database: %s', e)
+			raise
+
+
+	@staticmethod
+	def _resolve_path(path:str) -> str:
+		"""Returns path anchored at PROJECT_ROOT when it is relative;
+		':memory:' is returned unchanged.
+		"""
+		if path == ":memory:" or Path(path).is_absolute():
+			return path
+		return str(PROJECT_ROOT / path)
+
+
+	def _seed(self, cursor:SQLiteCursor, filename:str) -> None:
+		"""Runs the INSERT statements of the MySQL create script."""
+		with open(filename, 'r', encoding='utf-8') as f:
+			script = f.read()
+		for statement in re.findall(r'INSERT INTO[^;]*', script):
+			cursor.execute(statement)
+		self._logger.log_debug('_seed: Seeded from %s', filename)
+
+
+	def _insert_campaign_chunk(self, connection, cursor, chunk:List[Campaign]) -> None:
+		"""Inserts the chunk with executemany. The connection is not shared
+		while checked out, so the AUTOINCREMENT ids are consecutive and end
+		at last_insert_rowid().
+		"""
+		self._executemany(cursor, self.INSERT_CAMPAIGN,
+			[self._campaign_insert_params(c) for c in chunk])
+		last_id = self._execute_statement(connection, cursor,
+			self.SELECT_LAST_INSERT_ROWID).fetchall()[0][0]
+		first_id = last_id - len(chunk) + 1
+		for offset, campaign in enumerate(chunk):
+			campaign.idCampaign = first_id + offset
@@ -0,0 +1,38 @@
+"""Defines the UnitOfWork class."""
+
+
+class TransactionRolledBack(Exception):
+    """Raised when a transaction() block exits normally but a wrapper call
+    inside it failed, so the whole unit was rolled back.
+    """
+
+
+class UnitOfWork():
+    """Tracks one pinned connection shared by the calls of a transaction.
+
+    rollback_only is set by set_rollback_only() or by a failed wrapper call
+    (failed is then set too); committed is set once the unit commits.
+    Callbacks registered with on_commit() run after a successful commit.
+    """
+
+    def __init__(self, connection) -> None:
+        """Initializes object. """
+        self.connection = connection
+        self.depth = 0
+        self.rollback_only = False
+        self.failed = False
+        self.committed = False
+        self.commit_callbacks = []
+
+    def set_rollback_only(self) -> None:
+        """Marks the transaction so it rolls back instead of committing."""
+        self.rollback_only = True
+
+    def mark_failed(self) -> None:
+        """Marks the transaction rolled back because a call inside it failed."""
+        self.failed = True
+        self.rollback_only = True
+
+    def on_commit(self, callback) -> None:
+        """Runs callback() once the transaction has committed."""
+        self.commit_callbacks.append(callback)
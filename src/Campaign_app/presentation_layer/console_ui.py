@@ -1,7 +1,10 @@
 """Implements the application user interface."""
 
 from campaign_app.application_base import ApplicationBase
+from campaign_app.profiling import ActionProfiler
+from campaign_app.service_layer.analytics_service import AnalyticsService
 from campaign_app.service_layer.app_services import AppServices
+from campaign_app.service_layer.campaign_validation import parse_campaign_date, validate_campaign_dates
 from campaign_app.infrastructure_layer.campaign import Campaign
 from campaign_app.infrastructure_layer.campaign_category import Campaign_Category
 from campaign_app.infrastructure_layer.channel import Channel
@@ -9,19 +12,24 @@ from campaign_app.infrastructure_layer.channel_category import Channel_Category
 from campaign_app.infrastructure_layer.company import Company
 from prettytable.colortable import ColorTable, Themes
 from datetime import date
+import json
 import sys
-import inspect
 
 
 class ConsoleUI(ApplicationBase):
     """ConsoleUI Class Definition."""
-    def __init__(self, config:dict)->None:
-        """Initializes object. """
+    def __init__(self, config:dict, app_services:AppServices=None,
+                 profiler:ActionProfiler=None)->None:
+        """Initializes object. With a profiler every menu action is
+        profiled under its method name.
+        """
         self._config_dict = config
         self.META = config["meta"]
         super().__init__(subclass_name=self.__class__.__name__, 
 				   logfile_prefix_name=self.META["log_prefix"])
-        self.app_services = AppServices(config)
+        self.app_services = app_services or AppServices(config)
+        self.profiler = profiler
+        self.analytics = AnalyticsService(config, self.app_services)
     
     
     # Public Methods
@@ -41,7 +49,13 @@ class ConsoleUI(ApplicationBase):
         print(f"\t10. Add Channel Category")
         print(f"\t11. List Companies")
         print(f"\t12. Add Company")
-        print(f"\t13. Exit")
+        print(f"\t13. Manage Campaign Channels")
+        print(f"\t14. Query Metrics")
+        print(f"\t15. Portfolio Summary")
+        print(f"\t16. Performance by Company")
+        print(f"\t17. Performance by Campaign Category")
+        print(f"\t18. Performance by Channel")
+        print(f"\t19. Exit")
         print()
     
 
@@ -50,81 +64,46 @@ class ConsoleUI(ApplicationBase):
         menu_choice = input("\tMenu Choice: ")
 
         match menu_choice.strip():
-            case '1': self.list_campaigns()
-            case '2': self.add_campaign() 
-            case '3': self.update_campaign()
-            case '4': self.drop_campaign()
-            case '5': self.list_channels()
-            case '6': self.add_channel()
-            case '7': self.list_campaign_category()
-            case '8': self.add_campaign_category()
-            case '9': self.list_channel_category()
-            case '10': self.add_channel_category()
-            case '11': self.list_company()
-            case '12': self.add_company()
-            case '13': sys.exit()
-            case _: print(f"Invalid Menu Choice {menu_choice}")
+            case '1': action = self.list_campaigns
+            case '2': action = self.add_campaign
+            case '3': action = self.update_campaign
+            case '4': action = self.drop_campaign
+            case '5': action = self.list_channels
+            case '6': action = self.add_channel
+            case '7': action = self.list_campaign_category
+            case '8': action = self.add_campaign_category
+            case '9': action = self.list_channel_category
+            case '10': action = self.add_channel_category
+            case '11': action = self.list_company
+            case '12': action = self.add_company
+            case '13': action = self.manage_campaign_channels
+            case '14': action = self.show_query_metrics
+            case '15': action = self.show_portfolio_summary
+            case '16': action = self.report_by_company
+            case '17': action = self.report_by_category
+            case '18': action = self.report_by_channel
+            case '19': sys.exit()
+            case _:
+                print(f"Invalid Menu Choice {menu_choice}")
+                return
+
+        if self.profiler is None:
+            action()
+        else:
+            with self.profiler.profile(action.__name__):
+                action()
     
 
     def list_campaigns(self)->None:
-        """Lists campaigns"""
-        campaigns = self.app_services.get_all_campaigns()
-        campaign_table = ColorTable(theme=Themes.EARTH)
-        campaign_table.field_names =['id','Campaign Name','Start Date','End Date',
-                                     'Company ID','Campaign Category ID','Budget',
-                                     'Revenue', 'Net Profit', 'Channels']
-        channel_table = ColorTable(theme=Themes.EARTH)
-        channel_table.field_names = ['Channel Name']
-        channel_table.align = 'l'
-        for campaign in campaigns:
-
-            # Adding commas to numbers
-            budget_fmt = f"{campaign.Budget:,}" if campaign.Budget is not None else ""
-            revenue_fmt = f"{campaign.Revenue:,}" if campaign.Revenue is not None else ""
-            netprofit_fmt = f"{campaign.NetProfit:,}" if campaign.NetProfit is not None else ""
-
-            for channel in campaign.channel:
-                channel_table.add_row([channel.ChannelName])
-            
-            campaign_table.add_row([campaign.idCampaign,
-                                    campaign.Campaign_Name,
-                                    campaign.StartDate,
-                                    campaign.EndDate,
-                                    campaign.idCompany,
-                                    campaign.idCampaign_Category,
-                                    budget_fmt,
-                                    revenue_fmt,
-                                    netprofit_fmt,
-                                    channel_table.get_string()])
-            campaign_table.add_divider()
-            channel_table.clear_rows()
-        print(campaign_table)
-
-        self._logger.log_debug(f'{inspect.currentframe().f_code.co_name}: ' \
-                                f'{campaigns}')
+        """Lists campaigns one page at a time"""
+        self._page_through(self.app_services.get_campaigns_page,
+                           self._build_campaign_table)
 
 
     def list_channels(self)->None: 
-        """Lists channels with their category"""
-        channels = self.app_services.get_all_channels()
-        channel_table = ColorTable(theme=Themes.EARTH)
-        channel_table.field_names =['id','Channel Name', 'Category'] 
-            # Removed Channel Category Id because wouldn't make sense
-        category_table = ColorTable(theme=Themes.EARTH)
-        category_table.field_names = ['Category Name']
-        category_table.align = 'l'
-        for channel in channels:
-            for channel_category in channel.CategoryName:
-                category_table.add_row([channel_category.Channel_CategoryName])
-            
-            channel_table.add_row([channel.idChannel, channel.ChannelName, 
-                                   category_table.get_string()])
-            channel_table.add_divider()
-            category_table.clear_rows()
-        print(channel_table)
-
-        self._logger.log_debug(f'{inspect.currentframe().f_code.co_name}: ' \
-                                f'{channels}')
+        """Lists channels with their category one page at a time"""
+        self._page_through(self.app_services.get_channels_page,
+                           self._build_channel_table)
     
 
     def list_channel_category(self)->None:
@@ -137,7 +116,7 @@ class ConsoleUI(ApplicationBase):
             category_table.add_row([category.idChannel_Category, category.Channel_CategoryName])
         print(category_table)
         
-        self._logger.log_debug(f'{inspect.currentframe().f_code.co_name}: {categories}')
+        self._logger.log_debug('list_channel_category: %s', categories)
 
 
     def list_campaign_category(self)->None:
@@ -151,20 +130,13 @@ class ConsoleUI(ApplicationBase):
                                              campaign.Campaign_CategoryName])
         print(campaign_category_table)
         
-        self._logger.log_debug(f'{inspect.currentframe().f_code.co_name}: {campaign_category_table}')
+        self._logger.log_debug('list_campaign_category: %s', campaign_category_table)
 
 
     def list_company(self)->None:
-        """list companies"""
-        companies = self.app_services.get_all_companies()
-        company_table = ColorTable(theme=Themes.EARTH)
-        company_table.field_names = ['CompanyId', 'Company Name']
-        company_table.align = 'l'
-        for company in companies:
-            company_table.add_row([company.idCompany,company.CompanyName])
-        print(company_table)
-        
-        self._logger.log_debug(f'{inspect.currentframe().f_code.co_name}: {company_table}')
+        """list companies one page at a time"""
+        self._page_through(self.app_services.get_companies_page,
+                           self._build_company_table)
         
 
     def add_campaign(self) -> None:
@@ -175,8 +147,7 @@ class ConsoleUI(ApplicationBase):
             # 1. Campaign Name Validation
             while True:
                 name = input("Campaign Name: ").strip()
-                existing_campaigns = [c.Campaign_Name.lower() for c in self.app_services.get_all_campaigns()]
-                if name.lower() in existing_campaigns:
+                if self.app_services.campaign_name_exists(name):
                     print("Error: Campaign name already exists. Please enter a unique name.")
                 else:
                     break
@@ -184,30 +155,17 @@ class ConsoleUI(ApplicationBase):
             # 2. Start and End Date Validation
             while True:
                 start_date_str = input("Start Date (YYYY-MM-DD or YYYY/MM/DD): ").strip()
-                start_date_str = start_date_str.replace("/", "-")
 
                 end_date_str = input("Leave blank if ongoing, format (YYYY-MM-DD or YYYY/MM//DD): ").strip()
                 
                 try:
-                    start_date = date.fromisoformat(start_date_str)
-                    
-                    if start_date > date.today():
-                        print("Invalid date. Date cannot be in the future")
-                        continue
+                    start_date = date.fromisoformat(start_date_str.replace("/", "-"))
+                    end_date = parse_campaign_date(end_date_str)
 
-                    if end_date_str == "":
-                        end_date = None
-                    else:
-                        end_date_str = end_date_str.replace("/","-")
-                        end_date = date.fromisoformat(end_date_str)
-                    
-                        if end_date > date.today():
-                            print("Error: End Date cannot be in the future")
-                            continue
-                    
-                        if end_date is not None and end_date < start_date:
-                            print("Error: End Date cannot be before Start Date.")
-                            continue
+                    date_error = validate_campaign_dates(start_date, end_date)
+                    if date_error:
+                        print(f"Error: {date_error}")
+                        continue
                     break
                        
                 except ValueError:
@@ -270,22 +228,19 @@ class ConsoleUI(ApplicationBase):
 
         except Exception as e:
             print(f"Error adding campaign: {e}")
-            self._logger.log_error(f'{inspect.currentframe().f_code.co_name}: {e}')
+            self._logger.log_error('add_campaign: %s', e)
 
 
     def update_campaign(self) -> None:
         """Update a campaign"""
-        campaigns = self.app_services.get_all_campaigns()
-        ids = [c.idCampaign for c in campaigns]
-        
         try:
             id_to_update = int(input("Enter Campaign ID to update: "))
-            if id_to_update not in ids:
-                print("Invalid Campaign ID")
-                return
 
             # Find the campaign object
-            campaign = next(c for c in campaigns if c.idCampaign == id_to_update)
+            campaign = self.app_services.get_campaign(id_to_update)
+            if campaign is None:
+                print("Invalid Campaign ID")
+                return
 
             # Input new values, fallback to current if empty
             campaign.Campaign_Name = input(f"Campaign Name [{campaign.Campaign_Name}]: ") or campaign.Campaign_Name
@@ -326,23 +281,23 @@ class ConsoleUI(ApplicationBase):
     
     def drop_campaign(self) -> None:
         """Delete a campaign"""
-        campaigns = self.app_services.get_all_campaigns()
-
-        # Show available IDs for safety
+        # Show available IDs for safety, from column tuples only
         print("\nAvailable Campaigns:")
-        for c in campaigns:
-            print(f"ID: {c.idCampaign} | Name: {c.Campaign_Name}")
+        for row in self.app_services.get_campaign_rows() or []:
+            print(f"ID: {row[0]} | Name: {row[1]}")
 
         try:
             id_to_delete = int(input("\nEnter Campaign ID to delete: "))
 
             # Validate the ID exists
-            if not any(c.idCampaign == id_to_delete for c in campaigns):
+            campaign = self.app_services.get_campaign(id_to_delete)
+            if campaign is None:
                 print("Invalid Campaign ID.")
                 return
 
             # Confirm deletion
-            confirm = input(f"Are you sure you want to delete Campaign ID {id_to_delete}? (y/n): ").lower()
+            confirm = input(f"Are you sure you want to delete Campaign ID {id_to_delete} " \
+                            f"({campaign.Campaign_Name})? (y/n): ").lower()
             if confirm != 'y':
                 print("Delete canceled.")
                 return
@@ -479,6 +434,263 @@ class ConsoleUI(ApplicationBase):
             print("Error adding company.")
 
 
+    def manage_campaign_channels(self) -> None:
+        """Link, unlink or replace the channels of a campaign"""
+        try:
+            idCampaign = int(input("\nEnter Campaign ID: "))
+            campaign = self.app_services.get_campaign(idCampaign)
+            if campaign is None:
+                print("Invalid Campaign ID.")
+                return
+
+            print(f"\nChannels for '{campaign.Campaign_Name}':")
+            for ch in campaign.channel:
+                print(f"ID: {ch.idChannel} | Name: {ch.ChannelName}")
+
+            channels = self.app_services.get_all_channels()
+            print("\nAvailable Channels:")
+            for ch in channels:
+                print(f"ID: {ch.idChannel} | Name: {ch.ChannelName}")
+            valid_ids = {ch.idChannel for ch in channels}
+
+            action = input("\n[l]ink, [u]nlink or [r]eplace channels: ").strip().lower()
+            if action not in ('l', 'u', 'r'):
+                print("Invalid choice.")
+                return
+
+            ids_input = input("Channel IDs (comma separated): ").strip()
+            channel_ids = [int(i) for i in ids_input.split(',') if i.strip()]
+            invalid_ids = [i for i in channel_ids if i not in valid_ids]
+            if invalid_ids:
+                print(f"Invalid Channel ID(s): {invalid_ids}")
+                return
+
+            match action:
+                case 'l': changes = self.app_services.link_channels(idCampaign, channel_ids)
+                case 'u': changes = self.app_services.unlink_channels(idCampaign, channel_ids)
+                case 'r': changes = self.app_services.replace_channels(idCampaign, channel_ids)
+
+            if changes is None:
+                print("Error updating campaign channels.")
+            else:
+                print(f"Linked {len(changes['linked'])} and unlinked " \
+                      f"{len(changes['unlinked'])} channel(s).")
+        except ValueError:
+            print("Invalid input. Must be a number.")
+        except Exception as e:
+            print(f"Error: {e}")
+            self._logger.log_error('manage_campaign_channels: %s', e)
+
+
+    def show_query_metrics(self) -> None:
+        """Shows per-method persistence latencies, connection pool and
+        reference cache counters, with export and reset
+        """
+        pool = self.app_services.get_pool_stats()
+        if pool is not None:
+            print(f"\tPool {pool['name']}: {pool['in_use']} in use, {pool['idle']} idle " \
+                  f"of {pool['size']}; {pool['checkouts']} checkouts, " \
+                  f"{pool['exhausted']} waited (max {pool['wait_ms_max']} ms), " \
+                  f"{pool['timeouts']} timed out")
+
+        cache = self.app_services.get_cache_stats()
+        lookups = cache['hits'] + cache['misses']
+        hit_rate = f"{cache['hits'] / lookups:.1%}" if lookups else "n/a"
+        print(f"\tReference cache: {cache['hits']} hits, {cache['misses']} misses " \
+              f"({hit_rate} hit rate), {cache['evictions']} evictions; " \
+              f"{cache['entries']} of {cache['max_entries']} entries, " \
+              f"TTL {cache['ttl_seconds']}s")
+
+        metrics = self.app_services.get_query_metrics()
+        if metrics is None:
+            print("Query metrics are disabled (database.metrics.enabled).")
+            return
+
+        metrics_table = ColorTable(theme=Themes.EARTH)
+        metrics_table.field_names = ['Method', 'Calls', 'Errors', 'Rows', 'Mean ms',
+                                     'p95 <= ms', 'Pool Wait ms', 'Execute ms', 'Hydrate ms']
+        metrics_table.align = 'r'
+        metrics_table.align['Method'] = 'l'
+        for name, method in metrics['methods'].items():
+            total = method['total']
+            metrics_table.add_row([name, method['calls'], method['errors'], method['rows'],
+                                   total['mean_ms'], total['p95_le_ms'],
+                                   method['pool_wait']['mean_ms'],
+                                   method['execute']['mean_ms'],
+                                   method['hydrate']['mean_ms']])
+        print(metrics_table)
+        print(f"\tUptime {metrics['uptime_seconds']}s. Phase columns are means per " \
+              f"recorded phase.")
+
+        choice = input("\t[j]son export, [p]rometheus export, [r]eset, Enter to return: ")
+        match choice.strip().lower():
+            case 'j' | 'p':
+                fmt = 'json' if choice.strip().lower() == 'j' else 'prometheus'
+                filename = input("Output file: ").strip()
+                if not filename:
+                    return
+                payload = self.app_services.get_query_metrics(fmt)
+                with open(filename, 'w') as f:
+                    f.write(json.dumps(payload, indent=2) if fmt == 'json' else payload)
+                print(f"Wrote {fmt} metrics to {filename}")
+            case 'r':
+                self.app_services.reset_query_metrics()
+                print("Query metrics reset.")
+
+
+    def show_portfolio_summary(self) -> None:
+        """Shows totals, ROI, margin and today's budget burn over all
+        campaigns
+        """
+        summary = self.analytics.summary()
+        summary_table = ColorTable(theme=Themes.EARTH)
+        summary_table.field_names = ['Metric', 'Value']
+        summary_table.align = 'r'
+        summary_table.align['Metric'] = 'l'
+        summary_table.add_row(['Campaigns', summary['campaigns']])
+        summary_table.add_row(['Active Today', summary['active']])
+        summary_table.add_row(['Budget', summary['budget']])
+        summary_table.add_row(['Revenue', summary['revenue']])
+        summary_table.add_row(['Net Profit', summary['net_profit']])
+        summary_table.add_row(['ROI %', self._percent(summary['roi'])])
+        summary_table.add_row(['Margin %', self._percent(summary['margin'])])
+        summary_table.add_row(['Daily Burn', summary['daily_burn']])
+        print(summary_table)
+
+
+    def report_by_company(self) -> None:
+        """Shows campaign performance rolled up by company"""
+        self._show_rollup('company', 'Company')
+
+
+    def report_by_category(self) -> None:
+        """Shows campaign performance rolled up by campaign category"""
+        self._show_rollup('category', 'Campaign Category')
+
+
+    def report_by_channel(self) -> None:
+        """Shows campaign performance rolled up by channel"""
+        self._show_rollup('channel', 'Channel')
+
+
+    # Private Methods
+    def _show_rollup(self, dimension:str, title:str) ->None:
+        """Prints one row per group of an AnalyticsService rollup"""
+        rows = self.analytics.rollup(dimension)
+        rollup_table = ColorTable(theme=Themes.EARTH)
+        rollup_table.field_names = ['ID', title, 'Campaigns', 'Active', 'Budget', 'Revenue',
+                                    'Net Profit', 'ROI %', 'Margin %', 'Daily Burn']
+        rollup_table.align = 'r'
+        rollup_table.align[title] = 'l'
+        for row in rows:
+            rollup_table.add_row([row['id'], row['name'], row['campaigns'], row['active'],
+                                  row['budget'], row['revenue'], row['net_profit'],
+                                  self._percent(row['roi']), self._percent(row['margin']),
+                                  row['daily_burn']])
+        print(rollup_table)
+        self._logger.log_debug('_show_rollup: %s %s groups', dimension, len(rows))
+
+
+    @staticmethod
+    def _percent(ratio:float) ->str:
+        return '' if ratio is None else f"{ratio * 100:.2f}"
+
+
+    def _page_through(self, get_page, build_table) ->None:
+        """Displays pages from get_page(cursor) with next/previous navigation"""
+        cursor = None
+        while True:
+            page = get_page(cursor)
+            if page is None:
+                print("Error loading page.")
+                return
+            print(build_table(page.items))
+            self._logger.log_debug('_page_through: %s items, next %s, prev %s',
+                                   len(page.items), page.next_cursor, page.prev_cursor)
+
+            options = []
+            if page.has_prev():
+                options.append("[p]revious")
+            if page.has_next():
+                options.append("[n]ext")
+            if not options:
+                return
+            options.append("[q]uit")
+
+            choice = input(f"\t{', '.join(options)}: ").strip().lower()
+            if choice == 'n' and page.has_next():
+                cursor = page.next_cursor
+            elif choice == 'p' and page.has_prev():
+                cursor = page.prev_cursor
+            elif choice == 'q' or choice == '':
+                return
+            else:
+                print(f"Invalid choice {choice}")
+
+
+    def _build_campaign_table(self, campaigns) ->ColorTable:
+        """Builds the campaign table with a nested channel table per row"""
+        campaign_table = ColorTable(theme=Themes.EARTH)
+        campaign_table.field_names =['id','Campaign Name','Start Date','End Date',
+                                     'Company ID','Campaign Category ID','Budget',
+                                     'Revenue', 'Net Profit', 'Channels']
+        channel_table = ColorTable(theme=Themes.EARTH)
+        channel_table.field_names = ['Channel Name']
+        channel_table.align = 'l'
+        for campaign in campaigns:
+
+            # Adding commas to numbers
+            budget_fmt = f"{campaign.Budget:,}" if campaign.Budget is not None else ""
+            revenue_fmt = f"{campaign.Revenue:,}" if campaign.Revenue is not None else ""
+            netprofit_fmt = f"{campaign.NetProfit:,}" if campaign.NetProfit is not None else ""
+
+            for channel in campaign.channel:
+                channel_table.add_row([channel.ChannelName])
+            
+            campaign_table.add_row([campaign.idCampaign,
+                                    campaign.Campaign_Name,
+                                    campaign.StartDate,
+                                    campaign.EndDate,
+                                    campaign.idCompany,
+                                    campaign.idCampaign_Category,
+                                    budget_fmt,
+                                    revenue_fmt,
+                                    netprofit_fmt,
+                                    channel_table.get_string()])
+            campaign_table.add_divider()
+            channel_table.clear_rows()
+        return campaign_table
+
+
+    def _build_channel_table(self, channels) ->ColorTable:
+        """Builds the channel table with a nested category table per row"""
+        channel_table = ColorTable(theme=Themes.EARTH)
+        channel_table.field_names =['id','Channel Name', 'Category'] 
+            # Removed Channel Category Id because wouldn't make sense
+        category_table = ColorTable(theme=Themes.EARTH)
+        category_table.field_names = ['Category Name']
+        category_table.align = 'l'
+        for channel in channels:
+            for channel_category in channel.CategoryName:
+                category_table.add_row([channel_category.Channel_CategoryName])
+            
+            channel_table.add_row([channel.idChannel, channel.ChannelName, 
+                                   category_table.get_string()])
+            channel_table.add_divider()
+            category_table.clear_rows()
+        return channel_table
+
+
+    def _build_company_table(self, companies) ->ColorTable:
+        """Builds the company table"""
+        company_table = ColorTable(theme=Themes.EARTH)
+        company_table.field_names = ['CompanyId', 'Company Name']
+        company_table.align = 'l'
+        for company in companies:
+            company_table.add_row([company.idCompany,company.CompanyName])
+        return company_table
+
+
     def start(self) ->None:
         while True:
             self.display_menu()
@@ -0,0 +1,50 @@
+"""Provides ActionProfiler for profiling the application one action at a time."""
+
+import cProfile
+import io
+import os
+import pstats
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+
+class ActionProfiler():
+    """Runs labeled blocks (startup, each menu action) under cProfile and
+    saves every run as <seq>_<label>.pstats plus a .txt summary of the top
+    functions by cumulative time. Each process writes to its own timestamped
+    directory under output_dir.
+    """
+
+    def __init__(self, output_dir:str='profiles', top:int=30) -> None:
+        """Initializes object. """
+        self.output_dir = os.path.join(output_dir,
+                                       datetime.now().strftime('%Y%m%d-%H%M%S'))
+        self.top = top
+        self._runs = 0
+
+    @contextmanager
+    def profile(self, label:str):
+        """Profiles the enclosed block and saves it under label"""
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        profiler.enable()
+        try:
+            yield profiler
+        finally:
+            profiler.disable()
+            self._save(label, profiler, time.perf_counter() - started)
+
+    def _save(self, label:str, profiler:cProfile.Profile, seconds:float) -> None:
+        os.makedirs(self.output_dir, exist_ok=True)
+        self._runs += 1
+        path = os.path.join(self.output_dir, f"{self._runs:03d}_{label}")
+        profiler.dump_stats(path + '.pstats')
+
+        text = io.StringIO()
+        text.write(f"{label}: {seconds:.3f} s wall time\n")
+        text.write("Time spent waiting at prompts is reported under builtins.input.\n")
+        pstats.Stats(profiler, stream=text).sort_stats('cumulative').print_stats(self.top)
+        with open(path + '.txt', 'w') as f:
+            f.write(text.getvalue())
+        print(f"\tProfile saved: {path}.pstats")
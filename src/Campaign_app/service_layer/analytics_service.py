@@ -0,0 +1,140 @@
+"""Implements the AnalyticsService class."""
+
+import json
+import time
+from datetime import date
+from decimal import Decimal
+from typing import List
+
+from campaign_app.application_base import ApplicationBase
+from campaign_app.infrastructure_layer.campaign_table import CampaignTable
+from campaign_app.service_layer.app_services import AppServices
+
+
+class AnalyticsService(ApplicationBase):
+    """Computes portfolio metrics over the campaign listing: ROI (net
+    profit / budget), margin (net profit / revenue) and daily budget burn,
+    overall and rolled up by company, campaign category or channel.
+    Aggregation runs over CampaignTable columns in cents, so no Campaign
+    objects are built and money sums are exact.
+    """
+
+    DIMENSIONS = ('company', 'category', 'channel')
+
+    # CampaignTable key column per dimension; channels go through the xref
+    KEY_COLUMNS = {'company': 'idCompany', 'category': 'idCampaign_Category'}
+
+    def __init__(self, config:dict, app_services:AppServices=None)->None:
+        """Initializes object. """
+        self._config_dict = config
+        self.META = config["meta"]
+        super().__init__(subclass_name=self.__class__.__name__,
+                         logfile_prefix_name=self.META["log_prefix"])
+        self.app_services = app_services or AppServices(config)
+
+
+    def summary(self, today:date=None, table:CampaignTable=None) ->dict:
+        """Returns campaign counts, money totals, ROI, margin and the
+        combined daily burn of the campaigns active today
+        """
+        started = time.perf_counter()
+        today = today or date.today()
+        table = table if table is not None else self._load_table()
+        totals = table.totals()
+        result = {'campaigns': len(table),
+                  'active': table.column_sum(table.active_on(today)),
+                  'budget': totals['Budget'],
+                  'revenue': totals['Revenue'],
+                  'net_profit': totals['NetProfit'],
+                  'roi': self._ratio(totals['NetProfit'], totals['Budget']),
+                  'margin': self._ratio(totals['NetProfit'], totals['Revenue']),
+                  'daily_burn': self._burn(table.column_sum(table.daily_burn(today)))}
+        self._log_timing('summary', len(table), started)
+        return result
+
+
+    def rollup(self, dimension:str, today:date=None,
+               table:CampaignTable=None) ->List[dict]:
+        """Returns one metrics dictionary per company, campaign category or
+        channel, ordered by net profit, highest first, then ID. A campaign on several
+        channels counts toward each of them.
+        """
+        if dimension not in self.DIMENSIONS:
+            raise ValueError(f"Unknown analytics dimension {dimension}")
+        started = time.perf_counter()
+        today = today or date.today()
+        table = table if table is not None else self._load_table()
+        burn = table.daily_burn(today)
+        active = table.active_on(today)
+
+        if dimension == 'channel':
+            index = table.link_index(self.app_services.get_campaign_channel_links() or [])
+            counts = table.counts_by_link(index)
+            group_sums = lambda column: table.sums_by_link(index, column)
+        else:
+            key = self.KEY_COLUMNS[dimension]
+            counts = table.counts_by(key)
+            group_sums = lambda column: table.sums_by(key, column)
+
+        budgets = group_sums('Budget_cents')
+        revenues = group_sums('Revenue_cents')
+        profits = group_sums('NetProfit_cents')
+        actives = group_sums(active)
+        burns = group_sums(burn)
+        names = self._names(dimension)
+
+        rows = []
+        for key, campaigns in counts.items():
+            budget = table.to_decimal(budgets.get(key, 0))
+            revenue = table.to_decimal(revenues.get(key, 0))
+            net_profit = table.to_decimal(profits.get(key, 0))
+            rows.append({'id': key,
+                         'name': names.get(key, ''),
+                         'campaigns': campaigns,
+                         'active': int(actives.get(key, 0)),
+                         'budget': budget,
+                         'revenue': revenue,
+                         'net_profit': net_profit,
+                         'roi': self._ratio(net_profit, budget),
+                         'margin': self._ratio(net_profit, revenue),
+                         'daily_burn': self._burn(burns.get(key, 0.0))})
+        rows.sort(key=lambda row: (-row['net_profit'], row['id']))
+        self._log_timing(f"rollup {dimension}", len(table), started)
+        return rows
+
+
+    # Private Methods
+    def _load_table(self) ->CampaignTable:
+        table = self.app_services.get_campaign_columns()
+        if table is None:
+            raise RuntimeError("Campaign columns could not be loaded")
+        return table
+
+
+    def _names(self, dimension:str) ->dict:
+        """Returns display names keyed by ID for the dimension"""
+        if dimension == 'company':
+            return {c.idCompany: c.CompanyName
+                    for c in self.app_services.get_all_companies() or []}
+        if dimension == 'category':
+            return {c.idCampaign_Category: c.Campaign_CategoryName
+                    for c in self.app_services.get_all_campaign_category() or []}
+        return {row[0]: row[1] for row in self.app_services.get_channel_rows() or []}
+
+
+    @staticmethod
+    def _ratio(numerator:Decimal, denominator:Decimal) ->float:
+        """Returns numerator / denominator, None when the denominator is 0"""
+        return float(numerator / denominator) if denominator else None
+
+
+    @staticmethod
+    def _burn(cents:float) ->Decimal:
+        """Converts a burn rate in fractional cents to a Decimal amount"""
+        return CampaignTable.to_decimal(round(cents))
+
+
+    def _log_timing(self, name:str, campaigns:int, started:float) ->None:
+        seconds = time.perf_counter() - started
+        self._logger.log_info('analytics: %s', json.dumps(
+            {'report': name, 'campaigns': campaigns, 'seconds': round(seconds, 3)}))
@@ -1,14 +1,17 @@
 """Implements AppServices Class."""
 
 from campaign_app.application_base import ApplicationBase
-from campaign_app.persistence_layer.mysql_persistence_wrapper import MySQLPersistenceWrapper
+from campaign_app.persistence_layer.persistence_factory import create_persistence_wrapper
+from campaign_app.service_layer.reference_cache import ReferenceCache
 from campaign_app.infrastructure_layer.campaign import Campaign
 from campaign_app.infrastructure_layer.channel import Channel
 from campaign_app.infrastructure_layer.channel_category import Channel_Category
 from campaign_app.infrastructure_layer.company import Company
 from campaign_app.infrastructure_layer.campaign_category import Campaign_Category
-import inspect
-from typing import List
+from campaign_app.infrastructure_layer.page import Page
+from campaign_app.infrastructure_layer.bulk_insert_result import BulkInsertResult
+from campaign_app.infrastructure_layer.campaign_table import CampaignTable
+from typing import Iterator, List, Tuple
 
 class AppServices(ApplicationBase):
     """AppServices Class Definition."""
@@ -18,12 +21,30 @@ class AppServices(ApplicationBase):
         self.META = config["meta"]
         super().__init__(subclass_name=self.__class__.__name__,
                          logfile_prefix_name=self.META["log_prefix"])
-        self.DB = MySQLPersistenceWrapper(config)
+        self.DB = create_persistence_wrapper(config)
+        self.PAGE_SIZE = config.get("paging", {}).get("page_size", 25)
+        cache_config = config.get("cache", {})
+        self._reference_cache = ReferenceCache(
+            ttl_seconds=cache_config.get("ttl_seconds", 300),
+            max_entries=cache_config.get("max_entries", 16))
         
 
 
+    def transaction(self):
+        """Context manager running the enclosed calls as one unit of work:
+        one pooled connection and a single commit (or rollback) at the end.
+        The service methods log their errors and return None. If one of them
+        fails inside the block, the whole unit is rolled back and
+        TransactionRolledBack is raised when the block exits.
+
+            with app_services.transaction():
+                app_services.create_campaign(campaign)
+                ...
+        """
+        return self.DB.transaction()
+
     def get_all_campaigns(self) ->List[Campaign]:
-        self._logger.log_debug(f'In {inspect.currentframe().f_code.co_name}()...')
+        self._logger.log_debug('In get_all_campaigns()...')
         campaign_dict = {}
         campaign_dict['campaign'] =[]
 
@@ -32,10 +53,106 @@ class AppServices(ApplicationBase):
             return results
         
         except Exception as e:
-            self._logger.log_error(f'{inspect.currentframe().f_code.co_name}:{e}')
+            self._logger.log_error('get_all_campaigns:%s', e)
+
+    def get_campaign_rows(self, named:bool=False) ->List[tuple]:
+        """Returns campaign column tuples (CampaignRow with named=True)
+        without building Campaign objects or loading channels
+        """
+        self._logger.log_debug('In get_campaign_rows()...')
+        try:
+            return self.DB.select_campaign_rows(named)
+        except Exception as e:
+            self._logger.log_error('get_campaign_rows:%s', e)
+
+    def get_campaign_columns(self, backend:str=None) ->CampaignTable:
+        """Returns all campaigns as a CampaignTable of ID, date ordinal and
+        cents columns, for aggregations over the whole listing
+        """
+        self._logger.log_debug('In get_campaign_columns()...')
+        try:
+            return self.DB.select_campaign_columns(backend)
+        except Exception as e:
+            self._logger.log_error('get_campaign_columns:%s', e)
+
+    def get_campaign_channel_links(self) ->List[tuple]:
+        """Returns (idCampaign, idChannel) tuples for every campaign to
+        channel link
+        """
+        self._logger.log_debug('In get_campaign_channel_links()...')
+        try:
+            return self.DB.select_campaign_channel_links()
+        except Exception as e:
+            self._logger.log_error('get_campaign_channel_links:%s', e)
+
+    def get_campaigns_page(self, cursor:str=None, page_size:int=None) ->Page:
+        """Returns a page of campaigns after/before the cursor token"""
+        self._logger.log_debug('In get_campaigns_page()...')
+        try:
+            return self.DB.select_campaigns_page(cursor, page_size or self.PAGE_SIZE)
+        except Exception as e:
+            self._logger.log_error('get_campaigns_page:%s', e)
+
+    def get_channels_page(self, cursor:str=None, page_size:int=None) ->Page:
+        """Returns a page of channels after/before the cursor token"""
+        self._logger.log_debug('In get_channels_page()...')
+        try:
+            return self.DB.select_channels_page(cursor, page_size or self.PAGE_SIZE)
+        except Exception as e:
+            self._logger.log_error('get_channels_page:%s', e)
+
+    def get_companies_page(self, cursor:str=None, page_size:int=None) ->Page:
+        """Returns a page of companies after/before the cursor token"""
+        self._logger.log_debug('In get_companies_page()...')
+        try:
+            return self.DB.select_companies_page(cursor, page_size or self.PAGE_SIZE)
+        except Exception as e:
+            self._logger.log_error('get_companies_page:%s', e)
+
+    def stream_campaigns_with_channels(self, fetch_size:int=None) \
+        ->Iterator[Tuple[tuple, List[tuple]]]:
+        """Streams (campaign row, channel rows) without loading the table"""
+        self._logger.log_debug('In stream_campaigns_with_channels()...')
+        return self.DB.stream_campaigns_with_channels(fetch_size)
+
+    def stream_channels(self, fetch_size:int=None) ->Iterator[tuple]:
+        """Streams channel rows with their category name"""
+        self._logger.log_debug('In stream_channels()...')
+        return self.DB.stream_channels(fetch_size)
+
+    def stream_companies(self, fetch_size:int=None) ->Iterator[tuple]:
+        """Streams company rows"""
+        self._logger.log_debug('In stream_companies()...')
+        return self.DB.stream_companies(fetch_size)
+
+    def get_campaign(self, idCampaign:int) ->Campaign:
+        """Returns one campaign with its channels, or None if not found"""
+        self._logger.log_debug('In get_campaign()...')
+        try:
+            return self.DB.select_campaign_by_id(idCampaign)
+        except Exception as e:
+            self._logger.log_error('get_campaign:%s', e)
+
+    def campaign_exists(self, idCampaign:int) ->bool:
+        """Checks whether a campaign id exists"""
+        self._logger.log_debug('In campaign_exists()...')
+        try:
+            return self.DB.campaign_exists(idCampaign)
+        except Exception as e:
+            self._logger.log_error('campaign_exists:%s', e)
+            return False
+
+    def campaign_name_exists(self, campaign_name:str) ->bool:
+        """Checks whether a campaign name is already taken"""
+        self._logger.log_debug('In campaign_name_exists()...')
+        try:
+            return self.DB.campaign_name_exists(campaign_name)
+        except Exception as e:
+            self._logger.log_error('campaign_name_exists:%s', e)
+            return False
 
     def get_all_channels(self) ->List[Channel]:
-        self._logger.log_debug(f'In {inspect.currentframe().f_code.co_name}()...')
+        self._logger.log_debug('In get_all_channels()...')
         channel_dict = {}
         channel_dict['channel'] =[]
         try:
@@ -43,100 +160,200 @@ class AppServices(ApplicationBase):
             return results
         
         except Exception as e:
-            self._logger.log_error(f'{inspect.currentframe().f_code.co_name}:{e}')
+            self._logger.log_error('get_all_channels:%s', e)
         
+    def get_channel_rows(self, named:bool=False) ->List[tuple]:
+        """Returns channel column tuples with the category name (ChannelRow
+        with named=True) without building Channel objects
+        """
+        self._logger.log_debug('In get_channel_rows()...')
+        try:
+            return self.DB.select_channel_rows(named)
+        except Exception as e:
+            self._logger.log_error('get_channel_rows:%s', e)
+
     def get_all_channel_category(self) ->List[Channel_Category]:
-        self._logger.log_debug(f'In {inspect.currentframe().f_code.co_name}()...')
+        self._logger.log_debug('In get_all_channel_category()...')
         channel_category_dict = {}
         channel_category_dict['channel_cat'] =[]
         try:
-            results = self.DB.select_all_channel_categories()
+            results = self._cached('channel_categories', self.DB.select_all_channel_categories)
             return results
         
         except Exception as e:
-            self._logger.log_error(f'{inspect.currentframe().f_code.co_name}:{e}')
+            self._logger.log_error('get_all_channel_category:%s', e)
     
     def get_all_campaign_category(self) ->List[Campaign_Category]:
-        self._logger.log_debug(f'In {inspect.currentframe().f_code.co_name}()...')
+        self._logger.log_debug('In get_all_campaign_category()...')
         campaign_category_dict = {}
         campaign_category_dict['campaign_cat'] =[]
         try:
-            results = self.DB.select_all_campaign_categories()
+            results = self._cached('campaign_categories', self.DB.select_all_campaign_categories)
             return results
         
         except Exception as e:
-            self._logger.log_error(f'{inspect.currentframe().f_code.co_name}:{e}')
+            self._logger.log_error('get_all_campaign_category:%s', e)
     
     def get_all_companies(self) ->List[Company]:
-        self._logger.log_debug(f'In {inspect.currentframe().f_code.co_name}()...')
+        self._logger.log_debug('In get_all_companies()...')
         company_dict = {}
         company_dict['company'] =[]
         try:
-            results = self.DB.select_all_companies() 
+            results = self._cached('companies', self.DB.select_all_companies)
             return results
         
         except Exception as e:
-            self._logger.log_error(f'{inspect.currentframe().f_code.co_name}:{e}')
+            self._logger.log_error('get_all_companies:%s', e)
+
+    def get_cache_stats(self) ->dict:
+        """Returns reference cache hit/miss counters"""
+        stats = self._reference_cache.stats()
+        self._logger.log_debug('get_cache_stats: %s', stats)
+        return stats
+
+    def get_query_metrics(self, fmt:str='json'):
+        """Returns persistence metrics as a dict ('json') or Prometheus text"""
+        metrics = self.DB.metrics
+        if metrics is None:
+            return None
+        return metrics.to_prometheus() if fmt == 'prometheus' else metrics.to_json()
+
+    def reset_query_metrics(self) ->None:
+        """Clears the persistence metrics and pool counters"""
+        if self.DB.metrics is not None:
+            self.DB.metrics.reset()
+        self.DB.reset_pool_stats()
+
+    def get_pool_stats(self) ->dict:
+        """Returns connection pool occupancy, wait and exhaustion counters"""
+        try:
+            return self.DB.pool_stats()
+        except Exception as e:
+            self._logger.log_error('get_pool_stats:%s', e)
 
     def create_campaign(self, campaign:Campaign)->Campaign:
         """Creates a  new campaign in the database"""
-        self._logger.log_debug(f'In {inspect.currentframe().f_code.co_name}()...')
+        self._logger.log_debug('In create_campaign()...')
         try:
             results = self.DB.create_campaign(campaign)
             return results
         except Exception as e:
-            self._logger.log_error(f'{inspect.currentframe().f_code.co_name}:{e}')
+            self._logger.log_error('create_campaign:%s', e)
+    
+    def create_campaigns(self, campaigns:List[Campaign], chunk_size:int=None,
+                         stop_on_error:bool=False)->BulkInsertResult:
+        """Creates many campaigns in one transaction with batched inserts"""
+        self._logger.log_debug('In create_campaigns()...')
+        try:
+            return self.DB.create_campaigns(campaigns, chunk_size, stop_on_error)
+        except Exception as e:
+            self._logger.log_error('create_campaigns:%s', e)
     
     def update_campaign(self, campaign:Campaign)->Campaign:
         """Creates a  new campaign in the database"""
-        self._logger.log_debug(f'In {inspect.currentframe().f_code.co_name}()...')
+        self._logger.log_debug('In update_campaign()...')
         try:
             results = self.DB.update_campaign(campaign)
             return results
         except Exception as e:
-            self._logger.log_error(f'{inspect.currentframe().f_code.co_name}:{e}')
+            self._logger.log_error('update_campaign:%s', e)
     
     def delete_campaign(self, idcampaign:int):
         """Delete a campaign"""
-        self._logger.log_debug(f'In {inspect.currentframe().f_code.co_name}()...')
+        self._logger.log_debug('In delete_campaign()...')
         try:
             return self.DB.delete_campaign(idcampaign)
         except Exception as e:
-            self._logger.log_error(f"delete_campaign: {e}")
+            self._logger.log_error("delete_campaign: %s", e)
+    
+    def link_channels(self, idCampaign:int, channel_ids:List[int]) -> dict:
+        """Link channels to a campaign"""
+        self._logger.log_debug("In link_channels()...")
+        try:
+            return self.DB.link_channels(idCampaign, channel_ids)
+        except Exception as e:
+            self._logger.log_error("link_channels: %s", e)
+
+    def unlink_channels(self, idCampaign:int, channel_ids:List[int]) -> dict:
+        """Unlink channels from a campaign"""
+        self._logger.log_debug("In unlink_channels()...")
+        try:
+            return self.DB.unlink_channels(idCampaign, channel_ids)
+        except Exception as e:
+            self._logger.log_error("unlink_channels: %s", e)
+
+    def replace_channels(self, idCampaign:int, channel_ids:List[int]) -> dict:
+        """Replace the channels linked to a campaign"""
+        self._logger.log_debug("In replace_channels()...")
+        try:
+            return self.DB.replace_channels(idCampaign, channel_ids)
+        except Exception as e:
+            self._logger.log_error("replace_channels: %s", e)
+    
+    def create_campaign_channel_links(self, links:List[Tuple[int, int]],
+                                      chunk_size:int=None) -> int:
+        """Bulk links (idCampaign, idChannel) pairs"""
+        self._logger.log_debug("In create_campaign_channel_links()...")
+        try:
+            return self.DB.create_campaign_channel_links(links, chunk_size)
+        except Exception as e:
+            self._logger.log_error("create_campaign_channel_links: %s", e)
     
     def create_channel(self, channel: Channel) -> Channel:
         """Create Channel"""
-        self._logger.log_debug(f"In {inspect.currentframe().f_code.co_name}()...")
+        self._logger.log_debug("In create_channel()...")
         try:
             return self.DB.create_channel(channel)
         except Exception as e:
-            self._logger.log_error(f"create_channel: {e}")
+            self._logger.log_error("create_channel: %s", e)
     
     def create_campaign_category(self, category: Campaign_Category) -> Campaign_Category:
         """Create Campaign Category"""
-        self._logger.log_debug(f"In {inspect.currentframe().f_code.co_name}()...")
+        self._logger.log_debug("In create_campaign_category()...")
         try:
-            return self.DB.create_campaign_category(category)
+            result = self.DB.create_campaign_category(category)
+            self._invalidate('campaign_categories')
+            return result
         except Exception as e:
-            self._logger.log_error(f"create_campaign_category: {e}")
+            self._logger.log_error("create_campaign_category: %s", e)
 
     
     def create_channel_category(self, category: Channel_Category) -> Channel_Category:
         """Create Channel Category"""
-        self._logger.log_debug(f"In {inspect.currentframe().f_code.co_name}()...")
+        self._logger.log_debug("In create_channel_category()...")
         try:
-            return self.DB.create_channel_category(category)
+            result = self.DB.create_channel_category(category)
+            self._invalidate('channel_categories')
+            return result
         except Exception as e:
-            self._logger.log_error(f"create_channel_category: {e}")
+            self._logger.log_error("create_channel_category: %s", e)
     
     def create_company(self, company: Company) -> Company:
         """Create Company"""
-        self._logger.log_debug(f"In {inspect.currentframe().f_code.co_name}()...")
+        self._logger.log_debug("In create_company()...")
         try:
-            return self.DB.create_company(company)
+            result = self.DB.create_company(company)
+            self._invalidate('companies')
+            return result
         except Exception as e:
-            self._logger.log_error(f"create_company: {e}")
+            self._logger.log_error("create_company: %s", e)
 
 
+    # Private Methods
+    def _cached(self, key:str, loader):
+        """Reads a reference table through the cache. Inside a transaction
+        the cache is bypassed, since the rows may include uncommitted writes.
+        """
+        if self.DB.current_unit() is not None:
+            return loader()
+        return self._reference_cache.get_or_load(key, loader)
 
-        
\ No newline at end of file
+    def _invalidate(self, key:str) ->None:
+        """Drops a cached reference table now, or once the running
+        transaction commits
+        """
+        unit = self.DB.current_unit()
+        if unit is None:
+            self._reference_cache.invalidate(key)
+        else:
+            unit.on_commit(lambda: self._reference_cache.invalidate(key))
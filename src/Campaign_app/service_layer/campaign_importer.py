@@ -0,0 +1,194 @@
+"""Implements the CampaignImporter class."""
+
+import csv
+import json
+import time
+from decimal import Decimal
+from itertools import islice
+from typing import Iterator, List, Tuple
+
+from campaign_app.application_base import ApplicationBase
+from campaign_app.service_layer.app_services import AppServices
+from campaign_app.service_layer.campaign_validation import (parse_campaign_date,
+    validate_campaign_dates, parse_money)
+from campaign_app.infrastructure_layer.campaign import Campaign
+
+
+class CampaignImporter(ApplicationBase):
+    """Streams campaigns from a CSV or NDJSON file into the database.
+    Rows are read, validated and bulk inserted one chunk at a time so memory
+    stays bounded by the chunk size, not the file size.
+
+    Recognized columns: Campaign_Name, StartDate, EndDate, Company (name or
+    id, also idCompany/CompanyName), Campaign_Category (name or id, also
+    idCampaign_Category/Campaign_CategoryName), Budget, Revenue.
+    """
+
+    MAX_REPORTED_ERRORS = 50
+
+    def __init__(self, config:dict, app_services:AppServices=None)->None:
+        """Initializes object. """
+        self._config_dict = config
+        self.META = config["meta"]
+        super().__init__(subclass_name=self.__class__.__name__,
+                         logfile_prefix_name=self.META["log_prefix"])
+        self.app_services = app_services or AppServices(config)
+        self._company_ids = {}
+        self._category_ids = {}
+
+
+    def import_file(self, filename:str, chunk_size:int=None) ->dict:
+        """Imports the file and returns a summary dictionary"""
+        chunk_size = chunk_size or self.app_services.DB.BULK_CHUNK_SIZE
+        self._load_lookups()
+
+        summary = {'file': filename, 'rows': 0, 'inserted': 0, 'failed': 0,
+                   'errors': [], 'seconds': 0.0}
+        started = time.perf_counter()
+
+        with open(filename, 'r', newline='', encoding='utf-8') as f:
+            rows = self._read_rows(f, filename)
+            line_number = 1
+            while True:
+                chunk = list(islice(rows, chunk_size))
+                if not chunk:
+                    break
+                campaigns, lines, errors = self._validate_chunk(chunk, line_number)
+                line_number += len(chunk)
+                summary['rows'] += len(chunk)
+                self._record_errors(summary, errors)
+
+                if campaigns:
+                    result = self.app_services.create_campaigns(campaigns, chunk_size)
+                    if result is None:
+                        self._record_errors(summary,
+                            [(line, "Insert failed, see log") for line in lines])
+                    else:
+                        summary['inserted'] += len(result.inserted)
+                        self._record_errors(summary,
+                            [(lines[f['index']], f['error']) for f in result.failures])
+
+                self._report_progress(summary, started)
+
+        summary['seconds'] = round(time.perf_counter() - started, 3)
+        self._logger.log_info('import_file: %s', json.dumps(summary))
+        return summary
+
+
+    # Private Methods
+    def _load_lookups(self) ->None:
+        """Builds the one-time name/id maps for companies and categories"""
+        self._company_ids = {}
+        for company in self.app_services.get_all_companies() or []:
+            self._company_ids[str(company.idCompany)] = company.idCompany
+            self._company_ids[company.CompanyName.lower()] = company.idCompany
+
+        self._category_ids = {}
+        for category in self.app_services.get_all_campaign_category() or []:
+            self._category_ids[str(category.idCampaign_Category)] = category.idCampaign_Category
+            self._category_ids[category.Campaign_CategoryName.lower()] = \
+                category.idCampaign_Category
+
+
+    def _read_rows(self, f, filename:str) ->Iterator[dict]:
+        """Yields one dictionary per CSV record or NDJSON line. An NDJSON
+        line that is not a JSON object is yielded as the ValueError
+        describing it, so it is reported as a row error.
+        """
+        if filename.lower().endswith(('.ndjson', '.jsonl', '.json')):
+            for line in f:
+                if line.strip():
+                    try:
+                        # Keep money written as JSON numbers exact
+                        row = json.loads(line, parse_float=Decimal)
+                    except ValueError as e:
+                        yield ValueError(f"Invalid JSON: {e}")
+                        continue
+                    if not isinstance(row, dict):
+                        yield ValueError("Invalid row: expected a JSON object.")
+                        continue
+                    yield row
+        else:
+            yield from csv.DictReader(f)
+
+
+    def _validate_chunk(self, chunk:List[dict], first_line:int) \
+        ->Tuple[List[Campaign], List[int], List[Tuple[int, str]]]:
+        """Returns valid campaigns, their source line numbers and row errors"""
+        campaigns = []
+        lines = []
+        errors = []
+        for offset, row in enumerate(chunk):
+            line = first_line + offset
+            if isinstance(row, ValueError):
+                errors.append((line, str(row)))
+                continue
+            try:
+                campaigns.append(self._row_to_campaign(row))
+                lines.append(line)
+            except ValueError as e:
+                errors.append((line, str(e)))
+        return campaigns, lines, errors
+
+
+    def _row_to_campaign(self, row:dict) ->Campaign:
+        """Applies the add_campaign rules to one row. Raises ValueError."""
+        name = str(row.get('Campaign_Name') or '').strip()
+        if not name:
+            raise ValueError("Campaign Name cannot be empty.")
+
+        try:
+            start_date = parse_campaign_date(row.get('StartDate'))
+            end_date = parse_campaign_date(row.get('EndDate'))
+        except ValueError:
+            raise ValueError("Invalid date format. Use YYYY-MM-DD.")
+        date_error = validate_campaign_dates(start_date, end_date)
+        if date_error:
+            raise ValueError(date_error)
+
+        company = self._first_value(row, 'idCompany', 'Company', 'CompanyName')
+        company_id = self._company_ids.get(company.lower())
+        if company_id is None:
+            raise ValueError(f"Invalid Company: {company}")
+
+        category = self._first_value(row, 'idCampaign_Category', 'Campaign_Category',
+                                     'Campaign_CategoryName')
+        category_id = self._category_ids.get(category.lower())
+        if category_id is None:
+            raise ValueError(f"Invalid Campaign Category: {category}")
+
+        campaign = Campaign()
+        campaign.Campaign_Name = name
+        campaign.StartDate = start_date
+        campaign.EndDate = end_date
+        campaign.idCompany = company_id
+        campaign.idCampaign_Category = category_id
+        campaign.Budget = parse_money(row.get('Budget', 0) or 0)
+        campaign.Revenue = parse_money(row.get('Revenue', 0) or 0)
+        return campaign
+
+
+    def _first_value(self, row:dict, *columns) ->str:
+        """Returns the first non-blank value among the given columns"""
+        for column in columns:
+            value = row.get(column)
+            if value is not None and str(value).strip() != "":
+                return str(value).strip()
+        return ""
+
+
+    def _record_errors(self, summary:dict, errors:List[Tuple[int, str]]) ->None:
+        """Counts errors, keeping only the first few messages"""
+        summary['failed'] += len(errors)
+        for line, message in errors:
+            self._logger.log_warning('Import row %s: %s', line, message)
+            if len(summary['errors']) < self.MAX_REPORTED_ERRORS:
+                summary['errors'].append({'row': line, 'error': message})
+
+
+    def _report_progress(self, summary:dict, started:float) ->None:
+        """Prints rows processed so far and the current rate"""
+        elapsed = time.perf_counter() - started
+        rate = summary['rows'] / elapsed if elapsed > 0 else 0.0
+        print(f"\tProcessed {summary['rows']:,} rows: {summary['inserted']:,} inserted, " \
+              f"{summary['failed']:,} failed ({rate:,.0f} rows/s)")
@@ -0,0 +1,45 @@
+"""Campaign field validation rules shared by the console and bulk import."""
+
+from datetime import date
+from decimal import Decimal, InvalidOperation
+
+
+def parse_campaign_date(date_str:str) -> date:
+    """Parses YYYY-MM-DD or YYYY/MM/DD. Blank returns None.
+    Raises ValueError on a bad format or a value that is not text.
+    """
+    if date_str is None:
+        return None
+    if not isinstance(date_str, str):
+        raise ValueError(f"Invalid date: {date_str!r}")
+    if date_str.strip() == "":
+        return None
+    return date.fromisoformat(date_str.strip().replace("/", "-"))
+
+
+def validate_campaign_dates(start_date:date, end_date:date) -> str:
+    """Returns an error message, or None when the dates are valid."""
+    if start_date is None:
+        return "Start Date is required."
+    if start_date > date.today():
+        return "Invalid date. Date cannot be in the future"
+    if end_date is not None:
+        if end_date > date.today():
+            return "End Date cannot be in the future"
+        if end_date < start_date:
+            return "End Date cannot be before Start Date."
+    return None
+
+
+def parse_money(amount_str:str) -> Decimal:
+    """Parses a Budget/Revenue amount. Raises ValueError if not a number."""
+    if isinstance(amount_str, bool) or \
+            not isinstance(amount_str, (str, int, float, Decimal)):
+        raise ValueError(f"Invalid amount: {amount_str!r}")
+    try:
+        amount = Decimal(str(amount_str).strip().replace(",", ""))
+    except InvalidOperation:
+        raise ValueError(f"Invalid amount: {amount_str}")
+    if not amount.is_finite():
+        raise ValueError(f"Invalid amount: {amount_str}")
+    return amount
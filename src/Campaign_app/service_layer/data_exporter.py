@@ -0,0 +1,147 @@
+"""Implements the DataExporter class."""
+
+import csv
+import json
+import time
+from datetime import date
+from decimal import Decimal
+from typing import Iterator
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from campaign_app.application_base import ApplicationBase
+from campaign_app.service_layer.app_services import AppServices
+
+
+class DataExporter(ApplicationBase):
+    """Streams campaigns, channels or companies to CSV or NDJSON.
+    Rows are written as they arrive from the database so memory use does
+    not depend on the table size.
+
+    NDJSON is written with json.dumps unless the orjson backend is chosen
+    (export.json_backend in the config, or the backend argument). orjson
+    is faster but writes compact JSON, so the output bytes differ.
+    """
+
+    ENTITIES = ('campaigns', 'channels', 'companies')
+
+    JSON_BACKENDS = ('json', 'orjson')
+
+    CAMPAIGN_FIELDS = ['idCampaign', 'Campaign_Name', 'StartDate', 'EndDate',
+                       'idCompany', 'idCampaign_Category', 'Budget', 'Revenue',
+                       'NetProfit']
+    CHANNEL_FIELDS = ['idChannel', 'ChannelName', 'idChannel_Category',
+                      'Channel_CategoryName']
+    COMPANY_FIELDS = ['idCompany', 'CompanyName']
+
+    PROGRESS_EVERY = 100000
+
+    def __init__(self, config:dict, app_services:AppServices=None)->None:
+        """Initializes object. """
+        self._config_dict = config
+        self.META = config["meta"]
+        super().__init__(subclass_name=self.__class__.__name__,
+                         logfile_prefix_name=self.META["log_prefix"])
+        self.app_services = app_services or AppServices(config)
+        self.JSON_BACKEND = config.get("export", {}).get("json_backend", "json")
+
+
+    def export(self, entity:str, filename:str, fmt:str=None, backend:str=None) ->dict:
+        """Writes entity rows to filename and returns a throughput summary"""
+        if entity not in self.ENTITIES:
+            raise ValueError(f"Unknown export entity {entity}")
+        fmt = fmt or ('csv' if filename.lower().endswith('.csv') else 'ndjson')
+        backend = backend or self.JSON_BACKEND
+        encode = self._json_encoder(backend)
+
+        fields, records = self._records_for(entity)
+        started = time.perf_counter()
+        count = 0
+
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            if fmt == 'csv':
+                writer = csv.DictWriter(f, fieldnames=fields, extrasaction='ignore')
+                writer.writeheader()
+                write = lambda record: writer.writerow(self._csv_record(record))
+            else:
+                write = lambda record: f.write(encode(record) + '\n')
+
+            for record in records:
+                write(record)
+                count += 1
+                if count % self.PROGRESS_EVERY == 0:
+                    self._report_progress(entity, count, started)
+
+        seconds = time.perf_counter() - started
+        summary = {'entity': entity, 'file': filename, 'format': fmt, 'rows': count,
+                   'json_backend': None if fmt == 'csv' else backend,
+                   'seconds': round(seconds, 3),
+                   'rows_per_second': round(count / seconds, 1) if seconds > 0 else None}
+        self._logger.log_info('export: %s', json.dumps(summary))
+        return summary
+
+
+    # Private Methods
+    def _records_for(self, entity:str):
+        """Returns (CSV field names, generator of record dictionaries)"""
+        if entity == 'campaigns':
+            return self.CAMPAIGN_FIELDS + ['Channels'], self._campaign_records()
+        if entity == 'channels':
+            return self.CHANNEL_FIELDS, self._tuple_records(
+                self.CHANNEL_FIELDS, self.app_services.stream_channels())
+        return self.COMPANY_FIELDS, self._tuple_records(
+            self.COMPANY_FIELDS, self.app_services.stream_companies())
+
+
+    def _campaign_records(self) ->Iterator[dict]:
+        """Yields one campaign dictionary with a nested channel list"""
+        for campaign_row, channel_rows in self.app_services.stream_campaigns_with_channels():
+            record = dict(zip(self.CAMPAIGN_FIELDS, campaign_row))
+            record['Channels'] = [
+                {'idChannel': row[0], 'ChannelName': row[1], 'idChannel_Category': row[2]}
+                for row in channel_rows]
+            yield record
+
+
+    def _tuple_records(self, fields, rows) ->Iterator[dict]:
+        """Yields rows as dictionaries keyed by field name"""
+        for row in rows:
+            yield dict(zip(fields, row))
+
+
+    def _csv_record(self, record:dict) ->dict:
+        """Flattens the channel list to a '|' separated name column"""
+        if 'Channels' in record:
+            record = dict(record)
+            record['Channels'] = '|'.join(c['ChannelName'] for c in record['Channels'])
+        return record
+
+
+    def _json_encoder(self, backend:str):
+        """Returns a function encoding one record as a line of JSON"""
+        if backend not in self.JSON_BACKENDS:
+            raise ValueError(f"Unknown JSON backend {backend}")
+        if backend == 'orjson':
+            if orjson is None:
+                raise ValueError("The orjson backend needs the orjson package")
+            return lambda record: orjson.dumps(record, default=self._json_default).decode()
+        return lambda record: json.dumps(record, default=self._json_default)
+
+
+    def _json_default(self, value):
+        """Encodes Decimal and date values exactly, as strings"""
+        if isinstance(value, Decimal):
+            return str(value)
+        if isinstance(value, date):
+            return value.isoformat()
+        raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+    def _report_progress(self, entity:str, count:int, started:float) ->None:
+        """Prints rows written so far and the current rate"""
+        elapsed = time.perf_counter() - started
+        rate = count / elapsed if elapsed > 0 else 0.0
+        print(f"\tExported {count:,} {entity} ({rate:,.0f} rows/s)")
@@ -0,0 +1,79 @@
+"""Implements the ReferenceCache class."""
+
+import time
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+
+class ReferenceCache():
+    """Read-through cache for rarely changing reference tables.
+    Entries expire after ttl_seconds and the least recently used entry is
+    evicted once max_entries is reached. Lists are stored as tuples and
+    handed out as fresh lists, so callers cannot change the cached value.
+    """
+
+    def __init__(self, ttl_seconds:float=300, max_entries:int=16)->None:
+        """Initializes object. """
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped by invalidate(); a load that started before it is not stored
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_load(self, key:str, loader:Callable):
+        """Returns the cached value for key, calling loader() on a miss.
+        A loader result of None (a failed query) is not cached.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._copy(entry[1])
+            self.misses += 1
+            generation = self._generation
+
+        value = loader()
+        if value is None:
+            return None
+        if isinstance(value, list):
+            value = tuple(value)
+        with self._lock:
+            if generation == self._generation:
+                self._entries[key] = (now + self._ttl_seconds, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self._max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return self._copy(value)
+
+    def invalidate(self, key:str=None)->None:
+        """Drops one entry, or every entry when no key is given."""
+        with self._lock:
+            self._generation += 1
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    @staticmethod
+    def _copy(value):
+        return list(value) if isinstance(value, tuple) else value
+
+    def stats(self)->dict:
+        """Returns hit/miss counters and current size."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'ttl_seconds': self._ttl_seconds,
+                'max_entries': self._max_entries
+            }
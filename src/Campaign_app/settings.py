@@ -1,7 +1,9 @@
 """Manage applicaion settings."""
 
 import json
+import os
 import platform
+import threading
 from pathlib import Path
 
 class Settings():
@@ -27,6 +29,8 @@ class Settings():
                 settings['log_to_console'] = True
                 settings['log_to_file'] = True
                 settings['deployed_to_production'] = False
+                settings['log_async'] = False
+                settings['hot_reload'] = False
                 
             case _:
                 settings['logs_dir'] = 'logs'
@@ -35,6 +39,8 @@ class Settings():
                 settings['log_to_console'] = True
                 settings['log_to_file'] = True
                 settings['deployed_to_production'] = False    
+                settings['log_async'] = False
+                settings['hot_reload'] = False
         try:
             with open(filename, 'w') as f:
                 f.write(json.dumps(settings))
@@ -58,4 +64,99 @@ class Settings():
         return settings
 
 
+class SettingsRegistry():
+    """Process-wide settings shared by every ApplicationBase subclass.
+    Each settings file is parsed once. With "hot_reload": true in the file,
+    a background thread re-reads it when its mtime changes, updates the
+    shared dictionary in place and notifies the registered listeners.
+    """
 
+    DEFAULT_RELOAD_INTERVAL_SECONDS = 2.0
+
+    _lock = threading.RLock()
+    _entries = {}
+    _listeners = []
+    _watcher = None
+    _stop_watcher = threading.Event()
+
+    @classmethod
+    def get(cls, filename:str='app_settings.json') -> dict:
+        """Returns the shared settings dictionary for filename"""
+        entry = cls._entries.get(filename)
+        if entry is None:
+            with cls._lock:
+                entry = cls._entries.get(filename)
+                if entry is None:
+                    entry = {'settings': Settings().read_settings_file_from_location(filename),
+                             'mtime': cls._mtime(filename)}
+                    cls._entries[filename] = entry
+                    if entry['settings'].get('hot_reload'):
+                        cls._start_watcher(entry['settings'].get(
+                            'hot_reload_interval_seconds',
+                            cls.DEFAULT_RELOAD_INTERVAL_SECONDS))
+        return entry['settings']
+
+    @classmethod
+    def add_listener(cls, listener) -> None:
+        """Registers listener(filename, settings), called after each reload"""
+        with cls._lock:
+            if listener not in cls._listeners:
+                cls._listeners.append(listener)
+
+    @classmethod
+    def reload_if_changed(cls) -> bool:
+        """Re-reads every settings file whose mtime changed. Returns True
+        if any file was reloaded.
+        """
+        reloaded = []
+        with cls._lock:
+            for filename, entry in cls._entries.items():
+                mtime = cls._mtime(filename)
+                if mtime is None or mtime == entry['mtime']:
+                    continue
+                try:
+                    with open(filename, 'r') as f:
+                        settings = json.loads(f.read())
+                except (OSError, ValueError):
+                    # Partially written file; try again on the next check
+                    continue
+                entry['mtime'] = mtime
+                entry['settings'].clear()
+                entry['settings'].update(settings)
+                reloaded.append((filename, entry['settings']))
+            listeners = list(cls._listeners)
+
+        for filename, settings in reloaded:
+            for listener in listeners:
+                listener(filename, settings)
+        return bool(reloaded)
+
+    @classmethod
+    def reset(cls) -> None:
+        """Stops the watcher and forgets every parsed file"""
+        with cls._lock:
+            cls._stop_watcher.set()
+            cls._watcher = None
+            cls._entries = {}
+
+    @classmethod
+    def _start_watcher(cls, interval:float) -> None:
+        if cls._watcher is not None:
+            return
+        stop = threading.Event()
+        cls._stop_watcher = stop
+
+        def watch():
+            while not stop.wait(interval):
+                cls.reload_if_changed()
+
+        cls._watcher = threading.Thread(target=watch, name='SettingsRegistryWatcher',
+                                        daemon=True)
+        cls._watcher.start()
+
+    @staticmethod
+    def _mtime(filename:str):
+        try:
+            return os.stat(filename).st_mtime_ns
+        except OSError:
+            return None
@@ -2,7 +2,11 @@
 
 import json
 from argparse import ArgumentParser
+from contextlib import nullcontext
+from campaign_app.profiling import ActionProfiler
 from campaign_app.presentation_layer.console_ui import ConsoleUI
+from campaign_app.service_layer.campaign_importer import CampaignImporter
+from campaign_app.service_layer.data_exporter import DataExporter
 
 
 
@@ -14,8 +18,29 @@ def main():
 		config = None
 		with open(args.configfile, 'r') as f:
 			config = json.loads(f.read())
+
+		profiler = ActionProfiler(args.profile_dir) if args.profile else None
+
+		def profiled(label):
+			return profiler.profile(label) if profiler else nullcontext()
+
+		if args.importfile:
+			with profiled('import'):
+				importer = CampaignImporter(config)
+				summary = importer.import_file(args.importfile, args.chunksize)
+			print(json.dumps(summary, indent=2))
+			return
+
+		if args.export:
+			with profiled('export'):
+				exporter = DataExporter(config)
+				summary = exporter.export(args.export, args.output, args.format,
+					args.json_backend)
+			print(json.dumps(summary, indent=2))
+			return
 			
-		ui = ConsoleUI(config)
+		with profiled('startup'):
+			ui = ConsoleUI(config, profiler=profiler)
 		ui.start()
 			
 
@@ -29,7 +54,27 @@ def configure_and_parse_commandline_arguments():
 	parser.add_argument('-c','--configfile',
 					help="Configuration file to load.",
 					required=True)
+	parser.add_argument('--import', dest='importfile',
+					help="CSV or NDJSON file of campaigns to bulk import, then exit.")
+	parser.add_argument('--chunk-size', dest='chunksize', type=int,
+					help="Rows per batch for --import (default: database.bulk.chunk_size).")
+	parser.add_argument('--export', choices=DataExporter.ENTITIES,
+					help="Stream a table to --output, then exit.")
+	parser.add_argument('--output',
+					help="Output file for --export.")
+	parser.add_argument('--format', choices=['csv', 'ndjson'],
+					help="Export format (default: from --output extension).")
+	parser.add_argument('--json-backend', dest='json_backend',
+					choices=DataExporter.JSON_BACKENDS,
+					help="NDJSON encoder for --export; orjson is faster but writes compact "
+						 "JSON (default: export.json_backend, else json).")
+	parser.add_argument('--profile', action='store_true',
+					help="Profile startup and each menu action to separate pstats files.")
+	parser.add_argument('--profile-dir', dest='profile_dir', default='profiles',
+					help="Directory for --profile output (default: profiles).")
 	args = parser.parse_args()
+	if args.export and not args.output:
+		parser.error("--export requires --output")
 	return args
 
 
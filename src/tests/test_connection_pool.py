@@ -0,0 +1,164 @@
+"""Tests for ConnectionPool.
+
+Run from src/:
+    python -m unittest discover -s tests
+"""
+
+import threading
+import time
+import unittest
+
+from campaign_app.persistence_layer.connection_pool import ConnectionPool, PoolTimeoutError
+
+
+class FakeConnection():
+    """Driver connection stand-in that records close()."""
+
+    def __init__(self, number:int) -> None:
+        self.number = number
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FakeDriver():
+    """connect() callable numbering its connections; fails while failing is set."""
+
+    def __init__(self) -> None:
+        self.opened = []
+        self.failing = False
+
+    def __call__(self) -> FakeConnection:
+        if self.failing:
+            raise ConnectionError("server down")
+        cnx = FakeConnection(len(self.opened))
+        self.opened.append(cnx)
+        return cnx
+
+
+class ConnectionPoolTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.driver = FakeDriver()
+
+    def pool(self, **kwargs) -> ConnectionPool:
+        kwargs.setdefault('size', 2)
+        kwargs.setdefault('acquire_timeout', 1.0)
+        return ConnectionPool(self.driver, **kwargs)
+
+    def test_timeout_raises_pool_timeout_error(self):
+        pool = self.pool(size=1, acquire_timeout=0.05)
+        held = pool.get_connection()
+        started = time.monotonic()
+        with self.assertRaises(PoolTimeoutError):
+            pool.get_connection()
+        self.assertGreaterEqual(time.monotonic() - started, 0.05)
+        stats = pool.stats()
+        self.assertEqual(stats['timeouts'], 1)
+        self.assertEqual(stats['exhausted'], 1)
+        self.assertEqual(stats['in_use'], 1)
+        held.close()
+        self.assertEqual(pool.stats()['in_use'], 0)
+
+    def test_waiter_is_woken_on_release(self):
+        pool = self.pool(size=1, acquire_timeout=5.0)
+        held = pool.get_connection()
+        result = {}
+
+        def wait_for_connection():
+            started = time.monotonic()
+            with pool.get_connection() as cnx:
+                result['number'] = cnx.number
+            result['waited'] = time.monotonic() - started
+
+        waiter = threading.Thread(target=wait_for_connection)
+        waiter.start()
+        while pool.stats()['waiting'] == 0:
+            time.sleep(0.001)
+        held.close()
+        waiter.join(2.0)
+
+        self.assertFalse(waiter.is_alive())
+        # The released connection is reused, not a second one opened
+        self.assertEqual(result['number'], 0)
+        self.assertLess(result['waited'], 2.0)
+        self.assertEqual(len(self.driver.opened), 1)
+        self.assertEqual(pool.stats()['exhausted'], 1)
+        self.assertEqual(pool.stats()['timeouts'], 0)
+
+    def test_failed_connect_restores_counters(self):
+        pool = self.pool(size=1)
+        self.driver.failing = True
+        with self.assertRaises(ConnectionError):
+            pool.get_connection()
+        self.assertEqual(pool._open, 0)
+        self.assertEqual(pool._in_use, 0)
+
+        # The slot is free again once the server is back
+        self.driver.failing = False
+        with pool.get_connection() as cnx:
+            self.assertEqual(pool.stats()['in_use'], 1)
+        self.assertEqual(pool.stats()['open'], 1)
+
+    def test_failed_reconnect_after_validation_restores_counters(self):
+        pool = self.pool(size=1, validate=lambda cnx: False, validate_idle_seconds=0)
+        pool.get_connection().close()
+        self.driver.failing = True
+        with self.assertRaises(ConnectionError):
+            pool.get_connection()
+        self.assertEqual(pool._open, 0)
+        self.assertEqual(pool._in_use, 0)
+        self.assertTrue(self.driver.opened[0].closed)
+        self.assertEqual(pool.stats()['validation_failures'], 1)
+
+    def test_failed_reset_discards_connection(self):
+        def reset(cnx):
+            raise RuntimeError("reset failed")
+
+        pool = self.pool(size=1, reset=reset)
+        first = pool.get_connection()
+        raw = first._cnx
+        first.close()
+
+        self.assertTrue(raw.closed)
+        stats = pool.stats()
+        self.assertEqual(stats['discarded'], 1)
+        self.assertEqual(stats['open'], 0)
+        self.assertEqual(stats['in_use'], 0)
+        self.assertEqual(stats['idle'], 0)
+        with pool.get_connection() as cnx:
+            self.assertIsNot(cnx._cnx, raw)
+
+    def test_prewarm_opens_up_to_min_size(self):
+        pool = self.pool(size=4, min_size=3)
+        self.assertEqual(pool.prewarm(), 3)
+        self.assertEqual(pool.stats()['idle'], 3)
+        self.assertEqual(pool.stats()['open'], 3)
+        # Already warm: nothing more to open
+        self.assertEqual(pool.prewarm(), 0)
+        self.assertEqual(len(self.driver.opened), 3)
+
+    def test_prewarm_min_size_is_capped_by_size(self):
+        pool = self.pool(size=2, min_size=5)
+        self.assertEqual(pool.prewarm(), 2)
+        self.assertEqual(pool.stats()['open'], 2)
+
+    def test_prewarm_failure_keeps_opened_connections(self):
+        pool = self.pool(size=4, min_size=3)
+        connect = self.driver
+
+        def flaky():
+            if len(connect.opened) == 2:
+                raise ConnectionError("server down")
+            return connect()
+
+        pool._connect = flaky
+        with self.assertRaises(ConnectionError):
+            pool.prewarm()
+        self.assertEqual(pool.stats()['open'], 2)
+        self.assertEqual(pool.stats()['idle'], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+"""Tests for DataExporter's NDJSON output and the domain to_json methods.
+
+Run from src/:
+    python -m unittest discover -s tests
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from datetime import date
+from decimal import Decimal
+
+from campaign_app.infrastructure_layer.campaign import Campaign
+from campaign_app.infrastructure_layer.channel import Channel
+from campaign_app.infrastructure_layer.channel_category import Channel_Category
+from campaign_app.service_layer.app_services import AppServices
+from campaign_app.service_layer.data_exporter import DataExporter, orjson
+
+
+CONFIG = {
+    "meta": {"version": "v1", "app_name": "Campaign Channel",
+             "log_prefix": "Campaign_Channel_app"},
+    "database": {"backend": "sqlite",
+                 "sqlite": {"path": ":memory:",
+                            "seed_file": "Database/DB_Create_V3/Create_Insert.sql"},
+                 "metrics": {"enabled": False},
+                 "slow_query": {"enabled": False}}
+}
+
+
+def expected_campaign_lines(app_services:AppServices) -> list:
+    """The campaign records written with json.dumps' default separators,
+    money as decimal strings and dates as ISO strings
+    """
+    lines = []
+    for row, channel_rows in app_services.stream_campaigns_with_channels():
+        record = dict(zip(DataExporter.CAMPAIGN_FIELDS, row))
+        for field in ('StartDate', 'EndDate'):
+            record[field] = record[field].isoformat() if record[field] else None
+        for field in ('Budget', 'Revenue', 'NetProfit'):
+            record[field] = str(record[field])
+        record['Channels'] = [{'idChannel': c[0], 'ChannelName': c[1],
+                               'idChannel_Category': c[2]} for c in channel_rows]
+        lines.append(json.dumps(record))
+    return lines
+
+
+class DataExporterTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.app_services = AppServices(CONFIG)
+        self.exporter = DataExporter(CONFIG, self.app_services)
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def export_lines(self, entity:str, backend:str=None) -> list:
+        filename = os.path.join(self.directory.name, f"{entity}.ndjson")
+        summary = self.exporter.export(entity, filename, backend=backend)
+        with open(filename, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        self.assertEqual(summary['rows'], len(lines))
+        return lines
+
+    def test_json_backend_is_the_default(self):
+        self.assertEqual(self.exporter.JSON_BACKEND, 'json')
+        self.assertEqual(self.export_lines('campaigns'),
+                         expected_campaign_lines(self.app_services))
+
+    def test_json_backend_output(self):
+        lines = self.export_lines('campaigns', 'json')
+        self.assertEqual(lines, expected_campaign_lines(self.app_services))
+        record = json.loads(lines[1])
+        self.assertEqual(record['Budget'], '100000000.00')
+        self.assertEqual(record['StartDate'], '2012-07-27')
+        self.assertIn('"idCampaign": 2, "Campaign_Name": "Find Your Greatness"', lines[1])
+
+    def test_companies_output(self):
+        self.assertEqual(self.export_lines('companies', 'json')[0],
+                         '{"idCompany": 1, "CompanyName": "Lamborghini"}')
+
+    def test_backend_from_config(self):
+        config = dict(CONFIG, export={'json_backend': 'json'})
+        exporter = DataExporter(config, self.app_services)
+        self.assertEqual(exporter.JSON_BACKEND, 'json')
+
+    def test_unknown_backend_raises(self):
+        with self.assertRaises(ValueError):
+            self.export_lines('companies', 'simplejson')
+
+    @unittest.skipUnless(orjson is not None, "orjson is not installed")
+    def test_orjson_backend_writes_the_same_values_compactly(self):
+        lines = self.export_lines('campaigns', 'orjson')
+        expected = expected_campaign_lines(self.app_services)
+        self.assertEqual([json.loads(line) for line in lines],
+                         [json.loads(line) for line in expected])
+        self.assertEqual(lines, [json.dumps(json.loads(line), separators=(',', ':'),
+                                            ensure_ascii=False) for line in expected])
+
+
+class ToJsonTest(unittest.TestCase):
+
+    def test_campaign_to_json(self):
+        category = Channel_Category.interned(1, "Social")
+        channel = Channel()
+        channel.idChannel = 4
+        channel.ChannelName = "Instagram"
+        channel.idChannel_Category = 1
+        channel.CategoryName = (category,)
+        campaign = Campaign()
+        campaign.idCampaign = 2
+        campaign.Campaign_Name = "Launch"
+        campaign.StartDate = date(2024, 1, 2)
+        campaign.EndDate = None
+        campaign.Budget = Decimal('0.0')
+        campaign.channel = [channel]
+
+        self.assertEqual(json.loads(campaign.to_json()), {
+            'idCampaign': 2, 'Campaign_Name': "Launch", 'StartDate': '2024-01-02',
+            'EndDate': None, 'idCompany': 0, 'idCampaign_Category': 0,
+            'Budget': 0.0, 'Revenue': 0.0, 'NetProfit': 0.0,
+            'channel': [{'idChannel': 4, 'ChannelName': "Instagram", 'idChannel_Category': 1,
+                         'CategoryName': [category.to_dict()]}]})
+        self.assertIn('"Budget": 0.0,', campaign.to_json())
+        self.assertIn('"Category Name": [', channel.to_json())
+
+
+if __name__ == "__main__":
+    unittest.main()
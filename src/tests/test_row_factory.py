@@ -0,0 +1,60 @@
+"""Tests for the row factories.
+
+Run from src/:
+    python -m unittest discover -s tests
+"""
+
+import unittest
+from datetime import date
+from decimal import Decimal
+
+from campaign_app.infrastructure_layer.company import Company
+from campaign_app.persistence_layer.row_factory import (CampaignRow, hydrate_campaigns,
+    hydrate_channels, hydrate_companies, named_rows, row_factory)
+
+
+CAMPAIGN_ROWS = [(1, "Launch", date(2024, 1, 2), None, 3, 4, Decimal('10.00'),
+                  Decimal('25.50'), Decimal('15.50')),
+                 (2, "Rebrand", None, None, 5, 6, Decimal('0.00'), Decimal('0.00'),
+                  Decimal('0.00'))]
+
+
+class RowFactoryTest(unittest.TestCase):
+
+    def test_campaigns_get_every_column(self):
+        campaigns = hydrate_campaigns(CAMPAIGN_ROWS)
+        self.assertEqual([(c.idCampaign, c.Campaign_Name, c.StartDate, c.EndDate,
+                           c.idCompany, c.idCampaign_Category, c.Budget, c.Revenue,
+                           c.NetProfit) for c in campaigns], CAMPAIGN_ROWS)
+
+    def test_callable_default_gives_each_object_its_own_value(self):
+        first, second = hydrate_campaigns(CAMPAIGN_ROWS)
+        self.assertEqual(first.channel, [])
+        self.assertIsNot(first.channel, second.channel)
+
+    def test_channels_skip_leading_columns(self):
+        channels = hydrate_channels([(9, 1, "TV", 2), (9, 2, "Radio", 3)], skip=1)
+        self.assertEqual([(c.idChannel, c.ChannelName, c.idChannel_Category, c.CategoryName)
+                          for c in channels], [(1, "TV", 2, ()), (2, "Radio", 3, ())])
+        self.assertEqual(hydrate_channels([]), [])
+
+    def test_accepts_any_iterable(self):
+        companies = hydrate_companies(iter([(1, "Acme"), (2, "Nike")]))
+        self.assertEqual([c.CompanyName for c in companies], ["Acme", "Nike"])
+
+    def test_factories_are_cached_per_shape(self):
+        fields = ('idCompany', 'CompanyName')
+        self.assertIs(row_factory(Company, fields), row_factory(Company, fields))
+
+    def test_unset_slot_raises(self):
+        with self.assertRaises(ValueError):
+            row_factory(Company, ('idCompany',), width=2)
+
+    def test_named_rows(self):
+        rows = named_rows(CampaignRow, CAMPAIGN_ROWS)
+        self.assertEqual(rows[0].Campaign_Name, "Launch")
+        self.assertEqual(rows, CAMPAIGN_ROWS)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""Tests for AppServices.transaction() on the in-memory SQLite backend.
+
+Run from src/:
+    python -m unittest discover -s tests
+"""
+
+import unittest
+from datetime import date
+from decimal import Decimal
+
+from campaign_app.infrastructure_layer.campaign import Campaign
+from campaign_app.infrastructure_layer.company import Company
+from campaign_app.persistence_layer.unit_of_work import TransactionRolledBack
+from campaign_app.service_layer.app_services import AppServices
+
+
+CONFIG = {
+    "meta": {"version": "v1", "app_name": "Campaign Channel",
+             "log_prefix": "Campaign_Channel_app"},
+    "database": {"backend": "sqlite",
+                 "sqlite": {"path": ":memory:",
+                            "seed_file": "Database/DB_Create_V3/Create_Insert.sql"},
+                 "metrics": {"enabled": True},
+                 "slow_query": {"enabled": False}},
+    "cache": {"ttl_seconds": 300, "max_entries": 16}
+}
+
+
+def new_campaign(name:str) -> Campaign:
+    campaign = Campaign()
+    campaign.Campaign_Name = name
+    campaign.StartDate = date(2024, 1, 1)
+    campaign.EndDate = date(2024, 6, 30)
+    campaign.idCompany = 1
+    campaign.idCampaign_Category = 1
+    campaign.Budget = Decimal('100.00')
+    campaign.Revenue = Decimal('250.00')
+    campaign.NetProfit = Decimal('150.00')
+    return campaign
+
+
+def new_company(name:str) -> Company:
+    company = Company()
+    company.CompanyName = name
+    return company
+
+
+class TransactionTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.services = AppServices(CONFIG)
+
+    def company_count(self) -> int:
+        return len(self.services.DB.select_all_companies())
+
+    def test_failed_call_raises_and_rolls_back_the_unit(self):
+        with self.assertRaises(TransactionRolledBack):
+            with self.services.transaction():
+                created = self.services.create_campaign(new_campaign("tx-dup"))
+                self.assertIsNotNone(created.idCampaign)
+                self.assertIsNone(self.services.create_campaign(new_campaign("tx-dup")))
+        self.assertFalse(self.services.campaign_name_exists("tx-dup"))
+
+    def test_set_rollback_only_rolls_back_quietly(self):
+        with self.services.transaction() as unit:
+            self.services.create_campaign(new_campaign("tx-quiet"))
+            unit.set_rollback_only()
+        self.assertFalse(unit.committed)
+        self.assertFalse(self.services.campaign_name_exists("tx-quiet"))
+
+    def test_successful_unit_commits(self):
+        with self.services.transaction() as unit:
+            self.services.create_campaign(new_campaign("tx-commit"))
+        self.assertTrue(unit.committed)
+        self.assertTrue(self.services.campaign_name_exists("tx-commit"))
+
+    def test_rolled_back_company_is_not_cached(self):
+        before = self.company_count()
+        with self.assertRaises(TransactionRolledBack):
+            with self.services.transaction():
+                self.services.create_company(new_company("tx-company"))
+                # Sees the unit's own uncommitted row
+                self.assertEqual(len(self.services.get_all_companies()), before + 1)
+                self.services.create_company(new_company("tx-company"))
+        self.assertEqual(len(self.services.get_all_companies()), before)
+        self.assertEqual(self.company_count(), before)
+
+    def test_committed_company_invalidates_cache(self):
+        before = len(self.services.get_all_companies())
+        with self.services.transaction():
+            self.services.create_company(new_company("tx-company-ok"))
+            # Still the committed rows for other readers of the cache
+            self.assertEqual(len(self.services._reference_cache.get_or_load(
+                'companies', lambda: None)), before)
+        names = [c.CompanyName for c in self.services.get_all_companies()]
+        self.assertIn("tx-company-ok", names)
+        self.assertEqual(len(names), before + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()